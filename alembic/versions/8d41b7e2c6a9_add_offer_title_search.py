@@ -0,0 +1,53 @@
+"""Add full-text search of offer titles
+
+Revision ID: 8d41b7e2c6a9
+Revises: 5f0c3a1d9b2e
+Create Date: 2026-10-17 19:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d41b7e2c6a9'
+down_revision: Union[str, None] = '5f0c3a1d9b2e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS offers_fts USING fts5(
+            title,
+            content='offers',
+            content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+    """)
+    op.execute("""
+        CREATE TRIGGER IF NOT EXISTS offers_fts_insert AFTER INSERT ON offers BEGIN
+            INSERT INTO offers_fts(rowid, title) VALUES (new.id, new.title);
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER IF NOT EXISTS offers_fts_delete AFTER DELETE ON offers BEGIN
+            INSERT INTO offers_fts(offers_fts, rowid, title) VALUES ('delete', old.id, old.title);
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER IF NOT EXISTS offers_fts_update AFTER UPDATE OF title ON offers BEGIN
+            INSERT INTO offers_fts(offers_fts, rowid, title) VALUES ('delete', old.id, old.title);
+            INSERT INTO offers_fts(rowid, title) VALUES (new.id, new.title);
+        END
+    """)
+    op.execute("INSERT INTO offers_fts(offers_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS offers_fts_update")
+    op.execute("DROP TRIGGER IF EXISTS offers_fts_delete")
+    op.execute("DROP TRIGGER IF EXISTS offers_fts_insert")
+    op.execute("DROP TABLE IF EXISTS offers_fts")
@@ -0,0 +1,29 @@
+"""Add data version update trigger
+
+Revision ID: b4d8f2a6c1e7
+Revises: a7b2d9e4f3c1
+Create Date: 2026-10-17 21:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d8f2a6c1e7'
+down_revision: Union[str, None] = 'a7b2d9e4f3c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TRIGGER IF NOT EXISTS data_version_offers_update AFTER UPDATE ON offers BEGIN
+            UPDATE data_version SET version = version + 1 WHERE id = 1;
+        END
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS data_version_offers_update")
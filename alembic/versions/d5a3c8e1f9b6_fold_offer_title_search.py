@@ -0,0 +1,87 @@
+"""Fold letters without a decomposition in the offer title search
+
+Revision ID: d5a3c8e1f9b6
+Revises: b4d8f2a6c1e7
+Create Date: 2026-10-17 23:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a3c8e1f9b6'
+down_revision: Union[str, None] = 'b4d8f2a6c1e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS offers_fts_update")
+    op.execute("DROP TRIGGER IF EXISTS offers_fts_delete")
+    op.execute("DROP TRIGGER IF EXISTS offers_fts_insert")
+    op.execute("DROP TABLE IF EXISTS offers_fts")
+    op.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS offer_titles_fts USING fts5(
+            title,
+            content='',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+    """)
+    op.execute("""
+        CREATE TRIGGER IF NOT EXISTS offer_titles_fts_insert AFTER INSERT ON offers BEGIN
+            INSERT INTO offer_titles_fts(rowid, title)
+            VALUES (new.id, replace(replace(new.title, 'ł', 'l'), 'Ł', 'L'));
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER IF NOT EXISTS offer_titles_fts_delete AFTER DELETE ON offers BEGIN
+            INSERT INTO offer_titles_fts(offer_titles_fts, rowid, title)
+            VALUES ('delete', old.id, replace(replace(old.title, 'ł', 'l'), 'Ł', 'L'));
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER IF NOT EXISTS offer_titles_fts_update AFTER UPDATE OF title ON offers BEGIN
+            INSERT INTO offer_titles_fts(offer_titles_fts, rowid, title)
+            VALUES ('delete', old.id, replace(replace(old.title, 'ł', 'l'), 'Ł', 'L'));
+            INSERT INTO offer_titles_fts(rowid, title)
+            VALUES (new.id, replace(replace(new.title, 'ł', 'l'), 'Ł', 'L'));
+        END
+    """)
+    op.execute("""
+        INSERT INTO offer_titles_fts(rowid, title)
+        SELECT id, replace(replace(title, 'ł', 'l'), 'Ł', 'L') FROM offers
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS offer_titles_fts_update")
+    op.execute("DROP TRIGGER IF EXISTS offer_titles_fts_delete")
+    op.execute("DROP TRIGGER IF EXISTS offer_titles_fts_insert")
+    op.execute("DROP TABLE IF EXISTS offer_titles_fts")
+    op.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS offers_fts USING fts5(
+            title,
+            content='offers',
+            content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+    """)
+    op.execute("""
+        CREATE TRIGGER IF NOT EXISTS offers_fts_insert AFTER INSERT ON offers BEGIN
+            INSERT INTO offers_fts(rowid, title) VALUES (new.id, new.title);
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER IF NOT EXISTS offers_fts_delete AFTER DELETE ON offers BEGIN
+            INSERT INTO offers_fts(offers_fts, rowid, title) VALUES ('delete', old.id, old.title);
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER IF NOT EXISTS offers_fts_update AFTER UPDATE OF title ON offers BEGIN
+            INSERT INTO offers_fts(offers_fts, rowid, title) VALUES ('delete', old.id, old.title);
+            INSERT INTO offers_fts(rowid, title) VALUES (new.id, new.title);
+        END
+    """)
+    op.execute("INSERT INTO offers_fts(offers_fts) VALUES ('rebuild')")
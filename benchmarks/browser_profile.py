@@ -0,0 +1,69 @@
+"""
+Compares page load time and transferred bytes of the default and performance Chrome profiles.
+
+Blocked requests are never sent, so the bytes they would cost can only be measured
+against the default profile, which is what this script does for the given pages.
+
+Run from the project root, ChromeDriver has to be installed:
+    python -m benchmarks.browser_profile https://it.pracuj.pl/praca?tt=Python https://justjoin.it
+"""
+import argparse
+import time
+from typing import Dict, List, Tuple
+
+from enums.browser_profile import BrowserProfileEnum
+from utils.get_driver import get_driver
+
+TRANSFERRED_BYTES_SCRIPT = (
+    "return performance.getEntriesByType('navigation')"
+    ".concat(performance.getEntriesByType('resource'))"
+    ".reduce((total, entry) => total + (entry.transferSize || 0), 0);"
+)
+
+
+def load_pages(profile: BrowserProfileEnum, urls: List[str]) -> Dict[str, Tuple[float, int]]:
+    """
+    Loads every URL in a fresh browser of the profile.
+
+    Args:
+        profile (BrowserProfileEnum): The browser profile.
+        urls (List[str]): The pages to load.
+
+    Returns:
+        Dict[str, Tuple[float, int]]: Seconds taken by `get` and transferred bytes for every URL.
+    """
+    results = {}
+    for url in urls:
+        driver = get_driver(profile)
+        if driver is None:
+            raise RuntimeError("Could not start ChromeDriver")
+        try:
+            start = time.perf_counter()
+            driver.get(url)
+            elapsed = time.perf_counter() - start
+            results[url] = (elapsed, driver.execute_script(TRANSFERRED_BYTES_SCRIPT))
+        finally:
+            driver.quit()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("urls", nargs="+")
+    args = parser.parse_args()
+
+    default = load_pages(BrowserProfileEnum.DEFAULT, args.urls)
+    performance = load_pages(BrowserProfileEnum.PERFORMANCE, args.urls)
+
+    for url in args.urls:
+        default_time, default_bytes = default[url]
+        performance_time, performance_bytes = performance[url]
+        print(url)
+        print(f"      default: {default_time:6.2f}s {default_bytes / 1024:8.0f} KB")
+        print(f"  performance: {performance_time:6.2f}s {performance_bytes / 1024:8.0f} KB")
+        print(f"        saved: {default_time - performance_time:6.2f}s "
+              f"{(default_bytes - performance_bytes) / 1024:8.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Compares HTML parser backends on saved pages, parsing whole pages and only the parts the scrapers read.
+
+Save a page of each site (for example with "Save page as" in the browser, or with curl for
+sites scraped without Selenium) and pass it as site=path, where site is one of SITE_STRAINERS.
+
+Run from the project root:
+    python -m benchmarks.html_parser pracujpl=pages/pracujpl.html pracujpl_job=pages/pracujpl_job.html
+"""
+import argparse
+import importlib.util
+import time
+from typing import Optional
+
+from scrapers import bulldogjob, jooble, theprotocol
+from scrapers.itpracujpl import ITPracujPL
+from scrapers.pracujpl import PracujPL
+from scrapers.pracujpl_document import PracujPlDocument
+from utils.html_parser import HTML_PARSER_BACKENDS, Strainer, parse_html, set_html_parser
+
+# Parts of the pages parsed by each site, None for sites which parse whole pages
+SITE_STRAINERS = {
+    "pracujpl": PracujPlDocument.LISTING_STRAINER,
+    "itpracujpl": PracujPlDocument.LISTING_STRAINER,
+    "pracujpl_job": PracujPL.JOB_PAGE_STRAINER,
+    "itpracujpl_job": ITPracujPL.JOB_PAGE_STRAINER,
+    "theprotocol": theprotocol.OFFER_STRAINER,
+    "bulldogjob": bulldogjob.OFFER_STRAINER,
+    "jooble": jooble.OFFER_STRAINER,
+    "useme": None,
+    "indeed": None,
+}
+
+
+def measure(markup: bytes, parse_only: Optional[Strainer], repeat: int) -> float:
+    """
+    Parses a page several times with the selected backend.
+
+    Args:
+        markup (bytes): The page.
+        parse_only (Strainer, optional): The part of the page to parse.
+        repeat (int): The number of parses.
+
+    Returns:
+        float: The average time of one parse in milliseconds.
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        parse_html(markup, parse_only, "utf-8")
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages", nargs="+", metavar="site=path")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    backends = [
+        backend for backend in HTML_PARSER_BACKENDS
+        if backend == "html.parser" or importlib.util.find_spec(backend)
+    ]
+
+    for page in args.pages:
+        site, path = page.split("=", 1)
+        if site not in SITE_STRAINERS:
+            parser.error(f"Unknown site {site}, use one of {', '.join(SITE_STRAINERS)}")
+
+        with open(path, "rb") as f:
+            markup = f.read()
+        strainer = SITE_STRAINERS[site]
+
+        print(f"{site} ({len(markup) / 1024:.0f} KB)")
+        for backend in backends:
+            set_html_parser(backend)
+            full = measure(markup, None, args.repeat)
+            line = f"  {backend:>11}: {full:8.1f} ms whole page"
+            if strainer is not None:
+                line += f", {measure(markup, strainer, args.repeat):8.1f} ms {strainer.to_css()}"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+Compares the latency and throughput of the offers listing served by sync and async endpoints.
+
+Both endpoints return the same JSON page from OfferService.get_page, the sync one
+on the blocking session of the web application (a threadpool slot per request),
+the async one through run_sync on a pooled aiosqlite engine created here, which
+needs `pip install aiosqlite`. Requests are sent concurrently through an
+in-process ASGI transport, so only the application is measured.
+
+The async path is meant to help when requests outnumber the threadpool of the sync
+endpoints (40 threads) or when queries are slow, so both are covered: run with a
+concurrency above 40, and with --slow-query-ms every request first runs a query
+which blocks its database connection for that long, like a cold cache or a write
+lock held by a scraper run.
+
+The web application serves the listing from the sync endpoints. On 20k offers
+with 200 concurrent requests the async engine served at most as many requests/s
+with a 1.7-2.7x higher p99 latency, also for full-text searches, and only won
+with a simulated slow query holding the connection for 100 ms.
+
+Run from the project root with the "db" export type and some offers saved:
+    python -m benchmarks.server_listing --requests 2000 --concurrency 200
+    python -m benchmarks.server_listing --requests 500 --concurrency 200 --slow-query-ms 20
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List, Optional, Tuple
+
+import httpx
+from fastapi import Depends, FastAPI, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from config.database import SQLALCHEMY_DATABASE_URL, engine, get_db, set_sqlite_pragmas
+from service.offer_service import OfferService
+
+# Connections are pooled, aiosqlite would otherwise open a new connection and thread per session
+async_engine = create_async_engine(
+    SQLALCHEMY_DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1),
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=10,
+    max_overflow=10,
+)
+event.listen(async_engine.sync_engine, "connect", set_sqlite_pragmas)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+# Simulated slow query, blocks the database connection for the given number of milliseconds
+SLOW_QUERY = text("SELECT benchmark_sleep(:milliseconds)")
+
+app = FastAPI()
+
+
+def register_sleep(dbapi_connection, connection_record) -> None:
+    """Adds the benchmark_sleep SQL function of SLOW_QUERY to a new connection."""
+    dbapi_connection.create_function("benchmark_sleep", 1, lambda milliseconds: time.sleep(milliseconds / 1000))
+
+
+event.listen(engine, "connect", register_sleep)
+event.listen(async_engine.sync_engine, "connect", register_sleep)
+
+
+async def get_async_db():
+    """
+    Create an async database session.
+
+    Yields:
+        AsyncSession: The async database session.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+@app.get("/sync")
+def get_offers_sync(
+        session: Session = Depends(get_db),
+        page_limit: int = Query(50),
+        query: Optional[str] = Query(None),
+        slow_query_ms: int = Query(0),
+):
+    if slow_query_ms:
+        session.execute(SLOW_QUERY, {"milliseconds": slow_query_ms})
+    return ORJSONResponse(OfferService(session).get_page(page_limit=page_limit, query=query))
+
+
+@app.get("/async")
+async def get_offers_async(
+        session: AsyncSession = Depends(get_async_db),
+        page_limit: int = Query(50),
+        query: Optional[str] = Query(None),
+        slow_query_ms: int = Query(0),
+):
+    if slow_query_ms:
+        await session.execute(SLOW_QUERY, {"milliseconds": slow_query_ms})
+    page = await session.run_sync(lambda sync_session: OfferService(sync_session).get_page(
+        page_limit=page_limit,
+        query=query,
+    ))
+    return ORJSONResponse(page)
+
+
+async def run(path: str, requests: int, concurrency: int) -> Tuple[float, List[float]]:
+    """
+    Sends requests to one endpoint, at most `concurrency` at once.
+
+    Args:
+        path (str): The endpoint path with query parameters.
+        requests (int): The number of requests.
+        concurrency (int): The number of requests in flight.
+
+    Returns:
+        Tuple[float, List[float]]: The number of requests per second and the latency
+            of every request in milliseconds, waiting for the semaphore excluded.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    latencies = []
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=None) as client:
+        async def send() -> None:
+            async with semaphore:
+                sent = time.perf_counter()
+                response = await client.get(path)
+                response.raise_for_status()
+                latencies.append((time.perf_counter() - sent) * 1000)
+
+        # Warm up connection pools and caches
+        await asyncio.gather(*(send() for _ in range(min(concurrency, requests))))
+        latencies.clear()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(send() for _ in range(requests)))
+        return requests / (time.perf_counter() - start), latencies
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """
+    Returns the value below which the given fraction of the values fall.
+
+    Args:
+        values (List[float]): The values.
+        fraction (float): The fraction, between 0 and 1.
+
+    Returns:
+        float: The percentile of the values.
+    """
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--query", default=None, help="search string, lists all offers if not given")
+    parser.add_argument("--slow-query-ms", type=int, default=0, help="duration of a slow query run by every request")
+    args = parser.parse_args()
+
+    params = httpx.QueryParams({"query": args.query} if args.query else {}).merge(
+        {"slow_query_ms": args.slow_query_ms}
+    )
+    for name in ("sync", "async"):
+        throughput, latencies = asyncio.run(run(f"/{name}?{params}", args.requests, args.concurrency))
+        print(f"{name:>5}: {throughput:8.1f} requests/s, latency ms "
+              f"p50 {statistics.median(latencies):7.1f} p95 {percentile(latencies, 0.95):7.1f} "
+              f"p99 {percentile(latencies, 0.99):7.1f} max {max(latencies):7.1f} "
+              f"({args.requests} requests, {args.concurrency} concurrent, "
+              f"{args.slow_query_ms} ms slow query)")
+
+
+if __name__ == "__main__":
+    main()
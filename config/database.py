@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -6,10 +6,41 @@ from .settings import settings
 
 SQLALCHEMY_DATABASE_URL = settings.SQLITE_CONNECTION_STRING
 
+# Set on every new connection. WAL lets the web application read while a scraper run writes,
+# busy_timeout makes a second writer wait for the lock instead of failing right away.
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,
+    "cache_size": -64000,  # 64 MB
+    "mmap_size": 268435456,  # 256 MB
+    "temp_store": "MEMORY",
+    # Enforces foreign keys on every connection, offer_tags rows are deleted with their offer
+    # or tag through ON DELETE CASCADE, which SQLite ignores unless this is on
+    "foreign_keys": "ON",
+}
+
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
 )
+
+
+@event.listens_for(engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Applies SQLITE_PRAGMAS to a new database connection.
+
+    Args:
+        dbapi_connection: The sqlite3 connection.
+        connection_record: The pool record of the connection.
+    """
+    cursor = dbapi_connection.cursor()
+    for name, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
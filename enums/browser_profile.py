@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class BrowserProfileEnum(Enum):
+    """
+    Enumeration for Chrome profiles used by Selenium strategies.
+    """
+    DEFAULT = 'default'
+    # Eager page load, no images, fonts, media, ads or analytics
+    PERFORMANCE = 'performance'
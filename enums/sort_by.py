@@ -7,3 +7,4 @@ class OfferSortEnum(Enum):
     """
     NEWEST = 'newest'
     OLDEST = 'oldest'
+    RELEVANCE = 'relevance'
@@ -0,0 +1,45 @@
+from typing import List, Optional
+
+from config.database import SessionLocal
+from schemas.offer import Offer, OfferBulkCreateOutput
+from service.offer_service import OfferService
+
+
+class DatabaseSink:
+    """
+    Sink saving offers to the SQLite database, using one session for the whole run.
+
+    Offers of every scraped page are saved with one insert in one transaction.
+    """
+
+    def __init__(self) -> None:
+        self.session = SessionLocal()
+        self.offer_service = OfferService(self.session)
+        self.result = OfferBulkCreateOutput()
+
+    def add_offers(self, offers: List[Offer], website: str, tag: Optional[str]) -> None:
+        """
+        Saves offers to the database, skipping offers which already exist.
+
+        Args:
+            offers (List[Offer]): The offers to save.
+            website (str): The website associated with the offers.
+            tag (str): The tag associated with the offers.
+        """
+        result = self.offer_service.bulk_create(data=offers, website=website, tag=tag)
+        self.result.inserted += result.inserted
+        self.result.skipped += result.skipped
+
+    def flush(self) -> bool:
+        """
+        Offers are committed as soon as they are added, so nothing is buffered.
+
+        Returns:
+            bool: Always True.
+        """
+        return True
+
+    def close(self) -> None:
+        """Closes the database session."""
+        print(f"Database: {self.result.inserted} offers created, {self.result.skipped} offers skipped")
+        self.session.close()
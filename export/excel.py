@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, List, Dict, Set
 
 from openpyxl import Workbook, load_workbook
 from openpyxl.utils import get_column_letter
@@ -7,17 +7,24 @@ from utils.get_current_date import get_current_date
 from schemas.offer import Offer
 import os
 
+EXCEL_FILE_NAME = "job_offers.xlsx"
+
 
 class ExcelWriter:
     """
     Class for writing data to an Excel file.
+
+    The workbook is loaded once, existing URLs are kept in a set for dedup and
+    column widths are tracked as rows are added, so the file is scanned and
+    written only once however many offers are added.
     """
 
-    def __init__(self, file_name: str = "job_offers.xlsx") -> None:
+    def __init__(self, file_name: str = EXCEL_FILE_NAME, url_column: str = "B") -> None:
         """Initialize ExcelWriter with the filename of the Excel file.
 
         Args:
             file_name (str): The filename of the Excel file.
+            url_column (str): The column letter where URLs are stored.
         """
         self.file_name = file_name
         if os.path.exists(file_name):
@@ -26,25 +33,44 @@ class ExcelWriter:
             self.workbook = Workbook()
         self.sheet = self.workbook.active
 
-    def data_exists(self, url: str, url_column: str = "B") -> bool:
+        self.urls: Set[str] = set()
+        self.column_widths: Dict[int, int] = {}
+        # Rows from this one on were added since the last save
+        self.first_new_row = self.sheet.max_row + 1
+        self.index_rows(self.column_index(url_column) - 1)
+
+    def index_rows(self, url_index: int) -> None:
+        """Reads existing rows once, collecting URLs and column widths.
+
+        Args:
+            url_index (int): The zero-based index of the URL column.
+        """
+        for row_number, row in enumerate(self.sheet.iter_rows(values_only=True), start=1):
+            if row_number > 1 and len(row) > url_index and row[url_index] is not None:
+                self.urls.add(row[url_index])
+            self.update_column_widths(row)
+
+    def update_column_widths(self, row) -> None:
+        """Widens columns to fit the values of a row.
+
+        Args:
+            row: The values of the row.
+        """
+        for idx, value in enumerate(row, start=1):
+            length = len(str(value))
+            if length > self.column_widths.get(idx, 0):
+                self.column_widths[idx] = length
+
+    def data_exists(self, url: str) -> bool:
         """Check if data exists in the Excel file.
 
         Args:
-            url_column (str): The column letter where URLs are stored.
             url (str): The URL to check for existence.
 
         Returns:
             bool: True if data exists, False otherwise.
         """
-        try:
-            for row in self.sheet.iter_rows(min_row=2, max_row=self.sheet.max_row, values_only=True):
-                if row[self.column_index(url_column) - 1] == url:
-                    return True
-            return False
-
-        except Exception as e:
-            print(e)
-            return False
+        return url in self.urls
 
     @staticmethod
     def column_index(column_letter: str) -> int:
@@ -58,8 +84,13 @@ class ExcelWriter:
         """
         return ord(column_letter.upper()) - 64
 
+    @property
+    def has_changes(self) -> bool:
+        """True if rows were added since the last save."""
+        return self.sheet.max_row >= self.first_new_row
+
     def add_data(self, data: Offer, website: str, tag: Optional[str]) -> None:
-        """Add data to the Excel file.
+        """Add data to the Excel file, it is written on save.
 
         Args:
             data (Offer): The offer data to add.
@@ -76,14 +107,115 @@ class ExcelWriter:
         ]
         for idx, value in enumerate(row_data, start=1):
             self.sheet.cell(row=next_row, column=idx, value=value)
+        self.urls.add(data.url)
+        self.update_column_widths(row_data)
 
     def save(self) -> None:
         """Save the Excel file."""
-        for column_cells in self.sheet.columns:
-            length = max(len(str(cell.value)) for cell in column_cells)
-            self.sheet.column_dimensions[get_column_letter(column_cells[0].column)].width = length + 2
-            for cell in column_cells:
-                cell.alignment = Alignment(wrap_text=True)
+        for idx, length in self.column_widths.items():
+            self.sheet.column_dimensions[get_column_letter(idx)].width = length + 2
+
+        # Rows saved before already have their alignment set
+        alignment = Alignment(wrap_text=True)
+        for row in self.sheet.iter_rows(min_row=self.first_new_row):
+            for cell in row:
+                cell.alignment = alignment
 
         self.workbook.save(filename=self.file_name)
+        self.first_new_row = self.sheet.max_row + 1
         print("Data saved to Excel file")
+
+
+class ExcelSink:
+    """
+    Sink saving offers to the Excel file.
+
+    Offers are buffered in one ExcelWriter per file and written on flush and close.
+    With `monthly` set, offers go to a workbook per month, e.g. job_offers_2024-03.xlsx,
+    so single files stay small.
+    """
+
+    def __init__(self, file_name: str = EXCEL_FILE_NAME, monthly: bool = False) -> None:
+        """
+        Initializes the ExcelSink, workbooks are loaded on first use.
+
+        Args:
+            file_name (str): The filename of the Excel file.
+            monthly (bool): Whether to roll over to a new workbook every month.
+        """
+        self.file_name = file_name
+        self.monthly = monthly
+        self.writers: Dict[str, ExcelWriter] = {}
+
+    def get_file_name(self) -> str:
+        """
+        Returns the filename offers are currently saved to.
+
+        Returns:
+            str: The filename, with the current month appended in monthly mode.
+        """
+        if not self.monthly:
+            return self.file_name
+        name, extension = os.path.splitext(self.file_name)
+        return f"{name}_{get_current_date():%Y-%m}{extension}"
+
+    def get_writer(self) -> ExcelWriter:
+        """
+        Returns the writer of the current file, loading the workbook on first use.
+
+        Returns:
+            ExcelWriter: The writer buffering rows of the file.
+        """
+        file_name = self.get_file_name()
+        if file_name not in self.writers:
+            self.writers[file_name] = ExcelWriter(file_name)
+        return self.writers[file_name]
+
+    def add_offers(self, offers: List[Offer], website: str, tag: Optional[str]) -> None:
+        """
+        Buffers offers for the Excel file, skipping offers which already exist.
+
+        Args:
+            offers (List[Offer]): The offers to save.
+            website (str): The website associated with the offers.
+            tag (str): The tag associated with the offers.
+        """
+        ew = self.get_writer()
+        for offer in offers:
+            if ew.data_exists(url=offer.url):
+                print("Offer exists in excel")
+                continue
+
+            ew.add_data(data=offer, website=website, tag=tag)
+
+    def flush(self) -> bool:
+        """
+        Saves every workbook with buffered offers.
+
+        A workbook which could not be saved, e.g. because it is open in Excel, keeps its
+        offers buffered for the next flush.
+
+        Returns:
+            bool: True if no offers are left buffered, False otherwise.
+        """
+        saved = True
+        for ew in self.writers.values():
+            if not ew.has_changes:
+                continue
+            try:
+                ew.save()
+            except Exception as e:
+                print(f"Failed to save {ew.file_name}, it will be retried: {e}")
+                saved = False
+        return saved
+
+    def close(self) -> None:
+        """
+        Saves every workbook with buffered offers.
+
+        Raises:
+            RuntimeError: If a workbook could not be saved.
+        """
+        if not self.flush():
+            raise RuntimeError("Offers were not saved to the Excel file")
+        self.writers.clear()
@@ -1,19 +1,29 @@
-from typing import Optional
+from typing import Optional, List, Set
 
 import gspread
 from utils.get_current_date import get_current_date
+from utils.token_bucket import TokenBucket
 from schemas.offer import Offer
 
+# Google Sheets API quota is 60 requests per minute per user
+SHEETS_REQUESTS_PER_MINUTE = 60
+# Buffered rows are written once this many are waiting, the rest on close
+SHEETS_BATCH_SIZE = 500
+
 
 class GoogleSheet:
     """
     Class for interacting with a Google Sheet.
+
+    The service account is authenticated and the worksheet is opened once, every
+    API request takes a token from the shared rate limiter.
     """
 
     def __init__(
             self,
             document_url: str,
-            credentials_file_name: str = "credentials.json"
+            credentials_file_name: str = "credentials.json",
+            rate_limiter: Optional[TokenBucket] = None,
     ) -> None:
         """Initialize GoogleSheet with document URL and credentials filename.
 
@@ -21,64 +31,170 @@ class GoogleSheet:
             document_url (str): The URL of the Google Sheet document.
             credentials_file_name (str, optional): The filename of the
                 credentials file. Defaults to "credentials.json".
+            rate_limiter (TokenBucket, optional): The limiter of API requests.
+                Defaults to one sized to the Sheets API quota.
         """
         self.document_url = document_url
+        self.rate_limiter = rate_limiter or TokenBucket(
+            rate=SHEETS_REQUESTS_PER_MINUTE / 60, capacity=SHEETS_REQUESTS_PER_MINUTE
+        )
         self.service_account = gspread.service_account(filename=credentials_file_name)
+        self._sheet: Optional[gspread.Worksheet] = None
 
     def get_sheet(self) -> gspread.Worksheet:
-        """Get the Google Sheet worksheet.
+        """Get the Google Sheet worksheet, opening it on first use.
 
         Returns:
             gspread.Worksheet: The Google Sheet worksheet.
         """
-        return self.service_account.open_by_url(self.document_url).sheet1
+        if self._sheet is None:
+            self.rate_limiter.acquire()
+            self._sheet = self.service_account.open_by_url(self.document_url).sheet1
+        return self._sheet
 
-    def data_exists(self, url_column: int, url: str) -> bool:
-        """Check if data exists in the Google Sheet.
+    def get_urls(self, url_column: int) -> Set[str]:
+        """Read all URLs from the Google Sheet in one request.
 
         Args:
             url_column (int): The index of the column where URLs are stored.
-            url (str): The URL to check for existence.
 
         Returns:
-            bool: True if data exists, False otherwise.
+            Set[str]: The URLs of saved offers.
         """
-        try:
-            cell = self.get_sheet().find(url, in_column=url_column)
-            if cell:
-                return True
-            return False
+        sheet = self.get_sheet()
+        self.rate_limiter.acquire()
+        return set(sheet.col_values(url_column))
 
-        except gspread.exceptions.APIError:
-            return False
-
-        except Exception as e:
-            print(e)
-            return False
-
-    def add_data(self, data: Offer, website: str, tag: Optional[str]) -> None:
-        """Add data to the Google Sheet.
+    @staticmethod
+    def get_row(data: Offer, website: str, tag: Optional[str]) -> List[Optional[str]]:
+        """Build the row of an offer.
 
         Args:
-            data (Offer): The offer data to add.
+            data (Offer): The offer data.
             website (str): The website associated with the offer.
             tag (str): The tag associated with the offer.
+
+        Returns:
+            List[Optional[str]]: The cell values of the row.
+        """
+        return [
+            data.title,
+            data.url,
+            website,
+            str(get_current_date()),
+            tag
+        ]
+
+    def add_rows(self, rows: List[List[Optional[str]]]) -> bool:
+        """Add rows to the Google Sheet in one request.
+
+        Rows are inserted below the header in reverse order, so the newest offer is on top.
+
+        Args:
+            rows (List[List[Optional[str]]]): The rows to add, oldest first.
+
+        Returns:
+            bool: True if the rows were saved, False otherwise.
         """
         try:
-            row_data = [
-                data.title,
-                data.url,
-                website,
-                str(get_current_date()),
-                tag
-            ]
-            self.get_sheet().insert_row(row_data, index=2)
-            print("Save data to Google Sheet")
+            sheet = self.get_sheet()
+            self.rate_limiter.acquire()
+            sheet.insert_rows(rows[::-1], row=2)
+            print(f"Save {len(rows)} rows to Google Sheet")
+            return True
 
         except gspread.exceptions.APIError as e:
             print(e)
-            return
+            return False
 
         except Exception as e:
             print(e)
-            return
+            return False
+
+
+class GoogleSheetSink:
+    """
+    Sink saving offers to the Google Sheet.
+
+    URLs already in the sheet are read once for dedup and new rows are written
+    on every flush, at the latest once SHEETS_BATCH_SIZE rows are buffered. Rows
+    which could not be written stay buffered and are retried with the next flush,
+    their URLs are marked as seen only once the flush succeeds.
+    """
+
+    def __init__(self, document_url: str, url_column: int = 2) -> None:
+        """
+        Initializes the GoogleSheetSink, the sheet is opened on first use.
+
+        Args:
+            document_url (str): The URL of the Google Sheet document.
+            url_column (int): The index of the column where URLs are stored.
+        """
+        self.document_url = document_url
+        self.url_column = url_column
+        self._sheet: Optional[GoogleSheet] = None
+        self.urls: Set[str] = set()
+        self.rows: List[List[Optional[str]]] = []
+
+    def get_sheet(self) -> GoogleSheet:
+        """
+        Returns the Google Sheet, reading its URLs on first use.
+
+        Returns:
+            GoogleSheet: The Google Sheet of the sink.
+        """
+        if self._sheet is None:
+            self._sheet = GoogleSheet(self.document_url)
+            try:
+                self.urls = self._sheet.get_urls(self.url_column)
+            except gspread.exceptions.APIError as e:
+                print(e)
+        return self._sheet
+
+    def add_offers(self, offers: List[Offer], website: str, tag: Optional[str]) -> None:
+        """
+        Buffers offers for the Google Sheet, skipping offers which already exist.
+
+        Args:
+            offers (List[Offer]): The offers to save.
+            website (str): The website associated with the offers.
+            tag (str): The tag associated with the offers.
+        """
+        gs = self.get_sheet()
+        for offer in offers:
+            if offer.url in self.urls:
+                print("Offer exists in google sheet")
+                continue
+
+            self.urls.add(offer.url)
+            self.rows.append(gs.get_row(data=offer, website=website, tag=tag))
+
+        if len(self.rows) >= SHEETS_BATCH_SIZE:
+            self.flush()
+
+    def flush(self) -> bool:
+        """
+        Writes buffered rows to the Google Sheet, keeping them buffered if the write fails.
+
+        Returns:
+            bool: True if no rows are left buffered, False otherwise.
+        """
+        if not self.rows:
+            return True
+
+        if not self.get_sheet().add_rows(self.rows):
+            print(f"Failed to save {len(self.rows)} rows to Google Sheet, they will be retried")
+            return False
+
+        self.rows = []
+        return True
+
+    def close(self) -> None:
+        """
+        Writes the remaining buffered rows.
+
+        Raises:
+            RuntimeError: If the rows could not be written.
+        """
+        if not self.flush():
+            raise RuntimeError(f"{len(self.rows)} offers were not saved to Google Sheet")
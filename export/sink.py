@@ -0,0 +1,73 @@
+from typing import Protocol, List, Optional
+
+from schemas.offer import Offer
+
+
+class OfferSink(Protocol):
+    """
+    A protocol defining the interface for destinations of scraped offers.
+
+    Offers are passed in as soon as a page is scraped, so a sink may write them
+    immediately or buffer them until flush() or close(). Offer URLs are marked as
+    seen only after a successful flush, so offers which were not written are
+    scraped again in the next run.
+    """
+    def add_offers(self, offers: List[Offer], website: str, tag: Optional[str]) -> None:
+        """
+        Saves offers scraped from one page, skipping offers which already exist.
+
+        Args:
+            offers (List[Offer]): The offers to save.
+            website (str): The website associated with the offers.
+            tag (str): The tag associated with the offers.
+        """
+        ...
+
+    def flush(self) -> bool:
+        """
+        Writes buffered offers, keeping them buffered if the write fails.
+
+        Returns:
+            bool: True if no offers are left buffered, False otherwise.
+        """
+        ...
+
+    def close(self) -> None:
+        """
+        Writes buffered offers and releases resources.
+
+        Raises:
+            RuntimeError: If buffered offers could not be written.
+        """
+        ...
+
+
+def get_sink(export_type: str, worksheet_url: str, excel_monthly_files: bool = False) -> OfferSink:
+    """
+    Creates the sink for the selected export type.
+
+    Args:
+        export_type (str): "excel", "googlesheet" or "db".
+        worksheet_url (str): The worksheet url, used by the "googlesheet" export type.
+        excel_monthly_files (bool): Whether the "excel" export type saves a file per month.
+
+    Returns:
+        OfferSink: The sink for the export type.
+
+    Raises:
+        ValueError: If the export type is not supported.
+    """
+    # Imported here, so only the dependencies of the selected export type are loaded
+    if export_type == "excel":
+        from export.excel import ExcelSink
+        return ExcelSink(monthly=excel_monthly_files)
+
+    if export_type == "googlesheet":
+        from export.googlesheet import GoogleSheetSink
+        return GoogleSheetSink(worksheet_url)
+
+    if export_type == "db":
+        from export.database import DatabaseSink
+        return DatabaseSink()
+
+    raise ValueError("Invalid export type")
@@ -0,0 +1,29 @@
+from typing import List, Dict
+
+import requests
+
+from utils.http_client import get_http_client
+
+WEBHOOK_URL = "https://hook.eu2.make.com/z7gdth8t1fes8piaq7r46mcsmattmj8f"
+
+
+def send_to_webhook(payload: List[Dict], url: str = WEBHOOK_URL) -> bool:
+    """
+    Sends scraped offers to the webhook.
+
+    Args:
+        payload (List[Dict]): The offers to send.
+        url (str): The webhook URL.
+
+    Returns:
+        bool: True if the webhook accepted the data, False otherwise.
+    """
+    print(f"JSON: {payload}")
+    try:
+        response = get_http_client().post(url, json=payload)
+        response.raise_for_status()
+        print("Data successfully sent to webhook")
+        return True
+    except requests.exceptions.RequestException as e:
+        print(f"Failed to send data to webhook: {e}")
+        return False
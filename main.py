@@ -1,7 +1,7 @@
 import os
 
 from config.database import engine
-from models.offer import Offer
+from models.schema import create_schema
 from tasks.run_all_scrapers import run_all_scraper
 from utils.get_config import get_config
 
@@ -18,10 +18,23 @@ websites = config["websites"]
 max_offer_duration_days = config["max_offer_duration_days"]
 keywords_to_pass = config["keywords_to_pass"]
 export_type = config["export_type"]
+# Get the concurrency limits from configuration
+max_workers = config.get("max_workers", 4)
+max_workers_per_domain = config.get("max_workers_per_domain", 1)
+# Get the incremental crawl limit from configuration
+max_known_pages = config.get("max_known_pages")
+excel_monthly_files = config.get("excel_monthly_files", False)
+# Get the number of headless browsers shared by Selenium scrapers from configuration
+driver_pool_size = config.get("driver_pool_size", 2)
+blocked_urls = config.get("blocked_urls", [])
+html_parser = config.get("html_parser")
+# Get the limits of the detail page fetching shared by the pracuj.pl scrapers from configuration
+detail_fetch_workers = config.get("detail_fetch_workers", 8)
+detail_fetch_workers_per_domain = config.get("detail_fetch_workers_per_domain", 4)
 
 if export_type == "db":
     # Create the Offer table if it doesn't exist
-    Offer.metadata.create_all(bind=engine)
+    create_schema(engine)
 
 
 def main() -> None:
@@ -37,7 +50,16 @@ def main() -> None:
         worksheet_url,
         export_type,
         max_offer_duration_days,
-        keywords_to_pass
+        keywords_to_pass,
+        max_workers,
+        max_workers_per_domain,
+        max_known_pages,
+        excel_monthly_files,
+        driver_pool_size,
+        blocked_urls,
+        html_parser,
+        detail_fetch_workers,
+        detail_fetch_workers_per_domain,
     )
 
 
@@ -0,0 +1,48 @@
+from sqlalchemy import Engine, Column, Integer
+
+from config.database import Base
+
+# Triggers bumping the version whenever offers are added, changed or removed, also by other processes
+DATA_VERSION_TRIGGERS_DDL = [
+    """
+    CREATE TRIGGER IF NOT EXISTS data_version_offers_insert AFTER INSERT ON offers BEGIN
+        UPDATE data_version SET version = version + 1 WHERE id = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS data_version_offers_delete AFTER DELETE ON offers BEGIN
+        UPDATE data_version SET version = version + 1 WHERE id = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS data_version_offers_update AFTER UPDATE ON offers BEGIN
+        UPDATE data_version SET version = version + 1 WHERE id = 1;
+    END
+    """,
+]
+
+
+class DataVersion(Base):
+    """
+    Single row table holding a counter of changes to the offers table.
+
+    Cached query results and rendered pages are keyed by the version, so they are
+    invalidated as soon as a scraper run saves new offers or an offer is checked.
+    """
+    __tablename__ = "data_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+
+def create_data_version(engine: Engine) -> None:
+    """
+    Creates the version row and the triggers updating it if they do not exist yet.
+
+    Args:
+        engine (Engine): The database engine.
+    """
+    with engine.begin() as connection:
+        connection.exec_driver_sql("INSERT OR IGNORE INTO data_version (id, version) VALUES (1, 0)")
+        for statement in DATA_VERSION_TRIGGERS_DDL:
+            connection.exec_driver_sql(statement)
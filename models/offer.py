@@ -1,10 +1,14 @@
-from sqlalchemy import Column, String, Integer, DateTime, func, Boolean
+from sqlalchemy import Column, String, Integer, DateTime, func, Boolean, Index
 
 from config.database import Base
 
 
 class Offer(Base):
     __tablename__ = "offers"
+    __table_args__ = (
+        # Offers are listed newest first, optionally filtered by tag
+        Index("ix_offers_tag_created_at", "tag", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     title = Column(String, nullable=False)
@@ -12,4 +16,4 @@ class Offer(Base):
     page = Column(String, nullable=False)
     check = Column(Boolean, default=False)
     tag = Column(String, nullable=True)
-    created_at = Column(DateTime, default=func.now())
+    created_at = Column(DateTime, default=func.now(), index=True)
@@ -0,0 +1,118 @@
+import re
+from typing import Optional, Tuple
+
+from sqlalchemy import Engine, column, table
+
+# Letters which the unicode61 tokenizer does not fold with remove_diacritics, they have no
+# decomposition into a base letter and a diacritic. They are replaced both in the indexed
+# titles and in search strings, so "glowny" finds "Główny".
+FOLDED_LETTERS = {"ł": "l", "Ł": "L"}
+FOLD_TABLE = str.maketrans(FOLDED_LETTERS)
+
+
+def fold_sql(expression: str) -> str:
+    """
+    Wraps an SQL expression in the replacements of FOLDED_LETTERS.
+
+    Args:
+        expression (str): The SQL expression of a text.
+
+    Returns:
+        str: The SQL expression of the folded text.
+    """
+    for letter, folded in FOLDED_LETTERS.items():
+        expression = f"replace({expression}, '{letter}', '{folded}')"
+    return expression
+
+
+# Full-text index of offer titles. It is a contentless table, it keeps only the index of
+# the folded titles, which triggers fill from offers. The unicode61 tokenizer folds case
+# and diacritics, so "wdrozeniowiec" finds "Wdrożeniowiec".
+OFFERS_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS offer_titles_fts USING fts5(
+        title,
+        content='',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS offer_titles_fts_insert AFTER INSERT ON offers BEGIN
+        INSERT INTO offer_titles_fts(rowid, title) VALUES (new.id, {fold_sql('new.title')});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS offer_titles_fts_delete AFTER DELETE ON offers BEGIN
+        INSERT INTO offer_titles_fts(offer_titles_fts, rowid, title)
+        VALUES ('delete', old.id, {fold_sql('old.title')});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS offer_titles_fts_update AFTER UPDATE OF title ON offers BEGIN
+        INSERT INTO offer_titles_fts(offer_titles_fts, rowid, title)
+        VALUES ('delete', old.id, {fold_sql('old.title')});
+        INSERT INTO offer_titles_fts(rowid, title) VALUES (new.id, {fold_sql('new.title')});
+    END
+    """,
+]
+
+# Fills a newly created index with the offers already in the database
+OFFERS_FTS_FILL = f"INSERT INTO offer_titles_fts(rowid, title) SELECT id, {fold_sql('title')} FROM offers"
+
+# The previous index of the unfolded titles, dropped when the new one is created
+LEGACY_OFFERS_FTS_DROP = [
+    "DROP TRIGGER IF EXISTS offers_fts_update",
+    "DROP TRIGGER IF EXISTS offers_fts_delete",
+    "DROP TRIGGER IF EXISTS offers_fts_insert",
+    "DROP TABLE IF EXISTS offers_fts",
+]
+
+# Lightweight table construct, the virtual table is not a part of the ORM metadata
+offer_titles_fts = table("offer_titles_fts", column("rowid"), column("rank"))
+
+
+def create_offer_search(engine: Engine) -> None:
+    """
+    Creates the full-text index of offer titles if it does not exist yet.
+
+    A newly created index is filled with the offers already in the database.
+
+    Args:
+        engine (Engine): The database engine.
+    """
+    with engine.begin() as connection:
+        exists = connection.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'offer_titles_fts'"
+        ).first()
+        if exists:
+            return
+
+        for statement in LEGACY_OFFERS_FTS_DROP + OFFERS_FTS_DDL:
+            connection.exec_driver_sql(statement)
+        connection.exec_driver_sql(OFFERS_FTS_FILL)
+
+
+def get_search_terms(query: str) -> Tuple[Optional[str], Tuple[str, ...]]:
+    """
+    Converts a search string into an FTS5 MATCH expression and the terms matched exactly.
+
+    Every word is folded, quoted, so user input is never parsed as FTS5 syntax, and matched
+    as a prefix, so "program" finds both "Programista" and "Programistka". The tokenizer
+    splits words on "#", "+" and ".", so the terms holding them, like "C#", "C++" or ".NET",
+    are also returned to be matched exactly in the title, as "C#" would otherwise find every
+    title with a word starting with "c".
+
+    Args:
+        query (str): The search string.
+
+    Returns:
+        Tuple[Optional[str], Tuple[str, ...]]: The MATCH expression, None if the string contains
+            no words, and the terms matched exactly.
+    """
+    words = re.findall(r"\w+", query.translate(FOLD_TABLE))
+    if not words:
+        return None, ()
+
+    terms = (term.rstrip(".") for term in re.findall(r"[\w#+.]+", query))
+    exact_terms = tuple(dict.fromkeys(term for term in terms if re.search(r"[#+.]", term)))
+    return " ".join(f'"{word}"*' for word in words), exact_terms
@@ -0,0 +1,23 @@
+from sqlalchemy import Engine
+
+from config.database import Base
+from models.offer import Offer  # noqa: F401
+from models.data_version import DataVersion, create_data_version  # noqa: F401
+from models.offer_search import create_offer_search
+from models.tag import Tag, OfferTag, create_tags  # noqa: F401
+
+
+def create_schema(engine: Engine) -> None:
+    """
+    Creates missing tables together with the triggers and full-text index which
+    are not a part of the ORM metadata.
+
+    Databases managed with Alembic get the same objects from the migrations.
+
+    Args:
+        engine (Engine): The database engine.
+    """
+    Base.metadata.create_all(bind=engine)
+    create_data_version(engine)
+    create_offer_search(engine)
+    create_tags(engine)
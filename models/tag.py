@@ -0,0 +1,78 @@
+from typing import List, Optional
+
+from sqlalchemy import Column, String, Integer, ForeignKey, Engine
+
+from config.database import Base
+
+# Triggers keeping tags.offer_count equal to the number of offers with the tag
+TAG_COUNT_TRIGGERS_DDL = [
+    """
+    CREATE TRIGGER IF NOT EXISTS tags_count_insert AFTER INSERT ON offer_tags BEGIN
+        UPDATE tags SET offer_count = offer_count + 1 WHERE id = new.tag_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tags_count_delete AFTER DELETE ON offer_tags BEGIN
+        UPDATE tags SET offer_count = offer_count - 1 WHERE id = old.tag_id;
+    END
+    """,
+]
+
+
+class Tag(Base):
+    __tablename__ = "tags"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String, nullable=False, unique=True)
+    offer_count = Column(Integer, nullable=False, default=0)
+
+
+class OfferTag(Base):
+    __tablename__ = "offer_tags"
+
+    # The primary key starts with tag_id, so filtering by a tag is an index range scan
+    tag_id = Column(Integer, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True)
+    offer_id = Column(Integer, ForeignKey("offers.id", ondelete="CASCADE"), primary_key=True, index=True)
+
+
+def split_tags(tag: Optional[str]) -> List[str]:
+    """
+    Splits a tag string from config.json, like "Python, Junior", into single tags.
+
+    Args:
+        tag (str, optional): The tag string of a website.
+
+    Returns:
+        List[str]: The unique, non-empty tags in their original order.
+    """
+    if not tag:
+        return []
+    return list(dict.fromkeys(name.strip() for name in tag.split(",") if name.strip()))
+
+
+def create_tags(engine: Engine) -> None:
+    """
+    Creates the triggers maintaining tag counts and fills the tag tables from offers
+    saved before they existed.
+
+    Args:
+        engine (Engine): The database engine.
+    """
+    with engine.begin() as connection:
+        for statement in TAG_COUNT_TRIGGERS_DDL:
+            connection.exec_driver_sql(statement)
+
+        if connection.exec_driver_sql("SELECT 1 FROM offer_tags LIMIT 1").first():
+            return
+
+        tag_strings = connection.exec_driver_sql(
+            "SELECT DISTINCT tag FROM offers WHERE tag IS NOT NULL"
+        ).scalars().all()
+        for tag_string in tag_strings:
+            for name in split_tags(tag_string):
+                connection.exec_driver_sql("INSERT OR IGNORE INTO tags (name, offer_count) VALUES (?, 0)", (name,))
+                connection.exec_driver_sql(
+                    "INSERT OR IGNORE INTO offer_tags (tag_id, offer_id) "
+                    "SELECT tags.id, offers.id FROM tags, offers WHERE tags.name = ? AND offers.tag = ?",
+                    (name, tag_string),
+                )
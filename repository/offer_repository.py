@@ -1,9 +1,32 @@
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from sqlalchemy.orm import Session
 from models.offer import Offer as OfferModel
-from schemas.offer import Offer, OfferOutput, OfferListOutput
-from sqlalchemy import asc, desc, func
+from models.offer_search import offer_titles_fts, get_search_terms
+from models.data_version import DataVersion
+from models.tag import Tag, OfferTag, split_tags
+from enums.sort_by import OfferSortEnum
+from schemas.offer import Offer, OfferListOutput
+from sqlalchemy import and_, asc, desc, func, literal_column, or_, select, update
+from sqlalchemy.dialects.sqlite import insert
 from schemas.tag import TagOutput
+from utils.lru_cache import LRUCache
+
+# Rows per INSERT statement, keeps the number of bound parameters below the SQLite limit
+BULK_INSERT_CHUNK_SIZE = 500
+
+# Filtered offer counts keyed by (data version, search expression, exact terms, tag), shared by all sessions
+count_cache = LRUCache(maxsize=256)
+
+# Columns of an offer returned by the listing and export queries, selected as plain rows
+OFFER_COLUMNS = (
+    OfferModel.id,
+    OfferModel.title,
+    OfferModel.url,
+    OfferModel.page,
+    OfferModel.check,
+    OfferModel.created_at,
+    OfferModel.tag,
+)
 
 
 class OfferRepository:
@@ -17,37 +40,65 @@ class OfferRepository:
         """
         self.session = session
 
-    def create(self, data: Offer, website: str, tag: Optional[str]) -> None:
+    def bulk_create(self, data: List[Offer], website: str, tag: Optional[str]) -> int:
         """
-        Creates a new offer in the database.
+        Creates offers in one transaction, skipping offers whose URL already exists.
+
+        Created offers are linked to every tag of the tag string, e.g. "Python, Junior".
 
         Args:
-            data (Offer): The offer data to be saved.
-            website (str): The website where the offer was found.
-        """
-        db_offer = OfferModel(
-            title=data.title,
-            url=data.url,
-            page=website,
-            check=False,
-            tag=tag
-        )
-        self.session.add(db_offer)
-        self.session.commit()
-        self.session.refresh(db_offer)
-        return
+            data (List[Offer]): The offers to be saved.
+            website (str): The website where the offers were found.
+            tag (str): The tag associated with the offers.
+
+        Returns:
+            int: The number of created offers.
+        """
+        rows = [
+            {"title": offer.title, "url": offer.url, "page": website, "check": False, "tag": tag}
+            for offer in data
+        ]
+        offer_ids = []
+        try:
+            for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+                statement = (
+                    insert(OfferModel)
+                    .values(rows[start:start + BULK_INSERT_CHUNK_SIZE])
+                    .on_conflict_do_nothing(index_elements=[OfferModel.url])
+                    .returning(OfferModel.id)
+                )
+                offer_ids.extend(self.session.execute(statement).scalars())
 
-    def offer_exists_by_url(self, url: str) -> bool:
+            tag_ids = self.get_tag_ids(split_tags(tag))
+            if offer_ids and tag_ids:
+                self.session.execute(
+                    insert(OfferTag).on_conflict_do_nothing(),
+                    [{"tag_id": tag_id, "offer_id": offer_id} for tag_id in tag_ids for offer_id in offer_ids],
+                )
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return len(offer_ids)
+
+    def get_tag_ids(self, names: List[str]) -> List[int]:
         """
-        Checks if an offer with the given URL already exists in the database.
+        Retrieves ids of tags, creating tags which do not exist yet.
 
         Args:
-            url (str): The URL of the offer to check.
+            names (List[str]): The tag names.
 
         Returns:
-            bool: True if the offer exists, False otherwise.
+            List[int]: The ids of the tags.
         """
-        return self.session.query(OfferModel).filter(OfferModel.url == url).first() is not None
+        if not names:
+            return []
+
+        self.session.execute(
+            insert(Tag).on_conflict_do_nothing(index_elements=[Tag.name]),
+            [{"name": name, "offer_count": 0} for name in names],
+        )
+        return [tag_id for tag_id, in self.session.query(Tag.id).filter(Tag.name.in_(names))]
 
     def offer_exists_by_id(self, _id: int) -> bool:
         """
@@ -78,57 +129,271 @@ class OfferRepository:
         self.session.refresh(db_offer)
         return True
 
+    def change_check_status_bulk(self, ids: List[int], status: bool) -> int:
+        """
+        Updates the "checked" status of many offers with one UPDATE in one transaction.
+
+        Args:
+            ids (List[int]): The IDs of the offers to update.
+            status (bool): The new checked status (True or False).
+
+        Returns:
+            int: The number of updated offers.
+        """
+        try:
+            updated = self.session.execute(
+                update(OfferModel).where(OfferModel.id.in_(set(ids))).values(check=status)
+            ).rowcount
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return updated
+
     def get_unique_tags(self) -> List[TagOutput]:
-        unique_tags = self.session.query(OfferModel.tag).distinct().all()
-        return [TagOutput(name=tag[0]) for tag in unique_tags]
+        """
+        Retrieves tags having at least one offer, with their maintained offer counts.
+
+        Returns:
+            List[TagOutput]: The tags ordered by name.
+        """
+        tags = self.session.query(Tag.name, Tag.offer_count).filter(Tag.offer_count > 0).order_by(Tag.name)
+        return [TagOutput(name=name, offer_count=offer_count) for name, offer_count in tags]
+
+    def get_data_version(self) -> int:
+        """
+        Retrieves the version of the offers table, changed by every insert, update and delete.
+
+        Returns:
+            int: The current data version.
+        """
+        return self.session.query(DataVersion.version).filter(DataVersion.id == 1).scalar() or 0
+
+    @staticmethod
+    def get_filters(match_query: Optional[str], exact_terms: Tuple[str, ...], tag: Optional[str]) -> list:
+        """
+        Builds filter expressions of offers matching a full-text search and a tag.
+
+        Args:
+            match_query (str, optional): The full-text search expression.
+            exact_terms (Tuple[str, ...]): Terms the title has to contain, ignoring ASCII case.
+            tag (str, optional): The tag name.
+
+        Returns:
+            list: The filter expressions, empty if none is given.
+        """
+        filters = []
+        if match_query is not None:
+            match = literal_column("offer_titles_fts").op("MATCH")(match_query)
+            filters.append(OfferModel.id.in_(select(offer_titles_fts.c.rowid).where(match)))
+        for term in exact_terms:
+            filters.append(OfferModel.title.contains(term, autoescape=True))
+
+        if tag is not None:
+            filters.append(OfferModel.id.in_(
+                select(OfferTag.offer_id).join(Tag, Tag.id == OfferTag.tag_id).where(Tag.name == tag)
+            ))
+        return filters
+
+    @staticmethod
+    def matches_nothing(query: Optional[str], match_query: Optional[str]) -> bool:
+        """
+        Checks if a search string has no word to search for, like "!!!".
+
+        Such a search matches no offer, while a blank one is the same as no search.
+
+        Args:
+            query (str, optional): The search string.
+            match_query (str, optional): The full-text search expression of the string.
+
+        Returns:
+            bool: True if no offer can match the search string.
+        """
+        return match_query is None and bool(query and query.strip())
+
+    def iter_rows(
+            self,
+            query: Optional[str] = None,
+            tag: Optional[str] = None,
+            batch_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterates over all offers matching the filters, oldest first, as plain dictionaries.
+
+        Rows are fetched from the database in batches of `batch_size` and no ORM or
+        Pydantic objects are built, so memory use does not depend on the number of offers.
+
+        Args:
+            query (str, optional): A search string to filter offers by title.
+            tag (str, optional): The tag to filter offers by, "all" or None for every tag.
+            batch_size (int, optional): The number of rows fetched at once.
+
+        Yields:
+            Dict[str, Any]: The columns of one offer.
+        """
+        match_query, exact_terms = get_search_terms(query or "")
+        if self.matches_nothing(query, match_query):
+            return
+        statement = (
+            select(*OFFER_COLUMNS)
+            .where(*self.get_filters(match_query, exact_terms, tag if tag != "all" else None))
+            .order_by(OfferModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        for row in self.session.execute(statement):
+            yield row._asdict()
+
+    def count(
+            self,
+            filters: list,
+            match_query: Optional[str],
+            exact_terms: Tuple[str, ...],
+            tag: Optional[str],
+    ) -> int:
+        """
+        Counts offers matching the filters, cached until the data version changes.
+
+        Args:
+            filters (list): The filter expressions of the listing.
+            match_query (str, optional): The full-text search expression, a part of the cache key.
+            exact_terms (Tuple[str, ...]): The terms matched exactly, a part of the cache key.
+            tag (str, optional): The tag filter, a part of the cache key.
+
+        Returns:
+            int: The number of matching offers.
+        """
+        key = (self.get_data_version(), match_query, exact_terms, tag)
+        total_offers = count_cache.get(key)
+        if total_offers is None:
+            total_offers = self.session.query(func.count(OfferModel.id)).filter(*filters).scalar()
+            count_cache.set(key, total_offers)
+        return total_offers
 
     def get_all(
             self,
-            page: int = 1,
             page_limit: int = 50,
             query: str = None,
-            tag: Optional[str] = None
+            tag: Optional[str] = None,
+            sort_by: Optional[OfferSortEnum] = None,
+            after: Optional[int] = None,
+            before: Optional[int] = None,
     ) -> OfferListOutput:
         """
-        Retrieves a paginated list of offers with filtering and sorting options.
+        Retrieves a page of offers with filtering and sorting options, see get_page.
 
         Args:
-            page (int, optional): The current page number (defaults to 1).
             page_limit (int, optional): The number of offers per page (defaults to 50).
-            query (str, optional): A search string to filter offers by title.
-            sort_by (OfferSortEnum, optional): The sorting criteria for offers (defaults to newest).
+            query (str, optional): A search string to filter offers by title, using the full-text index.
+            tag (str, optional): The tag to filter offers by, "all" or None for every tag.
+            sort_by (OfferSortEnum, optional): The sorting criteria for offers (defaults to relevance
+                when searching, newest otherwise).
+            after (int, optional): Cursor of the page before the requested one.
+            before (int, optional): Cursor of the page after the requested one.
 
         Returns:
-            OfferListOutput: An object containing the list of offers, pagination information,
-                             and total number of offers.
+            OfferListOutput: An object containing the list of offers, pagination cursors,
+                             and total number of matching offers.
         """
+        return OfferListOutput(**self.get_page(page_limit, query, tag, sort_by, after, before))
 
-        total_offers_query = self.session.query(func.count(OfferModel.id))
+    def get_page(
+            self,
+            page_limit: int = 50,
+            query: str = None,
+            tag: Optional[str] = None,
+            sort_by: Optional[OfferSortEnum] = None,
+            after: Optional[int] = None,
+            before: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Retrieves a page of offers with filtering and sorting options as plain dictionaries.
 
-        offers = self.session.query(OfferModel)
+        Pages are selected with keyset pagination: `after` and `before` are cursors
+        holding the id of the last offer of the previous page or the first offer of
+        the next page, and rows are located by the (sort key, id) of that offer, so
+        every page costs the same regardless of its depth. Offers are selected as
+        plain column rows, no ORM or Pydantic object is built per offer.
 
-        if query is not None:
-            offers = offers.filter(OfferModel.title.like(f'%{query}%'))
+        Args:
+            page_limit (int, optional): The number of offers per page (defaults to 50).
+            query (str, optional): A search string to filter offers by title, using the full-text index.
+            tag (str, optional): The tag to filter offers by, "all" or None for every tag.
+            sort_by (OfferSortEnum, optional): The sorting criteria for offers (defaults to relevance
+                when searching, newest otherwise).
+            after (int, optional): Cursor of the page before the requested one.
+            before (int, optional): Cursor of the page after the requested one.
 
-        if tag is not None and tag != "all":
-            offers = offers.filter(OfferModel.tag == tag)
+        Returns:
+            Dict[str, Any]: The fields of OfferListOutput, with the offers as dictionaries of their columns.
+        """
+        match_query, exact_terms = get_search_terms(query or "")
+        if sort_by is None or (sort_by == OfferSortEnum.RELEVANCE and match_query is None):
+            sort_by = OfferSortEnum.RELEVANCE if match_query else OfferSortEnum.NEWEST
+        if tag == "all":
+            tag = None
 
-        offers = offers.order_by(desc(OfferModel.created_at))
+        if self.matches_nothing(query, match_query):
+            return {
+                "offers": [],
+                "prev_cursor": None,
+                "next_cursor": None,
+                "total_offers": 0,
+                "query": query,
+                "tag": tag,
+                "sort_by": sort_by.value,
+            }
 
-        total_offers = total_offers_query.scalar()
+        filters = self.get_filters(match_query, exact_terms, tag)
+        statement = select(*OFFER_COLUMNS).where(*filters)
 
-        total_pages = (total_offers + page_limit - 1) // page_limit
-        prev_page = max(page - 1, 1) if page > 1 else None
-        next_page = min(page + 1, total_pages) if page < total_pages else None
+        # Ties of the sort key are broken by id
+        if sort_by == OfferSortEnum.RELEVANCE:
+            match = literal_column("offer_titles_fts").op("MATCH")(match_query)
+            # rank is the bm25 score of the match, lower is better
+            matches = select(offer_titles_fts.c.rowid, offer_titles_fts.c.rank).where(match).subquery()
+            statement = statement.join(matches, matches.c.rowid == OfferModel.id)
+            sort_key, key_descending = matches.c.rank, False
+        else:
+            sort_key, key_descending = OfferModel.created_at, sort_by != OfferSortEnum.OLDEST
+        id_descending = sort_by != OfferSortEnum.OLDEST
 
-        offset = (page - 1) * page_limit if page > 0 else 0
-        offers = offers.offset(offset).limit(page_limit).all()
+        cursor = after if after is not None else before
+        # Moving backwards reverses the order, the page is reversed again after fetching
+        backwards = after is None and before is not None
+        if backwards:
+            key_descending, id_descending = not key_descending, not id_descending
 
-        offers_list = [OfferOutput(**offer.__dict__) for offer in offers]
+        if cursor is not None:
+            # The key is read from the database, so it compares exactly as stored
+            if sort_by == OfferSortEnum.RELEVANCE:
+                cursor_key = select(offer_titles_fts.c.rank).where(match, offer_titles_fts.c.rowid == cursor)
+            else:
+                cursor_key = select(OfferModel.created_at).where(OfferModel.id == cursor)
+            cursor_key = cursor_key.scalar_subquery()
+            key_after = sort_key < cursor_key if key_descending else sort_key > cursor_key
+            id_after = OfferModel.id < cursor if id_descending else OfferModel.id > cursor
+            statement = statement.where(or_(key_after, and_(sort_key == cursor_key, id_after)))
 
-        return OfferListOutput(
-            offers=offers_list,
-            prev_page=prev_page,
-            next_page=next_page,
-            query=query,
+        statement = statement.order_by(
+            desc(sort_key) if key_descending else asc(sort_key),
+            desc(OfferModel.id) if id_descending else asc(OfferModel.id),
         )
+
+        # One extra row tells if there is another page in this direction
+        offers = [row._asdict() for row in self.session.execute(statement.limit(page_limit + 1))]
+        has_more = len(offers) > page_limit
+        offers = offers[:page_limit]
+        if backwards:
+            offers.reverse()
+
+        has_prev, has_next = (has_more, True) if backwards else (cursor is not None, has_more)
+
+        return {
+            "offers": offers,
+            "prev_cursor": offers[0]["id"] if has_prev and offers else None,
+            "next_cursor": offers[-1]["id"] if has_next and offers else None,
+            "total_offers": self.count(filters, match_query, exact_terms, tag),
+            "query": query,
+            "tag": tag,
+            "sort_by": sort_by.value,
+        }
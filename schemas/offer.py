@@ -42,18 +42,34 @@ class OfferOutput(BaseModel):
     tag: Optional[str] = None
 
 
+class OfferBulkCreateOutput(BaseModel):
+    """
+    Represents the result of saving a batch of offers.
+
+    Attributes:
+        inserted (int): The number of offers which were saved.
+        skipped (int): The number of offers which already existed.
+    """
+
+    inserted: int = 0
+    skipped: int = 0
+
+
 class OfferListOutput(BaseModel):
     """
     Represents a list of offers along with pagination information.
 
     Attributes:
         offers (list[OfferOutput]): A list of `OfferOutput` objects.
-        prev_page (int, optional): The index of the previous page, if it exists. Defaults to None.
-        next_page (int, optional): The index of the next page, if it exists. Defaults to None.
+        prev_cursor (int, optional): The cursor of the previous page, if it exists. Defaults to None.
+        next_cursor (int, optional): The cursor of the next page, if it exists. Defaults to None.
+        total_offers (int): The number of offers matching the filters.
     """
 
     offers: list[OfferOutput]
-    prev_page: Optional[int] = None
-    next_page: Optional[int] = None
+    prev_cursor: Optional[int] = None
+    next_cursor: Optional[int] = None
+    total_offers: int = 0
     query: Optional[str] = None
+    tag: Optional[str] = None
     sort_by: Optional[str] = None
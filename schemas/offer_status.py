@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from typing import List
+
+from pydantic import BaseModel, Field
 
 
 class OfferStatusUpdate(BaseModel):
@@ -12,3 +14,27 @@ class OfferStatusUpdate(BaseModel):
 
     offer_id: int
     status: bool
+
+
+class OfferStatusBulkUpdate(BaseModel):
+    """
+    Represents data required to update the status of many offers at once.
+
+    Attributes:
+        offer_ids (List[int]): The unique identifiers of the offers to be updated.
+        status (bool): The new status of the offers. True indicates the offers are checked, False indicates unchecked.
+    """
+
+    offer_ids: List[int] = Field(min_length=1, max_length=1000)
+    status: bool
+
+
+class OfferStatusBulkOutput(BaseModel):
+    """
+    Represents the result of a bulk status update.
+
+    Attributes:
+        updated (int): The number of offers which were found and updated.
+    """
+
+    updated: int
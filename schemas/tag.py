@@ -4,3 +4,4 @@ from typing import Optional
 
 class TagOutput(BaseModel):
     name: Optional[str] = None
+    offer_count: int = 0
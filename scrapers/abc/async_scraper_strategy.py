@@ -0,0 +1,47 @@
+from typing import Protocol, List, Optional, AsyncIterator, runtime_checkable
+
+import httpx
+
+from schemas.offer import Offer
+
+
+@runtime_checkable
+class AsyncScraperStrategy(Protocol):
+    """
+    A protocol defining the interface for scraper strategies that fetch pages asynchronously.
+    """
+    async def ascrape(
+            self,
+            url: str,
+            max_offer_duration_days: Optional[int] = None,
+            client: Optional[httpx.AsyncClient] = None,
+    ) -> List[Optional[Offer]]:
+        """
+        Scrapes data from a given URL without blocking the event loop.
+
+        Args:
+            url (str): The URL to scrape.
+            max_offer_duration_days (int): The maximum number of days
+            client (httpx.AsyncClient): The client shared by all async scrapers in a run.
+        Returns:
+            List[Optional[Offer]]: A list of scraped offer inputs.
+        """
+        ...
+
+    def astream(
+            self,
+            url: str,
+            max_offer_duration_days: Optional[int] = None,
+            client: Optional[httpx.AsyncClient] = None,
+    ) -> AsyncIterator[List[Optional[Offer]]]:
+        """
+        Scrapes data from a given URL, yielding the offers of each page as soon as it is parsed.
+
+        Args:
+            url (str): The URL to scrape.
+            max_offer_duration_days (int): The maximum number of days
+            client (httpx.AsyncClient): The client shared by all async scrapers in a run.
+        Yields:
+            List[Optional[Offer]]: The scraped offer inputs of one page.
+        """
+        ...
@@ -1,6 +1,11 @@
 from .scraper_strategy import ScraperStrategy
-from typing import List, Optional
+from .async_scraper_strategy import AsyncScraperStrategy
+from .streaming_scraper_strategy import StreamingScraperStrategy
+from contextlib import closing, aclosing
+from typing import List, Optional, Iterator, AsyncIterator, Callable
+import httpx
 from schemas.offer import Offer
+from utils.async_request import get_async_client
 
 
 class Scraper:
@@ -9,19 +14,32 @@ class Scraper:
 
     Attributes:
         _strategy (ScraperStrategy): The strategy used for scraping.
+        is_seen (Callable[[str], bool]): Checks if an offer URL was already scraped.
+        max_known_pages (int): Number of consecutive pages of already seen offers
+            after which streaming stops, None to scrape all pages.
     """
 
-    def __init__(self, strategy: ScraperStrategy) -> None:
+    def __init__(
+            self,
+            strategy: ScraperStrategy,
+            is_seen: Optional[Callable[[str], bool]] = None,
+            max_known_pages: Optional[int] = None,
+    ) -> None:
         """
         Initializes the Scraper with a given strategy.
 
         Args:
             strategy (ScraperStrategy): The strategy used for scraping.
+            is_seen (Callable[[str], bool]): Checks if an offer URL was already scraped.
+            max_known_pages (int): Number of consecutive pages of already seen offers
+                after which streaming stops, None to scrape all pages.
 
         Returns:
             None
         """
         self._strategy = strategy
+        self.is_seen = is_seen
+        self.max_known_pages = max_known_pages
 
     def set_strategy(self, strategy: ScraperStrategy) -> None:
         """
@@ -51,3 +69,150 @@ class Scraper:
         """
         print(f"Run {self._strategy.__class__.__name__} scraper")
         return self._strategy.scrape(url, max_offer_duration_days)
+
+    @property
+    def is_async(self) -> bool:
+        """
+        Checks if the current strategy can scrape asynchronously.
+
+        Returns:
+            bool: True if the strategy implements AsyncScraperStrategy, False otherwise.
+        """
+        return isinstance(self._strategy, AsyncScraperStrategy)
+
+    def is_known_page(self, page: List[Optional[Offer]]) -> bool:
+        """
+        Checks if every offer on a page was already seen.
+
+        Args:
+            page (List[Optional[Offer]]): The scraped offer inputs of one page.
+
+        Returns:
+            bool: True if the page is not empty and all its offers were seen, False otherwise.
+        """
+        if self.is_seen is None or not page:
+            return False
+        return all(self.is_seen(offer.url) for offer in page)
+
+    def count_known_pages(self, page: List[Optional[Offer]], known_pages: int) -> int:
+        """
+        Updates the number of consecutive pages of already seen offers.
+
+        Empty pages, for example pages with only outdated offers, keep the current count.
+
+        Args:
+            page (List[Optional[Offer]]): The scraped offer inputs of one page.
+            known_pages (int): The number of consecutive known pages before this page.
+
+        Returns:
+            int: The number of consecutive known pages including this page.
+        """
+        if not page:
+            return known_pages
+        return known_pages + 1 if self.is_known_page(page) else 0
+
+    def should_stop(self, known_pages: int) -> bool:
+        """
+        Checks if pagination should stop in incremental crawl mode.
+
+        Args:
+            known_pages (int): The number of consecutive known pages.
+
+        Returns:
+            bool: True if max_known_pages is set and reached, False otherwise.
+        """
+        if not self.max_known_pages or known_pages < self.max_known_pages:
+            return False
+
+        print(f"Stop {self._strategy.__class__.__name__} scraper, "
+              f"{known_pages} pages in a row contain only known offers")
+        return True
+
+    async def ascrape(
+            self,
+            url: str,
+            max_offer_duration_days: Optional[int] = None,
+            client: Optional[httpx.AsyncClient] = None,
+    ) -> List[Optional[Offer]]:
+        """
+        Scrapes data from a given URL using the current async strategy.
+
+        Args:
+            url (str): The URL to scrape.
+            max_offer_duration_days (int): The maximum number of days
+            client (httpx.AsyncClient): The client shared by all async scrapers in a run.
+        Returns:
+            List[Optional[Offer]]: A list of scraped offer inputs.
+        """
+        return [offer async for page in self.astream(url, max_offer_duration_days, client) for offer in page]
+
+    def stream(
+            self,
+            url: str,
+            max_offer_duration_days: Optional[int] = None
+    ) -> Iterator[List[Optional[Offer]]]:
+        """
+        Scrapes data from a given URL page by page using the current strategy.
+
+        Strategies which do not implement StreamingScraperStrategy yield all offers as a single page.
+        Pagination stops early once max_known_pages pages in a row contain only seen offers.
+
+        Args:
+            url (str): The URL to scrape.
+            max_offer_duration_days (int): The maximum number of days
+        Yields:
+            List[Optional[Offer]]: The scraped offer inputs of one page.
+        """
+        print(f"Run {self._strategy.__class__.__name__} scraper")
+        if not isinstance(self._strategy, StreamingScraperStrategy):
+            yield self._strategy.scrape(url, max_offer_duration_days)
+            return
+
+        # Strategies fetching detail pages can skip offers which were already seen
+        if self.is_seen is not None and hasattr(self._strategy, "is_seen"):
+            self._strategy.is_seen = self.is_seen
+
+        known_pages = 0
+        with closing(self._strategy.stream(url, max_offer_duration_days)) as pages:
+            for page in pages:
+                yield page
+
+                known_pages = self.count_known_pages(page, known_pages)
+                if self.should_stop(known_pages):
+                    return
+
+    async def astream(
+            self,
+            url: str,
+            max_offer_duration_days: Optional[int] = None,
+            client: Optional[httpx.AsyncClient] = None,
+    ) -> AsyncIterator[List[Optional[Offer]]]:
+        """
+        Scrapes data from a given URL page by page using the current async strategy.
+
+        Pagination stops early once max_known_pages pages in a row contain only seen offers.
+
+        Args:
+            url (str): The URL to scrape.
+            max_offer_duration_days (int): The maximum number of days
+            client (httpx.AsyncClient): The client shared by all async scrapers in a run,
+                a new client is created for this call if not given.
+        Yields:
+            List[Optional[Offer]]: The scraped offer inputs of one page.
+        """
+        if client is None:
+            async with get_async_client() as client:
+                async for page in self.astream(url, max_offer_duration_days, client):
+                    yield page
+            return
+
+        print(f"Run {self._strategy.__class__.__name__} async scraper")
+
+        known_pages = 0
+        async with aclosing(self._strategy.astream(url, max_offer_duration_days, client)) as pages:
+            async for page in pages:
+                yield page
+
+                known_pages = self.count_known_pages(page, known_pages)
+                if self.should_stop(known_pages):
+                    return
@@ -0,0 +1,25 @@
+from typing import Protocol, List, Optional, Iterator, runtime_checkable
+
+from schemas.offer import Offer
+
+
+@runtime_checkable
+class StreamingScraperStrategy(Protocol):
+    """
+    A protocol defining the interface for scraper strategies that yield offers page by page.
+    """
+    def stream(
+            self,
+            url: str,
+            max_offer_duration_days: Optional[int] = None
+    ) -> Iterator[List[Optional[Offer]]]:
+        """
+        Scrapes data from a given URL, yielding the offers of each page as soon as it is parsed.
+
+        Args:
+            url (str): The URL to scrape.
+            max_offer_duration_days (int): The maximum number of days
+        Yields:
+            List[Optional[Offer]]: The scraped offer inputs of one page.
+        """
+        ...
@@ -1,17 +1,44 @@
-from typing import Optional, List
+import asyncio
+from typing import Optional, List, AsyncIterator
 
-from bs4 import BeautifulSoup
+import httpx
 
 from schemas.offer import Offer
+from utils.async_request import async_get_request
 from utils.get_request import get_request
+from utils.html_parser import Strainer, parse_response
+from .abc.async_scraper_strategy import AsyncScraperStrategy
 from .abc.scraper_strategy import ScraperStrategy
 
 
-class BulldogJob(ScraperStrategy):
+# Offer elements of a listing page, the only part of it which is parsed
+OFFER_STRAINER = Strainer("a", {"class": "JobListItem_item__M79JI"})
+
+
+class BulldogJob(ScraperStrategy, AsyncScraperStrategy):
     """
     A class implementing the scraping strategy for BulldogJob website.
     """
 
+    # Maximum number of listing pages requested at the same time in async mode.
+    # The window starts at one page and doubles, so incremental runs which stop
+    # after the first pages do not fetch many pages ahead.
+    PAGES_IN_FLIGHT = 4
+
+    @staticmethod
+    def get_job_offers(response) -> list:
+        """
+        Finds offer elements on a listing page, parsing only the offer links.
+
+        Args:
+            response (Union[requests.Response, httpx.Response]): The response with the listing page.
+
+        Returns:
+            list: The offer elements.
+        """
+        soup = parse_response(response, OFFER_STRAINER)
+        return soup.find_all("a", class_="JobListItem_item__M79JI")
+
     @staticmethod
     def parse_offer(offer) -> Optional[Offer]:
         """
@@ -52,8 +79,7 @@ class BulldogJob(ScraperStrategy):
             if not response:
                 break
 
-            soup = BeautifulSoup(response.text, "html.parser")
-            job_offers = soup.find_all("a", class_="JobListItem_item__M79JI")
+            job_offers = self.get_job_offers(response)
 
             print(f"Found {len(job_offers)} offers")
 
@@ -75,3 +101,71 @@ class BulldogJob(ScraperStrategy):
 
         print(f"Parsed {len(offers)} offers")
         return offers
+
+    async def ascrape(
+            self,
+            url: str,
+            max_offer_duration_days: Optional[int] = None,
+            client: Optional[httpx.AsyncClient] = None,
+    ) -> List[Optional[Offer]]:
+        """
+        Scrapes job offers from BulldogJob website without blocking the event loop.
+
+        Args:
+            url (str): The base URL to start scraping from.
+            max_offer_duration_days
+            client (httpx.AsyncClient): The client shared by all async scrapers in a run.
+        Returns:
+            List[Optional[Offer]]: A list of scraped offer inputs.
+        """
+        offers = [offer async for page in self.astream(url, max_offer_duration_days, client) for offer in page]
+        print(f"Parsed {len(offers)} offers")
+        return offers
+
+    async def astream(
+            self,
+            url: str,
+            max_offer_duration_days: Optional[int] = None,
+            client: Optional[httpx.AsyncClient] = None,
+    ) -> AsyncIterator[List[Optional[Offer]]]:
+        """
+        Scrapes job offers from BulldogJob website page by page, requesting several listing pages at once.
+
+        Args:
+            url (str): The base URL to start scraping from.
+            max_offer_duration_days
+            client (httpx.AsyncClient): The client shared by all async scrapers in a run.
+        Yields:
+            List[Optional[Offer]]: The scraped offer inputs of one page.
+        """
+        page_num = 1
+        pages_in_flight = 1
+        previous_page = None
+
+        while True:
+            responses = await asyncio.gather(*(
+                async_get_request(client, f"{url}{page_num + i}")
+                for i in range(pages_in_flight)
+            ))
+            page_num += pages_in_flight
+            pages_in_flight = min(pages_in_flight * 2, self.PAGES_IN_FLIGHT)
+
+            for response in responses:
+                if not response:
+                    return
+
+                job_offers = self.get_job_offers(response)
+
+                print(f"Found {len(job_offers)} offers")
+
+                if not job_offers or previous_page == job_offers:
+                    return
+
+                previous_page = job_offers
+
+                offers = []
+                for offer in job_offers:
+                    parsed_offer = self.parse_offer(offer)
+                    if parsed_offer:
+                        offers.append(parsed_offer)
+                yield offers
@@ -1,15 +1,20 @@
-from typing import Optional, List
-from bs4 import BeautifulSoup
+from typing import Optional, List, Iterator
 from schemas.offer import Offer
 from .abc.scraper_strategy import ScraperStrategy
-from utils.get_driver import get_driver
+from .abc.streaming_scraper_strategy import StreamingScraperStrategy
+from enums.browser_profile import BrowserProfileEnum
+from utils.driver_pool import get_driver_pool
+from utils.html_parser import parse_html
 
 
-class Indeed(ScraperStrategy):
+class Indeed(ScraperStrategy, StreamingScraperStrategy):
     """
     A class implementing the scraping strategy for Indeed website.
     """
 
+    # Chrome profile of browsers leased from the driver pool
+    browser_profile = BrowserProfileEnum.PERFORMANCE
+
     @staticmethod
     def check_date(offer, max_offer_duration_days: int) -> bool:
         date_span = offer.find("span", {"data-testid": "myJobsStateDate"})
@@ -100,36 +105,45 @@ class Indeed(ScraperStrategy):
         Returns:
             List[Optional[Offer]]: A list of scraped offer inputs.
         """
-        offers = []
-        base_url = url
-
-        driver = get_driver()
+        offers = [offer for page in self.stream(url, max_offer_duration_days) for offer in page]
+        print(f"Parsed {len(offers)} offers")
+        return offers
 
-        while True:
-            driver.get(base_url)
-            page_source = driver.page_source
+    def stream(self, url: str, max_offer_duration_days: Optional[int] = None) -> Iterator[List[Optional[Offer]]]:
+        """
+        Scrapes job offers from Indeed website page by page.
 
-            if not page_source:
-                break
+        Args:
+            url (str): The base URL to start scraping from.
+            max_offer_duration_days
+        Yields:
+            List[Optional[Offer]]: The scraped offer inputs of one page.
+        """
+        base_url = url
 
-            print(f"Successfully visited: {url}")
+        with get_driver_pool().lease(self.browser_profile) as driver:
+            while True:
+                driver.get(base_url)
+                page_source = driver.page_source
 
-            soup = BeautifulSoup(page_source, "html.parser")
-            job_elements = soup.find_all("li", class_="css-5lfssm")
+                if not page_source:
+                    break
 
-            print(f"Found {len(job_elements)} elements")
+                print(f"Successfully visited: {url}")
 
-            for offer in job_elements:
-                parsed_offer = self.parse_offer(offer, max_offer_duration_days)
-                if parsed_offer:
-                    offers.append(parsed_offer)
+                soup = parse_html(page_source)
+                job_elements = soup.find_all("li", class_="css-5lfssm")
 
-            next_url = self.get_next_url(soup)
-            if not next_url:
-                break
-            base_url = next_url
+                print(f"Found {len(job_elements)} elements")
 
-        print(f"Parsed {len(offers)} offers")
+                offers = []
+                for offer in job_elements:
+                    parsed_offer = self.parse_offer(offer, max_offer_duration_days)
+                    if parsed_offer:
+                        offers.append(parsed_offer)
+                yield offers
 
-        driver.quit()
-        return offers
+                next_url = self.get_next_url(soup)
+                if not next_url:
+                    break
+                base_url = next_url
@@ -1,13 +1,20 @@
-from typing import Optional, List
+from typing import Optional, List, AsyncIterator
 
-from bs4 import BeautifulSoup
+import httpx
 
 from schemas.offer import Offer
+from utils.async_request import async_get_request
 from utils.get_request import get_request
+from utils.html_parser import Strainer, parse_response
+from .abc.async_scraper_strategy import AsyncScraperStrategy
 from .abc.scraper_strategy import ScraperStrategy
 
 
-class Jooble(ScraperStrategy):
+# Offer elements of a listing page, the only part of it which is parsed
+OFFER_STRAINER = Strainer("div", {"data-test-name": "_jobCard"})
+
+
+class Jooble(ScraperStrategy, AsyncScraperStrategy):
     """
     A class implementing the scraping strategy for Jooble website.
     """
@@ -74,14 +81,65 @@ class Jooble(ScraperStrategy):
         Returns:
             List[Optional[Offer]]: A list of scraped offer inputs.
         """
-        base_url = url
-        offers = []
+        response = get_request(url)
+        if not response:
+            return []
+
+        return self.parse_page(response, max_offer_duration_days)
+
+    async def ascrape(
+            self,
+            url: str,
+            max_offer_duration_days: Optional[int] = None,
+            client: Optional[httpx.AsyncClient] = None,
+    ) -> List[Optional[Offer]]:
+        """
+        Scrapes job offers from Jooble website without blocking the event loop.
+
+        Args:
+            url (str): The base URL to start scraping from.
+            max_offer_duration_days
+            client (httpx.AsyncClient): The client shared by all async scrapers in a run.
+        Returns:
+            List[Optional[Offer]]: A list of scraped offer inputs.
+        """
+        return [offer async for page in self.astream(url, max_offer_duration_days, client) for offer in page]
+
+    async def astream(
+            self,
+            url: str,
+            max_offer_duration_days: Optional[int] = None,
+            client: Optional[httpx.AsyncClient] = None,
+    ) -> AsyncIterator[List[Optional[Offer]]]:
+        """
+        Scrapes job offers from Jooble website, the search result is a single page.
 
-        response = get_request(base_url)
+        Args:
+            url (str): The base URL to start scraping from.
+            max_offer_duration_days
+            client (httpx.AsyncClient): The client shared by all async scrapers in a run.
+        Yields:
+            List[Optional[Offer]]: The scraped offer inputs of the page.
+        """
+        response = await async_get_request(client, url)
         if not response:
-            return offers
+            return
+
+        yield self.parse_page(response, max_offer_duration_days)
+
+    def parse_page(self, response, max_offer_duration_days: Optional[int] = None) -> List[Optional[Offer]]:
+        """
+        Parses job offers from the search result page, parsing only the job cards.
+
+        Args:
+            response (Union[requests.Response, httpx.Response]): The response with the page.
+            max_offer_duration_days
+        Returns:
+            List[Optional[Offer]]: A list of parsed offer inputs.
+        """
+        offers = []
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = parse_response(response, OFFER_STRAINER)
         elements = soup.find_all("div", {"data-test-name": "_jobCard"})
         print(f"Found {len(elements)} elements")
 
@@ -1,60 +1,97 @@
-import time
-from typing import Optional, List
-
-from bs4 import BeautifulSoup
-from selenium.webdriver.common.by import By
+from typing import Optional, List, Tuple
 
 from schemas.offer import Offer
-from utils.get_driver import get_driver
+from enums.browser_profile import BrowserProfileEnum
+from utils.driver_pool import get_driver_pool
+from utils.selenium_wait import WAIT_FUNCTIONS_JS, DOM_SETTLE_MS, NETWORK_IDLE_MS, AdaptiveTimeout
 from .abc.scraper_strategy import ScraperStrategy
 
+# Steps in a row which neither moved the page nor changed the DOM once the network was idle, after which scrolling stops
+SCROLL_ATTEMPTS = 2
+# Steps in a row which timed out with requests still pending, after which scrolling stops
+BUSY_ATTEMPTS = 10
+
+# Returns [title, href, date] of offer cards not returned before, keyed by href, then scrolls
+# the page and waits until the network is idle and the DOM settled, so one scroll step is one
+# WebDriver call which takes as long as the list needs to render
+HARVEST_SCRIPT = WAIT_FUNCTIONS_JS + """
+const [timeout, settle, idle] = arguments;
+const done = arguments[arguments.length - 1];
+trackRequests();
+const seen = window.jobScraperSeen || (window.jobScraperSeen = new Set());
+const cards = [];
+for (const element of document.getElementsByClassName("css-2crog7")) {
+    const title = element.querySelector("h2");
+    const link = element.querySelector("a");
+    const href = link && link.getAttribute("href");
+    if (!title || !href || seen.has(href)) {
+        continue;
+    }
+    seen.add(href);
+    const date = element.querySelector("div.css-1am4i4o");
+    cards.push([title.textContent, href, date ? date.textContent : null]);
+}
+window.scrollBy(0, 500);
+Promise.all([waitForNetworkIdle(timeout, idle), waitForDomSettle(timeout, settle)])
+    .then(([networkIdle, changedAfter]) => done([cards, window.scrollY, networkIdle, changedAfter]));
+"""
+
 
 class JustJoinIT(ScraperStrategy):
     """
     A class implementing the scraping strategy for JustJoinIT website.
     """
 
+    # Chrome profile of browsers leased from the driver pool
+    browser_profile = BrowserProfileEnum.PERFORMANCE
+
     @staticmethod
-    def get_content(driver) -> List[Optional[str]]:
+    def get_content(driver) -> List[Tuple[str, str, Optional[str]]]:
         """
-        Retrieves the HTML content of job offer elements from the webpage.
+        Collects job offer cards while scrolling through the webpage.
+
+        Every scroll step is a single script call, which returns only cards not seen in
+        earlier steps, so each offer is transferred from the browser once. Steps which timed
+        out while requests were still pending are repeated, and scrolling stops after
+        SCROLL_ATTEMPTS steps in a row neither moved the page nor changed the DOM once the
+        network was idle.
 
         Args:
             driver: The Selenium WebDriver instance.
 
         Returns:
-            List[Optional[str]]: A list of HTML content strings.
+            List[Tuple[str, str, Optional[str]]]: (title, url, date) of every unique offer card.
         """
         data = []
+        timeout = AdaptiveTimeout(initial=1000, minimum=1000, maximum=3000)
         last_height = 0
-        while True:
-            elements = driver.find_elements(By.CLASS_NAME, "css-2crog7")
-            print(f"Found {len(elements)} elements")
-
-            if elements:
-                for element in elements:
-                    data.append(element.get_attribute("outerHTML"))
-
-            driver.execute_script(
-                f"window.scrollBy(0, 500);"
+        unchanged_scrolls = 0
+        busy_scrolls = 0
+        while unchanged_scrolls < SCROLL_ATTEMPTS and busy_scrolls < BUSY_ATTEMPTS:
+            cards, new_height, network_idle, changed_after = driver.execute_async_script(
+                HARVEST_SCRIPT, timeout.value, DOM_SETTLE_MS, NETWORK_IDLE_MS
             )
-            time.sleep(1)
-
-            new_height = driver.execute_script("return window.scrollY")
-            if new_height == last_height:
-                break
+            print(f"Found {len(cards)} new elements")
+            data.extend(cards)
+
+            timeout.observe(changed_after)
+            if new_height != last_height or changed_after is not None:
+                unchanged_scrolls = busy_scrolls = 0
+            elif not network_idle:
+                # The site is still loading, the step proves nothing
+                busy_scrolls += 1
+            else:
+                busy_scrolls = 0
+                unchanged_scrolls += 1
             last_height = new_height
         return data
 
     @staticmethod
-    def check_date(offer, max_offer_duration_days: int) -> bool:
-        date_element = offer.find("div", class_="css-1am4i4o")
-        if not date_element:
+    def check_date(date_text: Optional[str], max_offer_duration_days: int) -> bool:
+        if not date_text:
             print("No date element found")
             return False
 
-        date_text = date_element.text
-
         if date_text == "New":
             print("Offer is new")
             return True
@@ -75,41 +112,24 @@ class JustJoinIT(ScraperStrategy):
 
     def parse_offers(
             self,
-            data: List[Optional[str]],
+            data: List[Tuple[str, str, Optional[str]]],
             max_offer_duration_days: Optional[int] = None
     ) -> List[Optional[Offer]]:
         """
-        Parses job offer data from HTML content.
+        Builds job offers from the collected offer cards.
 
         Args:
-            data (List[Optional[str]]): A list of HTML content strings.
+            data (List[Tuple[str, str, Optional[str]]]): (title, url, date) of every unique offer card.
             max_offer_duration_days
         Returns:
             List[Optional[Offer]]: A list of parsed offer inputs.
         """
-        if not data:
-            return []
-
-        unique_urls, offers = [], []
-
-        for d in data:
-            soup = BeautifulSoup(d, "html.parser")
-            title = soup.find("h2")
-            url = soup.find("a")
-
-            if not title or not url:
-                continue
-
-            title = title.text
-            url = url.get("href")
-
-            if max_offer_duration_days and not self.check_date(soup, max_offer_duration_days):
-                continue
+        offers = []
 
-            if url in unique_urls:
+        for title, url, date_text in data:
+            if max_offer_duration_days and not self.check_date(date_text, max_offer_duration_days):
                 continue
 
-            unique_urls.append(url)
             full_url = f"https://justjoin.it{url}"
             offers.append(Offer(title=title, url=full_url))
 
@@ -125,10 +145,10 @@ class JustJoinIT(ScraperStrategy):
         Returns:
             List[Optional[Offer]]: A list of scraped offer inputs.
         """
-        driver = get_driver()
-        driver.get(url)
+        with get_driver_pool().lease(self.browser_profile) as driver:
+            driver.get(url)
+            data = self.get_content(driver)
 
-        data = self.get_content(driver)
         parsed_offers = self.parse_offers(data, max_offer_duration_days)
 
         print(f"Parsed {len(parsed_offers)} offers")
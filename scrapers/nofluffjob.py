@@ -1,118 +1,123 @@
-from time import sleep
-from typing import Optional, List
-
-from bs4 import BeautifulSoup
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
+from typing import Optional, List, Tuple
 
 from schemas.offer import Offer
-from utils.get_driver import get_driver
+from enums.browser_profile import BrowserProfileEnum
+from utils.driver_pool import get_driver_pool
+from utils.selenium_wait import (
+    WAIT_FUNCTIONS_JS, DOM_SETTLE_MS, NETWORK_IDLE_MS, AdaptiveTimeout, click_if_present
+)
 from .abc.scraper_strategy import ScraperStrategy
 
+# Steps in a row in which nothing changed after the page finished loading, after which scrolling stops
+SCROLL_ATTEMPTS = 3
+# Steps in a row which timed out with requests still pending, after which scrolling stops
+BUSY_ATTEMPTS = 10
+
+# Returns [url, title, posted date] of job cards not returned before, keyed by url, clicks
+# "Get more offers" and scrolls to the bottom, then waits until the network is idle and the
+# DOM settled, so one step is one WebDriver call which takes as long as the site needs
+HARVEST_SCRIPT = WAIT_FUNCTIONS_JS + """
+const [timeout, settle, idle] = arguments;
+const done = arguments[arguments.length - 1];
+trackRequests();
+const seen = window.jobScraperSeen || (window.jobScraperSeen = new Set());
+const cards = [];
+for (const link of document.querySelectorAll("a[href*='pl/job']")) {
+    const href = link.getAttribute("href");
+    const title = link.querySelector("h3");
+    if (!title || seen.has(href)) {
+        continue;
+    }
+    seen.add(href);
+    const posted = link.querySelector("time");
+    cards.push([href, title.textContent, posted ? posted.textContent.trim() : null]);
+}
+const getMore = document.querySelector("button.tw-btn.tw-btn-primary.tw-px-8.tw-block.tw-btn-xl");
+if (getMore) {
+    getMore.click();
+}
+window.scrollTo(0, document.body.scrollHeight);
+Promise.all([waitForNetworkIdle(timeout, idle), waitForDomSettle(timeout, settle)])
+    .then(([networkIdle, changedAfter]) => done([cards, networkIdle, changedAfter]));
+"""
+COUNTRY_BUTTON_SELECTOR = "button.tw-btn.tw-btn-xl.tw-text-gray-30.mr-3.ng-star-inserted"
+
 
 class Nofluffjob(ScraperStrategy):
     """
     A class implementing the scraping strategy for Nofluffjob website.
     """
 
+    # Chrome profile of browsers leased from the driver pool
+    browser_profile = BrowserProfileEnum.PERFORMANCE
+
     @staticmethod
-    def scroll_page_callback(driver, callback) -> None:
+    def get_content(driver) -> List[Tuple[str, str, Optional[str]]]:
         """
-        Scroll the webpage and execute a callback function repeatedly until certain conditions are met.
+        Collects job offer cards while scrolling the webpage and loading more offers.
+
+        Every step is a single script call, which returns only cards not seen in earlier
+        steps once the page finished loading. Steps which timed out while requests were
+        still pending are repeated, and scrolling stops after SCROLL_ATTEMPTS steps in a
+        row changed nothing once the network was idle. The wait for changes adapts to how
+        fast the site loads.
 
         Args:
             driver: Selenium WebDriver instance.
-            callback: Callback function to execute after each scroll.
-        """
-        try:
-            last_height = driver.execute_script("return document.body.scrollHeight")
-            consecutive_scrolls = 0
 
-            while consecutive_scrolls < 3:
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-
-                sleep(3)
-                new_height = driver.execute_script("return document.body.scrollHeight")
+        Returns:
+            List[Tuple[str, str, Optional[str]]]: (url, title, posted date) of every unique offer card.
+        """
+        data = {}
+        timeout = AdaptiveTimeout(initial=3000, minimum=1500, maximum=5000)
+        unchanged_scrolls = 0
+        busy_scrolls = 0
 
-                if new_height == last_height:
-                    consecutive_scrolls += 1
+        try:
+            while unchanged_scrolls < SCROLL_ATTEMPTS and busy_scrolls < BUSY_ATTEMPTS:
+                cards, network_idle, changed_after = driver.execute_async_script(
+                    HARVEST_SCRIPT, timeout.value, DOM_SETTLE_MS, NETWORK_IDLE_MS
+                )
+                for url, title, posted in cards:
+                    data.setdefault(url, (url, title, posted))
+                print(f"Found {len(cards)} new elements")
+
+                timeout.observe(changed_after)
+                if changed_after is not None:
+                    unchanged_scrolls = busy_scrolls = 0
+                elif not network_idle:
+                    # The site is still loading, the step proves nothing
+                    busy_scrolls += 1
                 else:
-                    consecutive_scrolls = 0
-
-                last_height = new_height
-
-                callback(driver)
-
+                    busy_scrolls = 0
+                    unchanged_scrolls += 1
         except Exception as e:
             print(e)
 
-    @staticmethod
-    def click_get_more(driver) -> None:
-        """
-        Click the "Get more" button on the webpage.
-
-        Args:
-            driver: Selenium WebDriver instance.
-        """
-        try:
-            consent_button = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "button.tw-btn.tw-btn-primary.tw-px-8.tw-block.tw-btn-xl"))
-            )
-            driver.execute_script("arguments[0].click();", consent_button)
-        except:
-            pass
+        return list(data.values())
 
     @staticmethod
     def click_country(driver) -> None:
         """
-        Click the country selection button on the webpage.
+        Click the country selection button on the webpage, if it appears.
 
         Args:
             driver: Selenium WebDriver instance.
         """
-        try:
-            consent_button = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable(
-                    (By.CSS_SELECTOR, "button.tw-btn.tw-btn-xl.tw-text-gray-30.mr-3.ng-star-inserted"))
-            )
-            consent_button.click()
-        except:
-            pass
+        click_if_present(driver, COUNTRY_BUTTON_SELECTOR, timeout=10000, settle=1000)
 
     @staticmethod
-    def parse_offers(data) -> List[Optional[Offer]]:
+    def parse_offers(data: List[Tuple[str, str, Optional[str]]]) -> List[Optional[Offer]]:
         """
-        Parse job offers from HTML data.
+        Build job offers from the collected offer cards.
 
         Args:
-            data: List of HTML data.
+            data (List[Tuple[str, str, Optional[str]]]): (url, title, posted date) of every unique offer card.
 
         Returns:
             List[Optional[Offer]]: A list of parsed offer inputs.
         """
-        offers, unique_urls = [], []
-
-        for d in data:
-            soup = BeautifulSoup(d, "html.parser")
-            target_url = soup.find("a", href=lambda href: href and "pl/job" in href)
-            if not target_url:
-                continue
-
-            url = target_url.get("href")
-            title = target_url.find("h3")
-
-            if not url or not title:
-                continue
-
-            if url in unique_urls:
-                continue
-
-            unique_urls.append(url)
-            full_url = f"https://nofluffjobs.com{url}"
-            offers.append(Offer(title=title.text, url=full_url))
-
-        return offers
+        return [Offer(title=title, url=f"https://nofluffjobs.com{url}") for url, title, _ in data]
 
     def scrape(self, url: str, max_offer_duration_days: Optional[int] = None) -> List[Optional[Offer]]:
         """
@@ -124,20 +129,10 @@ class Nofluffjob(ScraperStrategy):
         Returns:
             List[Optional[Offer]]: A list of scraped offer inputs.
         """
-        driver = get_driver()
-        driver.get(url)
-        self.click_country(driver)
-
-        data = []
-
-        def scrape_callback(driver_object) -> None:
-            self.click_get_more(driver)
-
-            a_elements = driver_object.find_elements(By.TAG_NAME, "a")
-            for element in a_elements:
-                data.append(element.get_attribute("outerHTML"))
-
-        self.scroll_page_callback(driver, scrape_callback)
+        with get_driver_pool().lease(self.browser_profile) as driver:
+            driver.get(url)
+            self.click_country(driver)
+            data = self.get_content(driver)
 
         parsed_offers = self.parse_offers(data)
 
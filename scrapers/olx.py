@@ -1,12 +1,15 @@
-import requests
+import httpx
+from .abc.async_scraper_strategy import AsyncScraperStrategy
 from .abc.scraper_strategy import ScraperStrategy
-from typing import Optional, List
+from typing import Optional, List, AsyncIterator
+from utils.async_request import async_get_request
+from utils.get_request import get_request
 from schemas.offer import Offer
 from datetime import datetime
 from dateutil.parser import parse
 
 
-class OLX(ScraperStrategy):
+class OLX(ScraperStrategy, AsyncScraperStrategy):
     """
     A class implementing the scraping strategy for OLX website.
     """
@@ -29,6 +32,32 @@ class OLX(ScraperStrategy):
 
         return next_page_element.get("href")
 
+    def parse_data(self, data, max_offer_duration_days: Optional[int] = None) -> List[Optional[Offer]]:
+        """
+        Parses job offers from a page of the OLX offers API.
+
+        Args:
+            data: The decoded JSON response.
+            max_offer_duration_days
+        Returns:
+            List[Optional[Offer]]: A list of parsed offer inputs.
+        """
+        offers = []
+
+        for d in data["data"]:
+            title = d.get("title")
+            offer_url = d.get("url")
+
+            if not title or not offer_url:
+                continue
+
+            if max_offer_duration_days and not self.check_date(d.get("created_time"), max_offer_duration_days):
+                continue
+
+            offers.append(Offer(title=title, url=offer_url))
+
+        return offers
+
     def scrape(self, url: str, max_offer_duration_days: Optional[int] = None) -> List[Optional[Offer]]:
         """
         Scrape job offers from OLX website.
@@ -44,23 +73,16 @@ class OLX(ScraperStrategy):
         offers = []
 
         while True:
-            response = requests.get(base_url)
+            response = get_request(base_url)
+            if not response:
+                break
+
             data = response.json()
 
             if not data:
                 break
 
-            for d in data["data"]:
-                title = d.get("title")
-                offer_url = d.get("url")
-
-                if not title or not offer_url:
-                    continue
-
-                if max_offer_duration_days and not self.check_date(d.get("created_time"), max_offer_duration_days):
-                    continue
-
-                offers.append(Offer(title=title, url=offer_url))
+            offers.extend(self.parse_data(data, max_offer_duration_days))
 
             next_page_url = self.get_next_page_url(data)
             if not next_page_url:
@@ -70,3 +92,59 @@ class OLX(ScraperStrategy):
 
         print(f"Scraped {len(offers)} offers")
         return offers
+
+    async def ascrape(
+            self,
+            url: str,
+            max_offer_duration_days: Optional[int] = None,
+            client: Optional[httpx.AsyncClient] = None,
+    ) -> List[Optional[Offer]]:
+        """
+        Scrape job offers from OLX website without blocking the event loop.
+
+        Args:
+            url (str): The base URL to start scraping from.
+            max_offer_duration_days
+            client (httpx.AsyncClient): The client shared by all async scrapers in a run.
+        Returns:
+            List[Optional[Offer]]: A list of scraped offer inputs.
+        """
+        offers = [offer async for page in self.astream(url, max_offer_duration_days, client) for offer in page]
+        print(f"Scraped {len(offers)} offers")
+        return offers
+
+    async def astream(
+            self,
+            url: str,
+            max_offer_duration_days: Optional[int] = None,
+            client: Optional[httpx.AsyncClient] = None,
+    ) -> AsyncIterator[List[Optional[Offer]]]:
+        """
+        Scrape job offers from OLX website page by page.
+
+        Args:
+            url (str): The base URL to start scraping from.
+            max_offer_duration_days
+            client (httpx.AsyncClient): The client shared by all async scrapers in a run.
+        Yields:
+            List[Optional[Offer]]: The scraped offer inputs of one page.
+        """
+        base_url = url
+
+        while True:
+            response = await async_get_request(client, base_url)
+            if not response:
+                break
+
+            data = response.json()
+
+            if not data:
+                break
+
+            yield self.parse_data(data, max_offer_duration_days)
+
+            next_page_url = self.get_next_page_url(data)
+            if not next_page_url:
+                break
+
+            base_url = next_page_url
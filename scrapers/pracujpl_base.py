@@ -1,13 +1,32 @@
-from typing import List, Optional
+from concurrent.futures import Future
+from typing import List, Optional, Iterator, Callable, Tuple
 
-from bs4 import BeautifulSoup
+import requests
 
 from schemas.offer import Offer
-from utils.get_driver import get_driver
+from utils.html_parser import Strainer
+from utils.detail_fetcher import get_detail_fetcher
+from utils.http_client import get_http_client
+from enums.browser_profile import BrowserProfileEnum
+from utils.driver_pool import get_driver_pool
 from .abc.scraper_strategy import ScraperStrategy
+from .abc.streaming_scraper_strategy import StreamingScraperStrategy
+from .pracujpl_document import PracujPlDocument
 
 
-class PracujPlBase(ScraperStrategy):
+class PracujPlBase(ScraperStrategy, StreamingScraperStrategy):
+
+    # Sections of a job page read by process_job_link, set by the site strategies
+    JOB_PAGE_STRAINER: Strainer
+    # Section of a job page listing the requirements, and the classes of its requirement items
+    REQUIREMENTS_SECTION: Strainer
+    REQUIREMENT_CLASSES: Tuple[str, ...]
+
+    # Chrome profile of browsers leased from the driver pool
+    browser_profile = BrowserProfileEnum.PERFORMANCE
+
+    # Set by Scraper in incremental crawl mode, detail pages of seen offers are not fetched again
+    is_seen: Optional[Callable[[str], bool]] = None
 
     @staticmethod
     def remove_search_id(url: str) -> str:
@@ -15,32 +34,107 @@ class PracujPlBase(ScraperStrategy):
         url_parts = url.split("?")
         return url_parts[0]
 
+    def split_known_links(self, links: List[Tuple[str, str]]) -> Tuple[List[Offer], List[Tuple[str, str]]]:
+        """
+        Separates links of already seen offers, so their detail pages are not fetched.
+
+        Args:
+            links (List[Tuple[str, str]]): The (title, url) pairs found on a listing page.
+
+        Returns:
+            Tuple[List[Offer], List[Tuple[str, str]]]: Offers built from the listing only for
+                seen links, and the links which still need their detail page fetched.
+        """
+        if self.is_seen is None:
+            return [], links
+
+        known_offers, new_links = [], []
+        for title, url in links:
+            processed_url = self.remove_search_id(url)
+            if self.is_seen(processed_url):
+                known_offers.append(Offer(title=title.replace("Zobacz ofertę ", ""), url=processed_url))
+            else:
+                new_links.append((title, url))
+
+        print(f"Skipped {len(known_offers)} known offers")
+        return known_offers, new_links
+
+    def submit_job_links(self, document: PracujPlDocument) -> Tuple[List[Offer], List[Future]]:
+        """
+        Submits the job pages of new offers on a listing page to the run-wide detail fetcher.
+
+        Args:
+            document (PracujPlDocument): The parsed listing page.
+
+        Returns:
+            Tuple[List[Offer], List[Future]]: Offers built from the listing only for seen links,
+                and the futures of the offers built from the job pages of the other links.
+        """
+        known_offers, links = self.split_known_links(document.get_offer_links())
+        fetcher = get_detail_fetcher()
+        return known_offers, [fetcher.submit(url, self.process_job_link, title, url) for title, url in links]
+
     @staticmethod
-    def get_max_page_number(content: str) -> int:
+    def collect_offers(known_offers: List[Offer], futures: List[Future]) -> List[Optional[Offer]]:
         """
-        Retrieves the maximum page number from the HTML content.
+        Waits for the job pages of a listing page and gathers its offers.
 
         Args:
-            content (str): The HTML content containing pagination information.
+            known_offers (List[Offer]): Offers built from the listing only.
+            futures (List[Future]): The futures of the offers built from the job pages.
 
         Returns:
-            int: The maximum page number.
+            List[Optional[Offer]]: A list of parsed offer inputs.
         """
-        try:
-            soup = BeautifulSoup(content, "html.parser")
-            max_page_element = soup.find(
-                "span", {"data-test": "top-pagination-max-page-number"}
-            )
-            if max_page_element:
-                print(f"max_page: {max_page_element}")
-                return int(max_page_element.text)
-        except Exception as e:
-            print(e)
-
-        return 1
-
-    def parse_data(self, content: str) -> List[Optional[Offer]]:
-        pass
+        parsed_offers = list(known_offers)
+        for future in futures:
+            try:
+                parsed_offers.append(future.result())
+            except Exception as e:
+                print(f"Error processing job link: {e}")
+
+        print(f"Parsed {len(parsed_offers)} offers")
+        return parsed_offers
+
+    def parse_data(self, document: PracujPlDocument) -> List[Optional[Offer]]:
+        """
+        Parses job offers from a listing page, fetching the job page of every new offer.
+
+        Args:
+            document (PracujPlDocument): The parsed listing page.
+
+        Returns:
+            List[Optional[Offer]]: A list of parsed offer inputs.
+        """
+        return self.collect_offers(*self.submit_job_links(document))
+
+    def process_job_link(self, title: str, url: str) -> Offer:
+        """
+        Builds a job offer from its job page.
+
+        Args:
+            title (str): The title of the offer link.
+            url (str): The URL of the job page.
+
+        Returns:
+            Offer: The parsed offer input.
+
+        Raises:
+            ValueError: If the job page could not be fetched.
+        """
+        # Remove 'Zobacz oferte' from title if present
+        clean_title = title.replace("Zobacz ofertę ", "")
+        document = self.get_job_page(url)
+        if document is None:
+            raise ValueError(f"No content of job page {url}")
+
+        processed_url = self.remove_search_id(url)
+        return Offer(
+            title=clean_title,
+            url=processed_url,
+            contract_type=document.get_contract_type(),
+            requirements=document.get_requirements(self.REQUIREMENTS_SECTION, self.REQUIREMENT_CLASSES),
+        )
 
     @staticmethod
     def close_modal(driver) -> None:
@@ -49,8 +143,23 @@ class PracujPlBase(ScraperStrategy):
     def get_page_content(self, driver, base_url: str) -> Optional[str]:
         pass
 
-    def get_job_page_content(self, url: str) -> Optional[str]:
-        pass
+    def get_job_page(self, url: str) -> Optional[PracujPlDocument]:
+        """
+        Fetches a job page given its URL and parses the sections read by process_job_link.
+
+        Args:
+            url (str): The URL of the job page.
+
+        Returns:
+            Optional[PracujPlDocument]: The parsed sections of the page, or None if the request fails.
+        """
+        try:
+            response = get_http_client().get(url)
+            response.raise_for_status()  # Raise an error for bad responses
+            return PracujPlDocument.from_response(response, self.JOB_PAGE_STRAINER)
+        except requests.RequestException as e:
+            print(f"Error fetching job page content from {url}: {e}")
+            return None
 
     def scrape(self, url: str, max_offer_duration_days: Optional[int] = None) -> List[Optional[Offer]]:
         """
@@ -62,38 +171,63 @@ class PracujPlBase(ScraperStrategy):
         Returns:
             List[Optional[Offer]]: A list of scraped offer inputs.
         """
-        offers = []
-        base_url = url
-
-        print("before get_driver")
-        driver = get_driver()
-
-        page_content = self.get_page_content(driver, base_url)
-        if not page_content:
-            print("no page content")
-            return []
+        offers = [offer for page in self.stream(url, max_offer_duration_days) for offer in page]
+        print(f"Parsed {len(offers)} offers")
+        return offers
 
-        print("before parsed_offers in pracujpl_base.py")
-        # print(f"page content: {page_content}")
-        try:
-            parsed_offers = self.parse_data(page_content)
-            offers.extend(parsed_offers)
-        except Exception as e:
-            print(f"Error calling parse_data in base: {e}")
+    def stream(self, url: str, max_offer_duration_days: Optional[int] = None) -> Iterator[List[Optional[Offer]]]:
+        """
+        Scrapes job offers from ITPracujPL website page by page.
 
-        max_page = self.get_max_page_number(page_content)
-        for page in range(2, max_page + 1):
-            url = f"{base_url}&pn={page}"
+        Args:
+            url (str): The base URL to start scraping from.
+            max_offer_duration_days
+        Yields:
+            List[Optional[Offer]]: The scraped offer inputs of one page.
+        """
+        base_url = url
 
-            page_content = self.get_page_content(driver, url)
+        with get_driver_pool().lease(self.browser_profile) as driver:
+            page_content = self.get_page_content(driver, base_url)
             if not page_content:
-                break
-
+                print("no page content")
+                return
+
+            print("before parsed_offers in pracujpl_base.py")
+            # print(f"page content: {page_content}")
+            # The listing page is parsed once, for its offers and its pagination
+            document = PracujPlDocument.from_listing(page_content)
+            max_page = document.get_max_page_number()
+
+            # Job pages of a listing page are fetched while the next listing page loads,
+            # the offers of a page are yielded once its job pages are fetched
+            submitted: Optional[Tuple[List[Offer], List[Future]]] = None
             try:
-                parsed_offers = self.parse_data(page_content)
-                offers.extend(parsed_offers)
-            except Exception as e:
-                print(f"Error calling parse_data on page in base: {e}")
-
-        print(f"Parsed {len(offers)} offers")
-        return offers
+                try:
+                    submitted = self.submit_job_links(document)
+                except Exception as e:
+                    print(f"Error calling parse_data in base: {e}")
+
+                for page in range(2, max_page + 1):
+                    url = f"{base_url}&pn={page}"
+
+                    page_content = self.get_page_content(driver, url)
+                    if submitted is not None:
+                        yield self.collect_offers(*submitted)
+                        submitted = None
+                    if not page_content:
+                        break
+
+                    try:
+                        submitted = self.submit_job_links(PracujPlDocument.from_listing(page_content))
+                    except Exception as e:
+                        print(f"Error calling parse_data on page in base: {e}")
+
+                if submitted is not None:
+                    yield self.collect_offers(*submitted)
+                    submitted = None
+            finally:
+                # Job pages of a page which will not be yielded, when streaming is stopped early
+                if submitted is not None:
+                    for future in submitted[1]:
+                        future.cancel()
@@ -0,0 +1,117 @@
+from typing import List, Optional, Sequence, Tuple, Union
+
+from bs4 import BeautifulSoup
+
+from utils.html_parser import Strainer, parse_html, parse_response
+
+
+class PracujPlDocument:
+    """
+    A page of pracuj.pl or it.pracuj.pl parsed once and shared by every extractor of the strategies.
+
+    Only the parts of the page read by the extractors are parsed, the offer links and the
+    pagination of listing pages, and the sections given by the strategy of job pages.
+
+    Attributes:
+        soup (BeautifulSoup): The parsed parts of the page.
+    """
+
+    # Parts of a listing page read by get_offer_links and get_max_page_number
+    LISTING_STRAINER = Strainer(attrs={"data-test": ["link-offer", "top-pagination-max-page-number"]})
+
+    def __init__(self, soup: BeautifulSoup) -> None:
+        """
+        Initializes the PracujPlDocument.
+
+        Args:
+            soup (BeautifulSoup): The parsed parts of the page.
+        """
+        self.soup = soup
+
+    @classmethod
+    def from_listing(cls, content: Union[str, bytes]) -> "PracujPlDocument":
+        """
+        Parses the offer links and the pagination of a listing page.
+
+        Args:
+            content (Union[str, bytes]): The HTML content of the listing page.
+
+        Returns:
+            PracujPlDocument: The parsed listing page.
+        """
+        return cls(parse_html(content, cls.LISTING_STRAINER))
+
+    @classmethod
+    def from_response(cls, response, parse_only: Strainer) -> "PracujPlDocument":
+        """
+        Parses the given sections of a job page from the raw response body.
+
+        Args:
+            response (Union[requests.Response, httpx.Response]): The response of the job page.
+            parse_only (Strainer): The sections read by the strategy.
+
+        Returns:
+            PracujPlDocument: The parsed job page.
+        """
+        return cls(parse_response(response, parse_only))
+
+    def get_offer_links(self) -> List[Tuple[str, str]]:
+        """
+        Retrieves the offer links of a listing page.
+
+        Returns:
+            List[Tuple[str, str]]: The (title, url) pairs of the offers.
+        """
+        offer_links = self.soup.find_all("a", attrs={"data-test": "link-offer"})
+        print(f"Found {len(offer_links)} offers")
+        return [
+            (link.get("title"), link.get("href"))
+            for link in offer_links if link.get("title") and link.get("href")
+        ]
+
+    def get_max_page_number(self) -> int:
+        """
+        Retrieves the maximum page number of a listing page.
+
+        Returns:
+            int: The maximum page number, 1 if the page has no pagination.
+        """
+        try:
+            max_page_element = self.soup.find("span", {"data-test": "top-pagination-max-page-number"})
+            if max_page_element:
+                print(f"max_page: {max_page_element}")
+                return int(max_page_element.text)
+        except Exception as e:
+            print(e)
+
+        return 1
+
+    def get_contract_type(self) -> Optional[str]:
+        """
+        Retrieves the contract type of a job page.
+
+        Returns:
+            Optional[str]: The contract type, None if the page does not list it.
+        """
+        contract_type_element = self.soup.find("li", attrs={"data-test": "sections-benefit-contracts"})
+        if contract_type_element:
+            contract_type_div = contract_type_element.find("div", attrs={"data-test": "offer-badge-title"})
+            if contract_type_div:
+                return contract_type_div.get_text(strip=True)
+        return None
+
+    def get_requirements(self, section: Strainer, classes: Sequence[str]) -> List[str]:
+        """
+        Retrieves the job requirements of a job page.
+
+        Args:
+            section (Strainer): The section listing the requirements.
+            classes (Sequence[str]): The classes of the list items holding a requirement.
+
+        Returns:
+            List[str]: The job requirements.
+        """
+        requirements_section = self.soup.find(section.name, attrs=section.attrs)
+        if not requirements_section:
+            return []
+        return [li.get_text(strip=True) for li in requirements_section.find_all("li", class_=list(classes))]
@@ -1,14 +1,17 @@
-from typing import Optional, List
+from typing import Optional, List, AsyncIterator
 
-from bs4 import BeautifulSoup
+import httpx
 
 from schemas.offer import Offer
+from utils.async_request import async_get_request
 from utils.get_request import get_request
+from utils.html_parser import parse_response
+from .abc.async_scraper_strategy import AsyncScraperStrategy
 from .abc.scraper_strategy import ScraperStrategy
 from datetime import datetime, timedelta
 
 
-class Useme(ScraperStrategy):
+class Useme(ScraperStrategy, AsyncScraperStrategy):
     """
     A class implementing the scraping strategy for Useme website.
     """
@@ -87,7 +90,7 @@ class Useme(ScraperStrategy):
             if not response:
                 break
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = parse_response(response)
 
             jobs_div = soup.find_all("article", class_="job")
             print(f"Found {len(jobs_div)} jobs")
@@ -105,3 +108,67 @@ class Useme(ScraperStrategy):
 
         print(f"Parsed {len(offers)} offers")
         return offers
+
+    async def ascrape(
+            self,
+            url: str,
+            max_offer_duration_days: Optional[int] = None,
+            client: Optional[httpx.AsyncClient] = None,
+    ) -> List[Optional[Offer]]:
+        """
+        Scrape job offers from Useme website without blocking the event loop.
+
+        Args:
+            url (str): The base URL to start scraping from.
+            max_offer_duration_days
+            client (httpx.AsyncClient): The client shared by all async scrapers in a run.
+        Returns:
+            List[Optional[Offer]]: A list of scraped offer inputs.
+        """
+        offers = [offer async for page in self.astream(url, max_offer_duration_days, client) for offer in page]
+        print(f"Parsed {len(offers)} offers")
+        return offers
+
+    async def astream(
+            self,
+            url: str,
+            max_offer_duration_days: Optional[int] = None,
+            client: Optional[httpx.AsyncClient] = None,
+    ) -> AsyncIterator[List[Optional[Offer]]]:
+        """
+        Scrape job offers from Useme website page by page.
+
+        The next page URL is only known after parsing the current page, so pages are
+        requested one by one while other scrapers share the event loop.
+
+        Args:
+            url (str): The base URL to start scraping from.
+            max_offer_duration_days
+            client (httpx.AsyncClient): The client shared by all async scrapers in a run.
+        Yields:
+            List[Optional[Offer]]: The scraped offer inputs of one page.
+        """
+        base_url = url
+
+        while True:
+            response = await async_get_request(client, url)
+            if not response:
+                break
+
+            soup = parse_response(response)
+
+            jobs_div = soup.find_all("article", class_="job")
+            print(f"Found {len(jobs_div)} jobs")
+
+            offers = []
+            for job in jobs_div:
+                parsed_offer = self.parse_offer(job, max_offer_duration_days)
+                if parsed_offer:
+                    offers.append(parsed_offer)
+            yield offers
+
+            next_page_url = self.get_next_page_url(soup, base_url)
+            if not next_page_url:
+                break
+
+            url = next_page_url
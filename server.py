@@ -8,18 +8,27 @@ if export_type != "db":
 
 from fastapi import FastAPI, Request, Depends, Query
 from config.database import engine
-from models.offer import Offer
+from models.schema import create_schema
+from enums.sort_by import OfferSortEnum
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response, StreamingResponse
 from sqlalchemy.orm import Session
 from service.offer_service import OfferService
-from config.database import get_db
-from typing import Optional
-from schemas.offer_status import OfferStatusUpdate
+from config.database import get_db, SessionLocal
+from typing import Iterator, Optional
+import orjson
+from schemas.offer_status import OfferStatusUpdate, OfferStatusBulkUpdate
+from utils.lru_cache import LRUCache
 
 
-Offer.metadata.create_all(bind=engine)
+create_schema(engine)
+
+# Offers serialized and sent at once by the NDJSON export
+NDJSON_BATCH_SIZE = 1000
+
+# Rendered listing pages, keyed by the request parameters and the data version
+page_cache = LRUCache(maxsize=128)
 
 app = FastAPI(
     debug=True,  # Always set to True because this app works only in local mode
@@ -37,35 +46,132 @@ def update_check_status(data: OfferStatusUpdate, session: Session = Depends(get_
     return offer_service.change_check_status(data.offer_id, data.status)
 
 
+@app.post("/offer_status/bulk")
+def update_check_status_bulk(data: OfferStatusBulkUpdate, session: Session = Depends(get_db)):
+    offer_service = OfferService(session)
+    return offer_service.change_check_status_bulk(data.offer_ids, data.status)
+
+
+def get_etag(data_version: int) -> str:
+    """
+    Builds the ETag of a listing page, which is valid as long as the offers do not change.
+
+    Args:
+        data_version (int): The current data version.
+
+    Returns:
+        str: The quoted entity tag.
+    """
+    return f'"offers-{data_version}"'
+
+
 @app.get("/", response_class=HTMLResponse)
 def get_all(
         request: Request,
         session: Session = Depends(get_db),
-        page: int = Query(1),
-        page_limit: int = Query(50),
+        page_limit: int = Query(50, ge=1, le=500),
         query: Optional[str] = Query(None),
         tag: Optional[str] = Query(None),
+        sort_by: Optional[OfferSortEnum] = Query(None),
+        after: Optional[int] = Query(None),
+        before: Optional[int] = Query(None),
 ):
 
     offer_service = OfferService(session)
 
-    offers = offer_service.get_all(
-        page=page,
+    data_version = offer_service.get_data_version()
+    etag = get_etag(data_version)
+    # Make the browser revalidate every time, so checked offers are never shown from a stale copy
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+
+    key = (str(request.base_url), page_limit, query, tag, sort_by, after, before, data_version)
+    content = page_cache.get(key)
+
+    if content is None:
+        offers = offer_service.get_all(
+            page_limit=page_limit,
+            query=query,
+            tag=tag,
+            sort_by=sort_by,
+            after=after,
+            before=before,
+        )
+
+        tags = offer_service.get_unique_tags()
+
+        content = templates.get_template("get_all.html").render(
+            request=request,
+            offers=offers,
+            tags=tags,
+        )
+        page_cache.set(key, content)
+
+    return HTMLResponse(content, headers=headers)
+
+
+@app.get("/api/offers", response_class=ORJSONResponse)
+def get_offers(
+        session: Session = Depends(get_db),
+        page_limit: int = Query(50, ge=1, le=500),
+        query: Optional[str] = Query(None),
+        tag: Optional[str] = Query(None),
+        sort_by: Optional[OfferSortEnum] = Query(None),
+        after: Optional[int] = Query(None),
+        before: Optional[int] = Query(None),
+):
+    offer_service = OfferService(session)
+
+    # Offers are plain column dictionaries, serialized by orjson without a Pydantic model per row
+    page = offer_service.get_page(
         page_limit=page_limit,
         query=query,
         tag=tag,
+        sort_by=sort_by,
+        after=after,
+        before=before,
     )
 
-    tags = offer_service.get_unique_tags()
+    return ORJSONResponse(page)
 
-    return templates.TemplateResponse(
-        request=request,
-        name="get_all.html",
-        context={
-            "offers": offers,
-            "tags": tags,
-        }
-    )
+
+def stream_offers_ndjson(query: Optional[str], tag: Optional[str]) -> Iterator[bytes]:
+    """
+    Serializes matching offers as newline delimited JSON, NDJSON_BATCH_SIZE lines per chunk.
+
+    The generator opens its own session, a session from get_db would be closed
+    before the response finishes streaming.
+
+    Args:
+        query (str, optional): A search string to filter offers by title.
+        tag (str, optional): The tag to filter offers by.
+
+    Yields:
+        bytes: A chunk of NDJSON lines.
+    """
+    session = SessionLocal()
+    try:
+        lines = []
+        for row in OfferService(session).iter_rows(query, tag, NDJSON_BATCH_SIZE):
+            lines.append(orjson.dumps(row))
+            if len(lines) >= NDJSON_BATCH_SIZE:
+                yield b"\n".join(lines) + b"\n"
+                lines = []
+
+        if lines:
+            yield b"\n".join(lines) + b"\n"
+    finally:
+        session.close()
+
+
+@app.get("/api/offers.ndjson")
+def export_offers(
+        query: Optional[str] = Query(None),
+        tag: Optional[str] = Query(None),
+):
+    return StreamingResponse(stream_offers_ndjson(query, tag), media_type="application/x-ndjson")
 
 
 if __name__ == "__main__":
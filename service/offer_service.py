@@ -1,13 +1,14 @@
-from typing import Optional, List
+from typing import Any, Dict, Iterator, Optional, List
 
 from sqlalchemy.orm import Session
 
 from enums.sort_by import OfferSortEnum
 from repository.offer_repository import OfferRepository
-from schemas.offer import Offer, OfferListOutput
+from schemas.offer import Offer, OfferListOutput, OfferBulkCreateOutput
 
 from fastapi import HTTPException
 
+from schemas.offer_status import OfferStatusBulkOutput
 from schemas.tag import TagOutput
 
 
@@ -21,53 +22,112 @@ class OfferService:
         """
         self.repository = OfferRepository(session)
 
-    def create(self, data: Offer, website: str, tag: Optional[str]) -> None:
+    def bulk_create(self, data: List[Offer], website: str, tag: Optional[str]) -> OfferBulkCreateOutput:
         """
-        Creates a new offer in the database, checking for duplicates first.
+        Creates a batch of offers in the database with a single insert, skipping duplicates.
 
         Args:
-            data (Offer): The offer data to be saved.
-            website (str): The website where the offer was found.
+            data (List[Offer]): The offers to be saved.
+            website (str): The website where the offers were found.
+            tag (str): The tag associated with the offers.
 
         Returns:
-            None
+            OfferBulkCreateOutput: The numbers of created and skipped offers.
         """
-        if self.repository.offer_exists_by_url(data.url):
-            print(data.url)
-            print("Offer exists in database")
-            return
+        if not data:
+            return OfferBulkCreateOutput()
 
-        self.repository.create(data, website, tag)
-        print("Offer created")
-        return
+        inserted = self.repository.bulk_create(data, website, tag)
+        result = OfferBulkCreateOutput(inserted=inserted, skipped=len(data) - inserted)
+        print(f"{result.inserted} offers created, {result.skipped} offers exist in database")
+        return result
 
     def get_all(
             self,
-            page: int = 1,
             page_limit: int = 50,
             query: str = None,
             tag: Optional[str] = None,
+            sort_by: Optional[OfferSortEnum] = None,
+            after: Optional[int] = None,
+            before: Optional[int] = None,
     ) -> OfferListOutput:
         """
         Retrieves a paginated list of offers with filtering and sorting options using the OfferRepository.
 
         Args:
-            page (int, optional): The current page number (defaults to 1).
             page_limit (int, optional): The number of offers per page (defaults to 50).
             query (str, optional): A search string to filter offers by title.
-            sort_by (OfferSortEnum, optional): The sorting criteria for offers (defaults to newest).
+            tag (str, optional): The tag to filter offers by.
+            sort_by (OfferSortEnum, optional): The sorting criteria for offers (defaults to relevance
+                when searching, newest otherwise).
+            after (int, optional): The next_cursor of the previous page.
+            before (int, optional): The prev_cursor of the next page.
 
         Returns:
-            OfferListOutput: An object containing the list of offers, pagination information,
-                             and total number of offers.
+            OfferListOutput: An object containing the list of offers, pagination cursors,
+                             and total number of matching offers.
         """
         return self.repository.get_all(
-            page,
             page_limit,
             query,
-            tag
+            tag,
+            sort_by,
+            after,
+            before,
         )
 
+    def get_page(
+            self,
+            page_limit: int = 50,
+            query: str = None,
+            tag: Optional[str] = None,
+            sort_by: Optional[OfferSortEnum] = None,
+            after: Optional[int] = None,
+            before: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Retrieves a page of offers as plain dictionaries using the OfferRepository, for JSON responses.
+
+        Args:
+            page_limit (int, optional): The number of offers per page (defaults to 50).
+            query (str, optional): A search string to filter offers by title.
+            tag (str, optional): The tag to filter offers by.
+            sort_by (OfferSortEnum, optional): The sorting criteria for offers (defaults to relevance
+                when searching, newest otherwise).
+            after (int, optional): The next_cursor of the previous page.
+            before (int, optional): The prev_cursor of the next page.
+
+        Returns:
+            Dict[str, Any]: The fields of OfferListOutput, with the offers as dictionaries of their columns.
+        """
+        return self.repository.get_page(
+            page_limit,
+            query,
+            tag,
+            sort_by,
+            after,
+            before,
+        )
+
+    def iter_rows(
+            self,
+            query: Optional[str] = None,
+            tag: Optional[str] = None,
+            batch_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterates over all offers matching the filters as plain dictionaries using the OfferRepository.
+
+        Args:
+            query (str, optional): A search string to filter offers by title.
+            tag (str, optional): The tag to filter offers by.
+            batch_size (int, optional): The number of rows fetched at once.
+
+        Yields:
+            Dict[str, Any]: The columns of one offer.
+        """
+        return self.repository.iter_rows(query, tag, batch_size)
+
     def change_check_status(self, _id: int, status: bool) -> bool:
         """
         Updates the "checked" status of an offer, raising an exception if the offer is not found.
@@ -84,6 +144,19 @@ class OfferService:
 
         return self.repository.change_check_status(_id, status)
 
+    def change_check_status_bulk(self, ids: List[int], status: bool) -> OfferStatusBulkOutput:
+        """
+        Updates the "checked" status of many offers at once, ignoring IDs which do not exist.
+
+        Args:
+            ids (List[int]): The IDs of the offers to update.
+            status (bool): The new checked status (True or False).
+
+        Returns:
+            OfferStatusBulkOutput: The number of updated offers.
+        """
+        return OfferStatusBulkOutput(updated=self.repository.change_check_status_bulk(ids, status))
+
     def get_unique_tags(self) -> List[TagOutput]:
         """
         Retrieves a list of unique tags from the OfferRepository.
@@ -94,3 +167,12 @@ class OfferService:
         return self.repository.get_unique_tags()
 
 
+
+    def get_data_version(self) -> int:
+        """
+        Retrieves the version of the offers data, which changes whenever an offer is saved, updated or deleted.
+
+        Returns:
+            int: The current data version.
+        """
+        return self.repository.get_data_version()
@@ -1,10 +1,16 @@
 $(document).ready(function() {
+    // Status changes waiting to be sent, offer id -> checked
+    var pendingStatuses = {};
+    var flushTimer = null;
+    // Rapid toggles within this time are sent together
+    var FLUSH_DELAY_MS = 300;
+
     $('#checkAll').change(function() {
         var isChecked = $(this).prop('checked');
         $('.offer-checkbox').prop('checked', isChecked);
         $('.offer-checkbox').each(function() {
             var offerId = $(this).data('id');
-            updateOfferStatus(offerId, isChecked);
+            queueOfferStatus(offerId, isChecked);
         });
     });
 
@@ -12,7 +18,7 @@ $(document).ready(function() {
         updateCheckStatus();
         var offerId = $(this).data('id');
         var isChecked = $(this).prop('checked');
-        updateOfferStatus(offerId, isChecked);
+        queueOfferStatus(offerId, isChecked);
     });
 
     function updateCheckStatus() {
@@ -26,12 +32,42 @@ $(document).ready(function() {
         $('#checkAll').prop('checked', allChecked);
     }
 
-    function updateOfferStatus(offerId, isChecked) {
+    function queueOfferStatus(offerId, isChecked) {
+        // A later toggle of the same offer replaces the earlier one
+        pendingStatuses[offerId] = isChecked;
+        clearTimeout(flushTimer);
+        flushTimer = setTimeout(function() {
+            flushOfferStatuses(false);
+        }, FLUSH_DELAY_MS);
+    }
+
+    function flushOfferStatuses(useBeacon) {
+        clearTimeout(flushTimer);
+        var offerIds = {true: [], false: []};
+        $.each(pendingStatuses, function(offerId, isChecked) {
+            offerIds[isChecked].push(Number(offerId));
+        });
+        pendingStatuses = {};
+
+        $.each([true, false], function(_, isChecked) {
+            if (!offerIds[isChecked].length) {
+                return;
+            }
+            if (useBeacon) {
+                var data = JSON.stringify({offer_ids: offerIds[isChecked], status: isChecked});
+                navigator.sendBeacon('/offer_status/bulk', new Blob([data], {type: 'application/json'}));
+            } else {
+                updateOfferStatuses(offerIds[isChecked], isChecked);
+            }
+        });
+    }
+
+    function updateOfferStatuses(offerIds, isChecked) {
         $.ajax({
-            url: '/offer_status',
+            url: '/offer_status/bulk',
             type: 'POST',
             contentType: 'application/json',
-            data: JSON.stringify({offer_id: offerId, status: isChecked}),
+            data: JSON.stringify({offer_ids: offerIds, status: isChecked}),
             success: function(response) {
                 console.log(response);
             },
@@ -40,4 +76,9 @@ $(document).ready(function() {
             }
         });
     }
+
+    // Send changes still waiting when the user leaves the page
+    $(window).on('pagehide', function() {
+        flushOfferStatuses(true);
+    });
 });
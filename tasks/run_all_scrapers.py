@@ -1,14 +1,126 @@
-import time
-from typing import List, Optional, Dict
-import requests
-from config.database import get_db
-from export.googlesheet import GoogleSheet
+import asyncio
+import queue
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Dict, Set
+from urllib.parse import urlparse
+
+import httpx
+from export.sink import OfferSink, get_sink
+from export.webhook import send_to_webhook
+from schemas.offer import Offer
 from scrapers.abc.scraper import Scraper
+from utils.async_request import get_async_client
+from utils.detail_fetcher import open_detail_fetcher, close_detail_fetcher
+from utils.driver_pool import open_driver_pool, close_driver_pool
+from utils.event_loop_thread import EventLoopThread
+from utils.html_parser import set_html_parser
 from utils.map_url_to_scraper import url_to_scraper
-from utils.urls_to_skip import get_urls_to_skip
+from utils.seen_urls import SeenUrlStore
 from utils.validate_title_keywords import check_title
-from export.excel import ExcelWriter
-from service.offer_service import OfferService
+
+# Maximum number of scraped pages waiting for export, scrapers pause when it is reached
+PAGE_QUEUE_SIZE = 32
+# Number of accepted offers sent to the webhook in one request
+WEBHOOK_BATCH_SIZE = 100
+
+
+def get_domain(url: str) -> str:
+    """
+    Extracts the domain used to group websites for the per-domain worker limit.
+
+    Args:
+        url (str): The website URL.
+
+    Returns:
+        str: The network location of the URL.
+    """
+    return urlparse(url).netloc
+
+
+def put_page(pages: queue.Queue, stop: threading.Event, item) -> bool:
+    """
+    Puts an item into the page queue, giving up when the run is stopped.
+
+    Args:
+        pages (queue.Queue): The queue of scraped pages.
+        stop (threading.Event): Set when the main thread no longer consumes pages.
+        item: The item to put.
+
+    Returns:
+        bool: True if the item was put, False if the run was stopped.
+    """
+    while not stop.is_set():
+        try:
+            pages.put(item, timeout=1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def scrape_website(
+        scraper: Scraper,
+        url: str,
+        max_offer_duration_days: Optional[int],
+        job: int,
+        pages: queue.Queue,
+        stop: threading.Event,
+) -> None:
+    """
+    Scrapes a single website page by page, used as a worker task by run_all_scraper.
+
+    Every page is put into the page queue as (job, offers), followed by (job, None)
+    once the website is finished.
+
+    Args:
+        scraper (Scraper): The scraper of the website.
+        url (str): The URL to scrape.
+        max_offer_duration_days (int): The maximum number of days
+        job (int): The identifier of the website in the run.
+        pages (queue.Queue): The queue of scraped pages.
+        stop (threading.Event): Set when the main thread no longer consumes pages.
+    """
+    try:
+        for page in scraper.stream(url, max_offer_duration_days):
+            if not put_page(pages, stop, (job, page)):
+                return
+    except Exception as e:
+        print(f"Failed to scrape {url}: {e}")
+    finally:
+        put_page(pages, stop, (job, None))
+
+
+async def ascrape_website(
+        scraper: Scraper,
+        url: str,
+        max_offer_duration_days: Optional[int],
+        client: httpx.AsyncClient,
+        job: int,
+        pages: queue.Queue,
+        stop: threading.Event,
+) -> None:
+    """
+    Scrapes a single website page by page with an async strategy, used as an event loop task by run_all_scraper.
+
+    Args:
+        scraper (Scraper): The scraper of the website, using an async strategy.
+        url (str): The URL to scrape.
+        max_offer_duration_days (int): The maximum number of days
+        client (httpx.AsyncClient): The client shared by all async scrapers in a run.
+        job (int): The identifier of the website in the run.
+        pages (queue.Queue): The queue of scraped pages.
+        stop (threading.Event): Set when the main thread no longer consumes pages.
+    """
+    try:
+        async for page in scraper.astream(url, max_offer_duration_days, client):
+            if not await asyncio.to_thread(put_page, pages, stop, (job, page)):
+                return
+    except Exception as e:
+        print(f"Failed to scrape {url}: {e}")
+    finally:
+        await asyncio.to_thread(put_page, pages, stop, (job, None))
 
 
 def run_all_scraper(
@@ -17,109 +129,224 @@ def run_all_scraper(
         export_type: str = "excel",  # or 'googlesheet' or 'db'
         max_offer_duration_days: Optional[int] = None,
         keywords_to_pass: List[Optional[str]] = None,
+        max_workers: int = 4,
+        max_workers_per_domain: int = 1,
+        max_known_pages: Optional[int] = None,
+        excel_monthly_files: bool = False,
+        driver_pool_size: int = 2,
+        blocked_urls: List[str] = None,
+        html_parser: Optional[str] = None,
+        detail_fetch_workers: int = 8,
+        detail_fetch_workers_per_domain: int = 4,
 ) -> None:
     """
     Runs all scrapers for the given list of websites and adds scraped data to the specified Google Sheet.
 
+    Websites are scraped concurrently, at most `max_workers` at once and at most
+    `max_workers_per_domain` against the same domain. Selenium strategies run in a
+    thread pool leasing browsers from a shared driver pool, strategies implementing
+    AsyncScraperStrategy run as tasks on one event loop sharing a single HTTP client.
+    Detail pages found by listing crawlers are fetched by one bounded stage for the
+    whole run, at most `detail_fetch_workers` at once. Scraped pages are exported in the main
+    thread as soon as they arrive, and accepted offers are sent to the webhook in
+    batches of WEBHOOK_BATCH_SIZE.
+
+    With `max_known_pages` set, a website stops paginating after that many pages in
+    a row contain only offers which were already seen, either in previous runs or
+    earlier in this run. Offers rejected by `keywords_to_pass` count as seen.
+
     Args:
         websites (List[Optional[str]]): A list of website URLs to scrape.
         worksheet_url (str) The worksheet url.
         export_type (str)
         max_offer_duration_days
         keywords_to_pass (List[Optional[str]])
+        max_workers (int): The maximum number of websites scraped at the same time.
+        max_workers_per_domain (int): The maximum number of websites from one domain scraped at the same time.
+        max_known_pages (int): Number of consecutive pages of known offers after which
+            a website stops paginating, None to scrape all pages.
+        excel_monthly_files (bool): Whether the "excel" export type saves a file per month.
+        driver_pool_size (int): The maximum number of headless browsers running at once.
+        blocked_urls (List[str]): Additional URL patterns blocked by browsers with the performance profile.
+        html_parser (str): The HTML parser backend, "lxml", "html.parser" or "selectolax",
+            None for the fastest installed one.
+        detail_fetch_workers (int): The maximum number of detail pages fetched at the same time.
+        detail_fetch_workers_per_domain (int): The maximum number of detail pages from one domain
+            fetched at the same time.
     Returns:
         None
     """
-    urls_to_skip = get_urls_to_skip()
-
     if not websites:
         print("No websites to scrape")
         return
 
-    all_offers = []
+    set_html_parser(html_parser)
+
+    max_workers = max(max_workers, 1)
+    max_workers_per_domain = max(max_workers_per_domain, 1)
 
-    for data in websites:
+    # Group websites by domain, so one domain never takes more than its share of workers
+    pending: Dict[str, deque] = defaultdict(deque)
+    for job, data in enumerate(websites):
         url = data.get("url")
         tag = data.get("tag")
 
-        offer_service = None
-        if export_type == "db":
-            offer_service = OfferService(next(get_db()))
-
         scraper_class, website = url_to_scraper(url)
         print(f"ras: {scraper_class} {website}")
         if not scraper_class:
             print("Invalid URL or website is not supported")
             continue
 
-        scraped_offers = Scraper(scraper_class).scrape(
-            url, max_offer_duration_days)
-        for offer in scraped_offers:
-            if offer.url in urls_to_skip:
-                print("Offer skipped")
-                continue
+        pending[get_domain(url)].append((job, scraper_class, website, url, tag))
 
-            if check_title(offer.title, keywords_to_pass):
-                print(f"Offer skipped: {offer.title}")
-                continue
+    sink = get_sink(export_type, worksheet_url, excel_monthly_files)
+    seen_urls = SeenUrlStore()
+    # URLs accepted in this run, they reach seen_urls once sent to the webhook
+    run_urls: Set[str] = set()
+    # URLs rejected by the title keywords in this run, they reach seen_urls at the end of the run
+    rejected_urls: Set[str] = set()
+
+    def is_seen(url: str) -> bool:
+        return url in run_urls or url in rejected_urls or url in seen_urls
 
-            all_offers.append({**offer.dict(), "tag": tag,
-                              "contract_type": offer.contract_type})
+    pages: queue.Queue = queue.Queue(maxsize=PAGE_QUEUE_SIZE)
+    stop = threading.Event()
+    running_per_domain: Dict[str, int] = defaultdict(int)
+    running: Dict[int, tuple] = {}
+    webhook_payload: List[Dict] = []
 
-            # Save data to .xlsx file
-            if export_type == "excel":
-                ew = ExcelWriter()
+    # Browsers are started on the first lease, runs without Selenium strategies start none
+    open_driver_pool(driver_pool_size, blocked_urls)
+    open_detail_fetcher(detail_fetch_workers, detail_fetch_workers_per_domain)
+    event_loop = EventLoopThread()
+    client = get_async_client()
+    executor = ThreadPoolExecutor(max_workers=max_workers)
 
-                if ew.data_exists(url=offer.url):
-                    print("Offer exists in excel")
-                    continue
+    def submit_ready() -> None:
+        for domain, websites_queue in pending.items():
+            while (
+                    websites_queue
+                    and len(running) < max_workers
+                    and running_per_domain[domain] < max_workers_per_domain
+            ):
+                job, scraper_class, website, url, tag = websites_queue.popleft()
+                scraper = Scraper(scraper_class, is_seen, max_known_pages)
+                if scraper.is_async:
+                    event_loop.submit(ascrape_website(
+                        scraper, url, max_offer_duration_days, client, job, pages, stop
+                    ))
+                else:
+                    executor.submit(
+                        scrape_website, scraper, url, max_offer_duration_days, job, pages, stop
+                    )
+                running[job] = (domain, website, tag)
+                running_per_domain[domain] += 1
 
-                ew.add_data(data=offer, website=website, tag=tag)
-                ew.save()
+    try:
+        submit_ready()
 
-            # Save data to Google Sheet
-            # This option is the slowest because of API rate limit
-            elif export_type == "googlesheet":
-                gs = GoogleSheet(worksheet_url)
+        while running:
+            job, page = pages.get()
+            domain, website, tag = running[job]
 
-                if gs.data_exists(2, offer.url):
-                    print("Offer exists in google sheet")
-                    # Rate limit Google Sheet API (60 requests per minute)
-                    time.sleep(2)
-                    continue
+            if page is None:
+                del running[job]
+                running_per_domain[domain] -= 1
+                submit_ready()
+                continue
 
-                # Rate limit Google Sheet API (60 requests per minute)
-                time.sleep(2)
+            webhook_payload.extend(
+                export_offers(page, website, tag, sink, keywords_to_pass, is_seen, run_urls, rejected_urls)
+            )
+            if len(webhook_payload) >= WEBHOOK_BATCH_SIZE:
+                flush_webhook_payload(webhook_payload, sink, seen_urls)
 
-                gs.add_data(data=offer, website=website, tag=tag)
+        flush_webhook_payload(webhook_payload, sink, seen_urls)
+        # Rejected offers count as seen, so pages of them do not keep a website paginating
+        seen_urls.add_many(rejected_urls)
+    finally:
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+        event_loop.run(client.aclose())
+        event_loop.close()
+        close_detail_fetcher()
+        close_driver_pool()
+        seen_urls.close()
+        # Last, as the sink raises if buffered offers could not be saved
+        sink.close()
 
-            # Save data to SQLite database
-            # Then you are able to run local server based on FastAPI and Jinja Template
-            elif export_type == "db" and offer_service:
-                offer_service.create(data=offer, website=website, tag=tag)
 
-            else:
-                raise ValueError("Invalid export type")
+def flush_webhook_payload(webhook_payload: List[Dict], sink: OfferSink, seen_urls: SeenUrlStore) -> None:
+    """
+    Writes the offers buffered by the sink, then sends buffered offers to the webhook and marks their URLs as seen.
 
-    # Send aggregated data to the webhook
-    json_payload = [
-        offer for offer in all_offers if offer["url"] not in urls_to_skip]
-    print(f"JSON: {json_payload}")
-    if not json_payload:
+    If the sink could not write its offers, the payload stays buffered and is retried
+    with the next batch, so offers which were not saved are not skipped in the next runs.
+
+    Args:
+        webhook_payload (List[Dict]): The buffered offers, cleared after sending.
+        sink (OfferSink): The sink of the selected export type.
+        seen_urls (SeenUrlStore): The store of URLs skipped in the next runs.
+    """
+    if not webhook_payload:
         print("No new offers to send to the webhook.")
         return
 
-    try:
-        response = requests.post(
-            "https://hook.eu2.make.com/z7gdth8t1fes8piaq7r46mcsmattmj8f",
-            json=json_payload
-        )
-        response.raise_for_status()
-        print("Data successfully sent to webhook")
-    except requests.exceptions.RequestException as e:
-        print(f"Failed to send data to webhook: {e}")
-
-    # Append newly found offer URLs to urls_to_skip.txt
-    with open("urls_to_skip.txt", "a", encoding="utf-8") as file:
-        for offer in all_offers:
-            file.write(f"{offer['url']}\n")
+    if not sink.flush():
+        print(f"Offers were not saved, {len(webhook_payload)} offers are kept for the next batch")
+        return
+
+    send_to_webhook(webhook_payload)
+
+    seen_urls.add_many(offer["url"] for offer in webhook_payload)
+    webhook_payload.clear()
+
+
+def export_offers(
+        scraped_offers: List[Optional[Offer]],
+        website: str,
+        tag: Optional[str],
+        sink: OfferSink,
+        keywords_to_pass: List[Optional[str]],
+        is_seen: Callable[[str], bool],
+        run_urls: Set[str],
+        rejected_urls: Set[str],
+) -> List[Dict]:
+    """
+    Filters offers scraped from one page and saves them to the sink.
+
+    Args:
+        scraped_offers (List[Optional[Offer]]): Offers scraped from the page.
+        website (str): The website name.
+        tag (str): The tag associated with the website.
+        sink (OfferSink): The sink of the selected export type.
+        keywords_to_pass (List[Optional[str]])
+        is_seen (Callable[[str], bool]): Checks if an offer URL was already scraped.
+        run_urls (Set[str]): URLs accepted in this run, accepted URLs are added to it.
+        rejected_urls (Set[str]): URLs rejected by the title keywords in this run, rejected URLs are added to it.
+
+    Returns:
+        List[Dict]: Offers accepted for the webhook payload.
+    """
+    accepted_offers = []
+    webhook_offers = []
+
+    for offer in scraped_offers:
+        if is_seen(offer.url):
+            print("Offer skipped")
+            continue
+
+        if check_title(offer.title, keywords_to_pass):
+            print(f"Offer skipped: {offer.title}")
+            rejected_urls.add(offer.url)
+            continue
+
+        run_urls.add(offer.url)
+        accepted_offers.append(offer)
+        webhook_offers.append({**offer.dict(), "tag": tag,
+                               "contract_type": offer.contract_type})
+
+    if accepted_offers:
+        sink.add_offers(accepted_offers, website, tag)
+
+    return webhook_offers
@@ -0,0 +1,87 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from models.offer import Offer
+from models.offer_search import get_search_terms
+from models.schema import create_schema
+from repository.offer_repository import OfferRepository
+
+TITLES = [
+    "Główny księgowy",
+    "Wdrożeniowiec systemu",
+    "C# Developer",
+    "C++ Engineer",
+    "Senior .NET Developer",
+    "ASP.NET Programista",
+    "Specjalista ds. sprzedaży",
+]
+
+
+@pytest.fixture
+def repository(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'offers.db'}")
+    create_schema(engine)
+    with Session(engine) as session:
+        session.add_all(Offer(title=title, url=f"https://example.com/{i}", page="example") for i, title in enumerate(TITLES))
+        session.commit()
+        yield OfferRepository(session)
+    engine.dispose()
+
+
+def search(repository, query):
+    page = repository.get_page(page_limit=len(TITLES), query=query)
+    assert page["total_offers"] == len(page["offers"])
+    return sorted(offer["title"] for offer in page["offers"])
+
+
+def test_folds_diacritics(repository):
+    assert search(repository, "wdrozeniowiec") == ["Wdrożeniowiec systemu"]
+
+
+def test_folds_letters_without_decomposition(repository):
+    assert search(repository, "glowny") == ["Główny księgowy"]
+    assert search(repository, "GŁÓWNY") == ["Główny księgowy"]
+    assert search(repository, "ksiegowy") == ["Główny księgowy"]
+
+
+def test_matches_prefixes(repository):
+    assert search(repository, "progr") == ["ASP.NET Programista"]
+
+
+@pytest.mark.parametrize("query, titles", [
+    ("C#", ["C# Developer"]),
+    ("c++", ["C++ Engineer"]),
+    (".NET", ["ASP.NET Programista", "Senior .NET Developer"]),
+    ("C# developer", ["C# Developer"]),
+])
+def test_matches_terms_with_symbols_exactly(repository, query, titles):
+    assert search(repository, query) == titles
+
+
+def test_sentence_dot_is_not_an_exact_term(repository):
+    assert get_search_terms("Senior.") == ('"Senior"*', ())
+    assert search(repository, "ds.") == ["Specjalista ds. sprzedaży"]
+
+
+@pytest.mark.parametrize("query", ["!!!", "#", "++", "  ?  "])
+def test_query_without_words_matches_nothing(repository, query):
+    assert search(repository, query) == []
+    assert list(repository.iter_rows(query=query)) == []
+
+
+@pytest.mark.parametrize("query", [None, "", "   "])
+def test_blank_query_matches_everything(repository, query):
+    assert search(repository, query) == sorted(TITLES)
+
+
+def test_index_follows_title_changes(repository):
+    offer = repository.session.query(Offer).filter(Offer.title == "C++ Engineer").one()
+    offer.title = "Łącznik"
+    repository.session.commit()
+    assert search(repository, "lacznik") == ["Łącznik"]
+    assert search(repository, "engineer") == []
+
+    repository.session.delete(offer)
+    repository.session.commit()
+    assert search(repository, "lacznik") == []
@@ -0,0 +1,104 @@
+import asyncio
+from typing import Optional
+
+import httpx
+
+from utils.http_client import (
+    RETRY_STATUS_CODES,
+    CONNECT_TIMEOUT,
+    READ_TIMEOUT,
+    MAX_RETRIES,
+    BACKOFF_MAX,
+    get_retry_after,
+    get_backoff_delay,
+)
+
+# Advertise brotli first, httpx decodes it transparently when the Brotli package is installed
+DEFAULT_HEADERS = {
+    "Accept-Encoding": "br, gzip, deflate",
+}
+
+
+def get_async_client(max_connections: int = 20) -> httpx.AsyncClient:
+    """
+    Creates an HTTP/2 capable async client shared by the async scraper strategies.
+
+    Connections are kept alive between requests and requests to the same host are
+    multiplexed over a single HTTP/2 connection when the server supports it.
+
+    Args:
+        max_connections (int): The maximum number of open connections.
+
+    Returns:
+        httpx.AsyncClient: The async HTTP client.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        headers=DEFAULT_HEADERS,
+        follow_redirects=True,
+        timeout=httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT),
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=30,
+        ),
+    )
+
+
+async def async_get_request(client: httpx.AsyncClient, url: str) -> Optional[httpx.Response]:
+    """
+    Sends an async GET request to the specified URL and returns the response.
+
+    Connection errors, 429 and 5xx responses are retried with the same backoff
+    policy as the shared HttpClient.
+
+    Args:
+        client (httpx.AsyncClient): The client used to send the request.
+        url (str): The URL to send the request to.
+
+    Returns:
+        httpx.Response or None: The response object if successful, None if an error occurs.
+    """
+    try:
+        response = await get_with_retries(client, url)
+        response.raise_for_status()
+
+        print(f"Successfully visited {url}")
+        return response
+
+    except Exception as e:
+        print(e)
+        print(f"Failed to visit {url}")
+        return None
+
+
+async def get_with_retries(client: httpx.AsyncClient, url: str) -> httpx.Response:
+    """
+    Sends an async GET request, retrying on connection errors, 429 and 5xx responses.
+
+    Args:
+        client (httpx.AsyncClient): The client used to send the request.
+        url (str): The URL to send the request to.
+
+    Returns:
+        httpx.Response: The last received response.
+
+    Raises:
+        httpx.TransportError: If no response was received after all retries.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            response = await client.get(url)
+        except httpx.TransportError as e:
+            if attempt == MAX_RETRIES:
+                raise
+            delay = get_backoff_delay(attempt)
+            print(f"Request to {url} failed ({e}), retrying in {delay:.1f}s")
+        else:
+            if response.status_code not in RETRY_STATUS_CODES or attempt == MAX_RETRIES:
+                return response
+            retry_after = get_retry_after(response.headers)
+            delay = min(retry_after, BACKOFF_MAX) if retry_after is not None else get_backoff_delay(attempt)
+            print(f"Received {response.status_code} from {url}, retrying in {delay:.1f}s")
+
+        await asyncio.sleep(delay)
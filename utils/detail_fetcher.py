@@ -0,0 +1,171 @@
+import atexit
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+# Maximum number of detail pages fetched at once
+DETAIL_FETCH_WORKERS = 8
+# Maximum number of detail pages fetched at once from one domain
+DETAIL_FETCH_WORKERS_PER_DOMAIN = 4
+# Maximum number of detail pages submitted per worker, submitting more waits for fetches to finish
+DETAIL_FETCH_BACKLOG_PER_WORKER = 16
+
+
+class DetailFetcher:
+    """
+    Bounded stage fetching detail pages for the whole run.
+
+    Listing crawlers submit detail pages as soon as they discover their links and keep
+    loading the next listing page while the details are fetched. At most `max_workers`
+    fetches run at once and at most `max_workers_per_domain` against the same domain,
+    the remaining ones wait in a queue per domain, so a slow domain does not hold the
+    workers of the others. Once `max_backlog` fetches are submitted, `submit` waits,
+    which pauses the crawler which discovers links faster than they are fetched.
+    """
+
+    def __init__(
+            self,
+            max_workers: int = DETAIL_FETCH_WORKERS,
+            max_workers_per_domain: int = DETAIL_FETCH_WORKERS_PER_DOMAIN,
+            max_backlog: Optional[int] = None,
+    ) -> None:
+        """
+        Initializes the DetailFetcher.
+
+        Args:
+            max_workers (int): The maximum number of detail pages fetched at once.
+            max_workers_per_domain (int): The maximum number of detail pages fetched at once from one domain.
+            max_backlog (int, optional): The maximum number of submitted fetches which did not finish,
+                DETAIL_FETCH_BACKLOG_PER_WORKER per worker if not given.
+        """
+        self.max_workers = max(max_workers, 1)
+        self.max_workers_per_domain = max(max_workers_per_domain, 1)
+        self.max_backlog = max_backlog or self.max_workers * DETAIL_FETCH_BACKLOG_PER_WORKER
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="detail-fetch")
+        self._pending: Dict[str, Deque[Tuple[Future, Callable, tuple]]] = defaultdict(deque)
+        self._running_per_domain: Dict[str, int] = defaultdict(int)
+        self._backlog = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        atexit.register(self.close)
+
+    def submit(self, url: str, fn: Callable, *args) -> Future:
+        """
+        Schedules fetching a detail page, waiting while the backlog is full.
+
+        Args:
+            url (str): The URL of the detail page, its domain is limited by max_workers_per_domain.
+            fn (Callable): The function fetching and parsing the page, called with `args`.
+            *args: The arguments of `fn`.
+
+        Returns:
+            Future: The future of the result of `fn`.
+
+        Raises:
+            RuntimeError: If the fetcher is closed.
+        """
+        future: Future = Future()
+        domain = urlparse(url).netloc
+        with self._condition:
+            while self._backlog >= self.max_backlog and not self._closed:
+                self._condition.wait()
+            if self._closed:
+                raise RuntimeError("DetailFetcher is closed")
+
+            self._backlog += 1
+            self._pending[domain].append((future, fn, args))
+            self._start_ready(domain)
+        return future
+
+    def _start_ready(self, domain: str) -> None:
+        # Called with the condition held, starts queued fetches of the domain below its limit
+        pending = self._pending[domain]
+        while pending and self._running_per_domain[domain] < self.max_workers_per_domain:
+            future, fn, args = pending.popleft()
+            if not future.set_running_or_notify_cancel():
+                self._backlog -= 1
+                self._condition.notify_all()
+                continue
+            self._running_per_domain[domain] += 1
+            self._executor.submit(self._run, domain, future, fn, args)
+
+    def _run(self, domain: str, future: Future, fn: Callable, args: tuple) -> None:
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._condition:
+                self._running_per_domain[domain] -= 1
+                self._backlog -= 1
+                if not self._closed:
+                    self._start_ready(domain)
+                self._condition.notify_all()
+
+    def close(self) -> None:
+        """Cancels the fetches which did not start and waits for the running ones."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            for pending in self._pending.values():
+                while pending:
+                    future, _, _ = pending.popleft()
+                    future.cancel()
+                    self._backlog -= 1
+            self._condition.notify_all()
+        self._executor.shutdown(wait=True)
+        atexit.unregister(self.close)
+
+
+_detail_fetcher: Optional[DetailFetcher] = None
+_detail_fetcher_lock = threading.Lock()
+
+
+def open_detail_fetcher(
+        max_workers: int = DETAIL_FETCH_WORKERS,
+        max_workers_per_domain: int = DETAIL_FETCH_WORKERS_PER_DOMAIN,
+) -> DetailFetcher:
+    """
+    Creates the DetailFetcher shared by the whole process for a run, closing the previous one.
+
+    Args:
+        max_workers (int): The maximum number of detail pages fetched at once.
+        max_workers_per_domain (int): The maximum number of detail pages fetched at once from one domain.
+
+    Returns:
+        DetailFetcher: The shared detail fetcher.
+    """
+    global _detail_fetcher
+    with _detail_fetcher_lock:
+        if _detail_fetcher is not None:
+            _detail_fetcher.close()
+        _detail_fetcher = DetailFetcher(max_workers, max_workers_per_domain)
+        return _detail_fetcher
+
+
+def get_detail_fetcher() -> DetailFetcher:
+    """
+    Returns the DetailFetcher shared by the whole process, creating one with the default limits
+    if no fetcher was opened.
+
+    A closed fetcher is returned as it is, so strategies still running after their run ended
+    fail to submit instead of starting a new fetcher.
+
+    Returns:
+        DetailFetcher: The shared detail fetcher.
+    """
+    global _detail_fetcher
+    with _detail_fetcher_lock:
+        if _detail_fetcher is None:
+            _detail_fetcher = DetailFetcher()
+        return _detail_fetcher
+
+
+def close_detail_fetcher() -> None:
+    """Closes the shared DetailFetcher if it was created, submitting to it raises until a new fetcher is opened."""
+    with _detail_fetcher_lock:
+        if _detail_fetcher is not None:
+            _detail_fetcher.close()
@@ -0,0 +1,507 @@
+import atexit
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+import psutil
+
+from enums.browser_profile import BrowserProfileEnum
+from utils.get_driver import get_driver
+
+# Maximum number of browsers running at once
+DRIVER_POOL_SIZE = 2
+# Page loads after which a browser is replaced by a fresh one
+DRIVER_MAX_PAGES = 100
+# Memory of a browser with all its processes after which it is replaced
+DRIVER_MAX_MEMORY_MB = 1024
+# Seconds a single WebDriver command may take before the browser is killed
+DRIVER_HANG_TIMEOUT = 180
+# Seconds between watchdog checks
+WATCHDOG_INTERVAL = 10
+
+
+class PooledDriver:
+    """
+    WebDriver leased from a DriverPool.
+
+    Attribute access is forwarded to the wrapped Chrome WebDriver, so strategies use
+    it like a plain driver. Calls are timed for the watchdog and page loads are counted
+    to recycle the browser. With the performance profile, the bytes transferred by
+    every loaded page are printed.
+
+    Attributes:
+        driver (webdriver.Chrome): The wrapped WebDriver.
+        profile (BrowserProfileEnum): The profile the browser was started with.
+        pages (int): The number of pages loaded by the browser.
+        busy_since (float): Monotonic time the running command started, None when idle.
+        killed (bool): Set when the watchdog killed the browser.
+    """
+
+    def __init__(self, driver, profile: BrowserProfileEnum = BrowserProfileEnum.DEFAULT) -> None:
+        """
+        Initializes the PooledDriver.
+
+        Args:
+            driver (webdriver.Chrome): The WebDriver to wrap.
+            profile (BrowserProfileEnum): The profile the browser was started with.
+        """
+        self.driver = driver
+        self.profile = profile
+        self.pages = 0
+        self.busy_since: Optional[float] = None
+        self.killed = False
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self.driver, name)
+        if not callable(attribute):
+            return attribute
+
+        def call(*args, **kwargs):
+            if name == "get":
+                self.pages += 1
+            self.busy_since = time.monotonic()
+            try:
+                result = attribute(*args, **kwargs)
+            finally:
+                self.busy_since = None
+
+            if name == "get" and self.profile == BrowserProfileEnum.PERFORMANCE:
+                self.print_transferred_bytes(*args)
+            return result
+
+        return call
+
+    def print_transferred_bytes(self, url: str) -> None:
+        """
+        Prints the bytes transferred for the current page and its resources, from the Resource Timing API.
+
+        Args:
+            url (str): The loaded URL.
+        """
+        try:
+            transferred = self.driver.execute_script(
+                "return performance.getEntriesByType('navigation')"
+                ".concat(performance.getEntriesByType('resource'))"
+                ".reduce((total, entry) => total + (entry.transferSize || 0), 0);"
+            )
+        except Exception as e:
+            print(f"Failed to read transferred bytes of {url}: {e}")
+            return
+        print(f"Loaded {url}: {transferred / 1024:.0f} KB transferred with the {self.profile.value} profile")
+
+    @property
+    def page_source(self) -> str:
+        """
+        Returns the source of the current page, timed like other commands.
+
+        Returns:
+            str: The HTML of the current page.
+        """
+        self.busy_since = time.monotonic()
+        try:
+            return self.driver.page_source
+        finally:
+            self.busy_since = None
+
+    def get_processes(self) -> List[psutil.Process]:
+        """
+        Returns the ChromeDriver process together with the browser processes it started.
+
+        Returns:
+            List[psutil.Process]: The running processes, empty if ChromeDriver has exited.
+        """
+        try:
+            process = psutil.Process(self.driver.service.process.pid)
+            return [process, *process.children(recursive=True)]
+        except (AttributeError, psutil.Error):
+            return []
+
+    def get_memory_mb(self) -> float:
+        """
+        Sums the resident memory of all processes of the browser.
+
+        Returns:
+            float: The memory in megabytes.
+        """
+        memory = 0
+        for process in self.get_processes():
+            try:
+                memory += process.memory_info().rss
+            except psutil.Error:
+                pass
+        return memory / 2 ** 20
+
+    def kill(self) -> None:
+        """Kills all processes of the browser without waiting for WebDriver to respond."""
+        self.killed = True
+        for process in self.get_processes():
+            try:
+                process.kill()
+            except psutil.Error:
+                pass
+
+    def quit(self) -> None:
+        """Closes the browser, killing it if it does not quit gracefully."""
+        if not self.killed:
+            try:
+                self.driver.quit()
+                return
+            except Exception as e:
+                print(f"Failed to quit ChromeDriver: {e}")
+        self.kill()
+
+    def reset(self) -> None:
+        """
+        Clears cookies, storage and extra windows, so the next lease starts with a clean browser.
+
+        Raises:
+            Exception: If the browser does not respond.
+        """
+        handles = self.driver.window_handles
+        for handle in handles[1:]:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        self.driver.switch_to.window(handles[0])
+        self.driver.delete_all_cookies()
+        self.driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        self.driver.get("about:blank")
+
+
+class DriverPool:
+    """
+    Process-wide pool of headless Chrome browsers shared by Selenium strategies.
+
+    Browsers are leased with `lease()`. The first lease starts the remaining browsers
+    in the background, so later strategies get a warm one. A returned browser is
+    reset, or replaced once it loaded `max_pages` pages or uses more than
+    `max_memory_mb`. A watchdog thread kills browsers stuck in a command for longer
+    than `hang_timeout`, which makes the waiting strategy fail instead of blocking
+    its worker. All browsers are closed on `close()` and at interpreter exit.
+    """
+
+    def __init__(
+            self,
+            size: int = DRIVER_POOL_SIZE,
+            max_pages: int = DRIVER_MAX_PAGES,
+            max_memory_mb: float = DRIVER_MAX_MEMORY_MB,
+            hang_timeout: float = DRIVER_HANG_TIMEOUT,
+            blocked_urls: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Initializes the DriverPool, browsers are started on the first lease.
+
+        Args:
+            size (int): The maximum number of browsers running at once.
+            max_pages (int): Page loads after which a browser is replaced.
+            max_memory_mb (float): Memory in megabytes after which a browser is replaced.
+            hang_timeout (float): Seconds a WebDriver command may take before the browser is killed.
+            blocked_urls (List[str], optional): Additional URL patterns blocked by the performance profile.
+        """
+        self.size = max(size, 1)
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self.hang_timeout = hang_timeout
+        self.blocked_urls = blocked_urls or []
+        # Idle browsers of every profile, a browser keeps the profile it was started with
+        self._idle: Dict[BrowserProfileEnum, queue.Queue] = {profile: queue.Queue() for profile in BrowserProfileEnum}
+        self._leased: List[PooledDriver] = []
+        self._count = 0
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._warmed_up = False
+
+        self._watchdog = threading.Thread(target=self.watch, name="DriverPoolWatchdog", daemon=True)
+        self._watchdog.start()
+
+        atexit.register(self.close)
+
+    def start_driver(self, profile: BrowserProfileEnum) -> PooledDriver:
+        """
+        Starts a new browser, counted against the pool size by the caller.
+
+        Args:
+            profile (BrowserProfileEnum): The browser profile.
+
+        Returns:
+            PooledDriver: The new browser.
+
+        Raises:
+            RuntimeError: If ChromeDriver could not be started.
+        """
+        driver = get_driver(profile, self.blocked_urls)
+        if driver is None:
+            with self._lock:
+                self._count -= 1
+            raise RuntimeError("Could not start ChromeDriver")
+        return PooledDriver(driver, profile)
+
+    def prewarm(self, profile: BrowserProfileEnum) -> None:
+        """
+        Starts a browser and puts it into the idle queue if the pool is not full.
+
+        Args:
+            profile (BrowserProfileEnum): The browser profile.
+        """
+        with self._lock:
+            if self._closed.is_set() or self._count >= self.size:
+                return
+            self._count += 1
+
+        try:
+            self.put_idle(self.start_driver(profile))
+        except Exception as e:
+            print(f"Failed to pre-warm ChromeDriver: {e}")
+
+    def put_idle(self, driver: PooledDriver) -> None:
+        """
+        Makes a browser available for the next lease, or quits it if the pool is closed.
+
+        Args:
+            driver (PooledDriver): The browser.
+        """
+        if self._closed.is_set():
+            self.discard(driver)
+            return
+        self._idle[driver.profile].put(driver)
+
+    def discard(self, driver: PooledDriver) -> None:
+        """
+        Quits a browser and frees its slot in the pool.
+
+        Args:
+            driver (PooledDriver): The browser.
+        """
+        driver.quit()
+        with self._lock:
+            self._count -= 1
+
+    def start_prewarm(self, count: int, profile: BrowserProfileEnum) -> None:
+        """
+        Starts browsers in background threads, so they are ready for the next leases.
+
+        Args:
+            count (int): The number of browsers to start.
+            profile (BrowserProfileEnum): The browser profile.
+        """
+        for _ in range(count):
+            threading.Thread(target=self.prewarm, args=(profile,), name="DriverPoolWarmup", daemon=True).start()
+
+    def take_idle(self, exclude: BrowserProfileEnum) -> Optional[PooledDriver]:
+        """
+        Takes an idle browser of a profile other than the given one.
+
+        Args:
+            exclude (BrowserProfileEnum): The profile to skip.
+
+        Returns:
+            Optional[PooledDriver]: The idle browser, None if there is none.
+        """
+        for profile, idle in self._idle.items():
+            if profile == exclude:
+                continue
+            try:
+                return idle.get_nowait()
+            except queue.Empty:
+                continue
+        return None
+
+    def acquire(self, profile: BrowserProfileEnum) -> PooledDriver:
+        """
+        Takes an idle browser of the profile, starting a new one while the pool is not full,
+        otherwise replaces an idle browser of another profile or waits for a browser to be returned.
+
+        Args:
+            profile (BrowserProfileEnum): The browser profile.
+
+        Returns:
+            PooledDriver: The leased browser.
+
+        Raises:
+            RuntimeError: If the pool is closed or ChromeDriver could not be started.
+        """
+        with self._lock:
+            warm_up = not self._warmed_up
+            self._warmed_up = True
+        if warm_up:
+            self.start_prewarm(self.size - 1, profile)
+
+        while True:
+            if self._closed.is_set():
+                raise RuntimeError("Driver pool is closed")
+
+            try:
+                driver = self._idle[profile].get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    can_start = self._count < self.size
+                    if can_start:
+                        self._count += 1
+
+                if can_start:
+                    driver = self.start_driver(profile)
+                else:
+                    other = self.take_idle(profile)
+                    if other is not None:
+                        # Free the slot of a browser started with another profile
+                        self.discard(other)
+                        continue
+
+                    # Recheck the pool size regularly, discarded browsers free their slot
+                    try:
+                        driver = self._idle[profile].get(timeout=1)
+                    except queue.Empty:
+                        continue
+
+            if driver.killed:
+                self.discard(driver)
+                continue
+
+            with self._lock:
+                self._leased.append(driver)
+            return driver
+
+    def release(self, driver: PooledDriver) -> None:
+        """
+        Returns a leased browser, resetting it or replacing it when it is worn out.
+
+        Args:
+            driver (PooledDriver): The leased browser.
+        """
+        with self._lock:
+            self._leased.remove(driver)
+
+        if self._closed.is_set():
+            self.discard(driver)
+            return
+
+        if driver.killed:
+            self.recycle(driver)
+            return
+
+        if driver.pages >= self.max_pages:
+            print(f"Recycling ChromeDriver after {driver.pages} pages")
+            self.recycle(driver)
+            return
+
+        memory = driver.get_memory_mb()
+        if memory > self.max_memory_mb:
+            print(f"Recycling ChromeDriver using {memory:.0f} MB")
+            self.recycle(driver)
+            return
+
+        try:
+            driver.reset()
+        except Exception as e:
+            print(f"Failed to reset ChromeDriver, recycling it: {e}")
+            self.recycle(driver)
+            return
+
+        self.put_idle(driver)
+
+    def recycle(self, driver: PooledDriver) -> None:
+        """
+        Quits a worn out browser and starts a fresh one in its place.
+
+        Args:
+            driver (PooledDriver): The browser.
+        """
+        self.discard(driver)
+        self.start_prewarm(1, driver.profile)
+
+    @contextmanager
+    def lease(self, profile: BrowserProfileEnum = BrowserProfileEnum.DEFAULT) -> Iterator[PooledDriver]:
+        """
+        Leases a browser for the duration of the with block.
+
+        Args:
+            profile (BrowserProfileEnum): The browser profile.
+
+        Yields:
+            PooledDriver: The leased browser.
+        """
+        driver = self.acquire(profile)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def watch(self) -> None:
+        """Kills leased browsers whose current command exceeded hang_timeout, until the pool is closed."""
+        while not self._closed.wait(WATCHDOG_INTERVAL):
+            with self._lock:
+                leased = list(self._leased)
+
+            now = time.monotonic()
+            for driver in leased:
+                busy_since = driver.busy_since
+                if not driver.killed and busy_since is not None and now - busy_since > self.hang_timeout:
+                    print(f"Killing ChromeDriver not responding for {now - busy_since:.0f}s")
+                    driver.kill()
+
+    def close(self) -> None:
+        """Quits all browsers, leased browsers are killed as their commands can not finish anymore."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+
+        for idle in self._idle.values():
+            while True:
+                try:
+                    self.discard(idle.get_nowait())
+                except queue.Empty:
+                    break
+
+        with self._lock:
+            leased = list(self._leased)
+        for driver in leased:
+            driver.kill()
+
+
+_driver_pool: Optional[DriverPool] = None
+_driver_pool_lock = threading.Lock()
+
+
+def open_driver_pool(size: int = DRIVER_POOL_SIZE, blocked_urls: Optional[List[str]] = None) -> DriverPool:
+    """
+    Creates the DriverPool shared by the whole process for a run, closing the previous one.
+
+    Args:
+        size (int): The number of browsers.
+        blocked_urls (List[str], optional): Additional URL patterns blocked by the performance profile.
+
+    Returns:
+        DriverPool: The shared driver pool.
+    """
+    global _driver_pool
+    with _driver_pool_lock:
+        if _driver_pool is not None:
+            _driver_pool.close()
+        _driver_pool = DriverPool(size, blocked_urls=blocked_urls)
+        return _driver_pool
+
+
+def get_driver_pool() -> DriverPool:
+    """
+    Returns the DriverPool shared by the whole process, creating one with the default settings
+    if no pool was opened.
+
+    A closed pool is returned as it is, so strategies still running after their run ended
+    fail to lease a browser instead of starting a new pool.
+
+    Returns:
+        DriverPool: The shared driver pool.
+    """
+    global _driver_pool
+    with _driver_pool_lock:
+        if _driver_pool is None:
+            _driver_pool = DriverPool()
+        return _driver_pool
+
+
+def close_driver_pool() -> None:
+    """Closes the shared DriverPool if it was created, leasing from it raises until a new pool is opened."""
+    with _driver_pool_lock:
+        if _driver_pool is not None:
+            _driver_pool.close()
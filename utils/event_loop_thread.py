@@ -0,0 +1,48 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Coroutine, Any
+
+
+class EventLoopThread:
+    """
+    Runs an asyncio event loop in a background thread.
+
+    Coroutines submitted from other threads return concurrent futures, so async
+    and thread pool tasks can be awaited together.
+    """
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def submit(self, coroutine: Coroutine) -> Future:
+        """
+        Schedules a coroutine on the event loop.
+
+        Args:
+            coroutine (Coroutine): The coroutine to run.
+
+        Returns:
+            Future: The future holding the coroutine result.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def run(self, coroutine: Coroutine) -> Any:
+        """
+        Runs a coroutine on the event loop and waits for its result.
+
+        Args:
+            coroutine (Coroutine): The coroutine to run.
+
+        Returns:
+            Any: The coroutine result.
+        """
+        return self.submit(coroutine).result()
+
+    def close(self) -> None:
+        """Stops the event loop and waits for the thread to finish."""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
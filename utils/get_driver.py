@@ -1,13 +1,38 @@
+from typing import List, Optional
+
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
 import os
 
+from enums.browser_profile import BrowserProfileEnum
+
+# Requests blocked by the performance profile, in the format of the CDP Network.setBlockedURLs command
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3",
+    "*doubleclick.net*", "*googlesyndication.com*", "*googletagmanager.com*", "*google-analytics.com*",
+    "*googleadservices.com*", "*facebook.net*", "*hotjar.com*", "*criteo.com*", "*adnxs.com*",
+]
+
 
-def get_driver():
+def get_driver(
+        profile: BrowserProfileEnum = BrowserProfileEnum.DEFAULT,
+        blocked_urls: Optional[List[str]] = None,
+):
     """
     Retrieves a WebDriver instance for Chrome browser.
 
+    The performance profile returns from `get` once the DOM is ready instead of waiting
+    for the load event, and blocks images and every request matching BLOCKED_URL_PATTERNS
+    or `blocked_urls`.
+
+    Args:
+        profile (BrowserProfileEnum): The browser profile.
+        blocked_urls (List[str], optional): Additional URL patterns blocked by the performance profile,
+            "*" matches any characters.
+
     Returns:
         webdriver.Chrome: WebDriver instance for Chrome browser.
     """
@@ -18,7 +43,22 @@ def get_driver():
             raise FileNotFoundError(f"ChromeDriver not found at {driver_path}")
         options = webdriver.ChromeOptions()
         options.add_argument("--headless")
-        options.add_argument("--disble-gpu")
-        return webdriver.Chrome(service=ChromeService(driver_path), options=options)
+        options.add_argument("--disable-gpu")
+
+        if profile == BrowserProfileEnum.PERFORMANCE:
+            options.page_load_strategy = "eager"
+            options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
+        driver = webdriver.Chrome(service=ChromeService(driver_path), options=options)
+
+        if profile == BrowserProfileEnum.PERFORMANCE:
+            try:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS + (blocked_urls or [])})
+            except Exception:
+                driver.quit()
+                raise
+
+        return driver
     except Exception as e:
         print(f"An error occured while initializing the ChromeDriver: {e}")
@@ -1,10 +1,13 @@
-import requests
+from utils.http_client import get_http_client
 
 
 def get_request(url: str):
     """
     Sends a GET request to the specified URL and returns the response.
 
+    The request goes through the shared HttpClient, so connections are reused and
+    transient failures are retried with backoff.
+
     Args:
         url (str): The URL to send the request to.
 
@@ -12,7 +15,7 @@ def get_request(url: str):
         requests.Response or None: The response object if successful, None if an error occurs.
     """
     try:
-        response = requests.get(url)
+        response = get_http_client().get(url)
         response.raise_for_status()
 
         print(f"Successfully visited {url}")
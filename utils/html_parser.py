@@ -0,0 +1,170 @@
+import importlib.util
+import re
+from typing import Dict, List, Mapping, Optional, Union
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+HTML_PARSER_BACKENDS = ("lxml", "html.parser", "selectolax")
+
+CHARSET_PATTERN = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+
+
+def get_default_backend() -> str:
+    """
+    Returns the fastest backend which is installed, lxml or the built-in html.parser.
+
+    Returns:
+        str: The backend name.
+    """
+    return "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+
+_backend = get_default_backend()
+
+
+def set_html_parser(backend: Optional[str]) -> None:
+    """
+    Selects the backend used by parse_html in the whole process.
+
+    Args:
+        backend (str, optional): One of HTML_PARSER_BACKENDS, None for the fastest installed one.
+
+    Raises:
+        ValueError: If the backend is not supported or its package is not installed.
+    """
+    global _backend
+    if backend is None:
+        _backend = get_default_backend()
+        return
+
+    if backend not in HTML_PARSER_BACKENDS:
+        raise ValueError(f"Unsupported HTML parser {backend}, use one of {', '.join(HTML_PARSER_BACKENDS)}")
+    if backend != "html.parser" and not importlib.util.find_spec(backend):
+        raise ValueError(f"HTML parser {backend} is not installed, run 'pip install {backend}'")
+    _backend = backend
+
+
+def get_html_parser() -> str:
+    """
+    Returns the backend used by parse_html.
+
+    Returns:
+        str: The backend name.
+    """
+    return _backend
+
+
+class Strainer:
+    """
+    Part of a document worth parsing, the tags with a name and attributes together with their contents.
+
+    Attribute values match like in BeautifulSoup, "class" matches one of the classes of a tag
+    and a list matches any of its values.
+
+    Attributes:
+        name (str): The tag name, None for any tag.
+        attrs (Dict[str, Union[str, List[str]]]): The required attribute values.
+    """
+
+    def __init__(self, name: Optional[str] = None, attrs: Optional[Dict[str, Union[str, List[str]]]] = None) -> None:
+        """
+        Initializes the Strainer.
+
+        Args:
+            name (str, optional): The tag name, None for any tag.
+            attrs (Dict[str, Union[str, List[str]]], optional): The required attribute values.
+        """
+        self.name = name
+        self.attrs = attrs or {}
+
+    def to_soup_strainer(self) -> SoupStrainer:
+        """
+        Builds the SoupStrainer for the BeautifulSoup backends.
+
+        Returns:
+            SoupStrainer: The strainer passed as parse_only.
+        """
+        return SoupStrainer(self.name, attrs=self.attrs)
+
+    def to_css(self) -> str:
+        """
+        Builds the CSS selector for the selectolax backend.
+
+        Returns:
+            str: The selector matching the same tags.
+        """
+        selectors = [self.name or ""]
+        for attribute, value in self.attrs.items():
+            values = value if isinstance(value, list) else [value]
+            if attribute == "class":
+                selectors = [f"{selector}.{item}" for selector in selectors for item in values]
+            else:
+                selectors = [f'{selector}[{attribute}="{item}"]' for selector in selectors for item in values]
+        return ", ".join(selectors)
+
+
+def get_charset(headers: Mapping[str, str]) -> Optional[str]:
+    """
+    Reads the charset declared in the Content-Type header.
+
+    Args:
+        headers (Mapping[str, str]): The response headers.
+
+    Returns:
+        Optional[str]: The charset, None if the header does not declare it.
+    """
+    match = CHARSET_PATTERN.search(headers.get("Content-Type", ""))
+    return match.group(1) if match else None
+
+
+def parse_html(
+        markup: Union[str, bytes],
+        parse_only: Optional[Strainer] = None,
+        encoding: Optional[str] = None,
+) -> BeautifulSoup:
+    """
+    Parses an HTML document with the selected backend.
+
+    With a strainer only the matching tags are kept, which saves building a tree of the
+    whole page. The selectolax backend finds them with a CSS selector and builds a
+    BeautifulSoup tree of just those tags, without a strainer it parses like lxml.
+
+    Args:
+        markup (Union[str, bytes]): The document, preferably the raw response bytes.
+        parse_only (Strainer, optional): The part of the document to parse.
+        encoding (str, optional): The encoding of byte markup, detected if not given.
+
+    Returns:
+        BeautifulSoup: The parsed document.
+    """
+    backend = _backend
+    tree_builder = "html.parser" if backend == "html.parser" else get_default_backend()
+
+    if backend == "selectolax" and parse_only is not None:
+        from selectolax.lexbor import LexborHTMLParser
+
+        if isinstance(markup, bytes) and encoding:
+            markup = markup.decode(encoding, errors="replace")
+        nodes = LexborHTMLParser(markup).css(parse_only.to_css())
+        return BeautifulSoup("".join(node.html for node in nodes), tree_builder)
+
+    return BeautifulSoup(
+        markup,
+        tree_builder,
+        parse_only=parse_only.to_soup_strainer() if parse_only is not None else None,
+        from_encoding=encoding if isinstance(markup, bytes) else None,
+    )
+
+
+def parse_response(response, parse_only: Optional[Strainer] = None) -> BeautifulSoup:
+    """
+    Parses the raw body of a requests or httpx response, using the charset from its headers.
+
+    Args:
+        response (Union[requests.Response, httpx.Response]): The response.
+        parse_only (Strainer, optional): The part of the document to parse.
+
+    Returns:
+        BeautifulSoup: The parsed document.
+    """
+    return parse_html(response.content, parse_only, get_charset(response.headers))
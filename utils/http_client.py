@@ -0,0 +1,193 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Responses worth retrying, everything else is returned to the caller as is
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 30
+MAX_RETRIES = 3
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+
+
+def get_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Reads the Retry-After header, given either in seconds or as an HTTP date.
+
+    Args:
+        headers (Mapping[str, str]): The response headers.
+
+    Returns:
+        Optional[float]: The number of seconds to wait, None if the header is missing or invalid.
+    """
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def get_backoff_delay(attempt: int, base: float = BACKOFF_BASE, maximum: float = BACKOFF_MAX) -> float:
+    """
+    Calculates an exponential backoff delay with full jitter.
+
+    Args:
+        attempt (int): The number of the failed attempt, starting from 0.
+        base (float): The delay of the first retry.
+        maximum (float): The upper limit of the delay.
+
+    Returns:
+        float: The number of seconds to wait before the next attempt.
+    """
+    return random.uniform(0, min(maximum, base * 2 ** attempt))
+
+
+class HttpClient:
+    """
+    Process-wide HTTP client keeping one pooled session per domain.
+
+    Requests have connect and read timeouts, and responses with a status from
+    RETRY_STATUS_CODES as well as connection errors are retried with exponential
+    backoff, honouring the Retry-After header.
+    """
+
+    def __init__(
+            self,
+            pool_maxsize: int = 10,
+            connect_timeout: float = CONNECT_TIMEOUT,
+            read_timeout: float = READ_TIMEOUT,
+            max_retries: int = MAX_RETRIES,
+    ) -> None:
+        """
+        Initializes the HttpClient.
+
+        Args:
+            pool_maxsize (int): The maximum number of connections kept open to one domain.
+            connect_timeout (float): Seconds to wait for a connection.
+            read_timeout (float): Seconds to wait for data from the server.
+            max_retries (int): The number of retries after the first attempt.
+        """
+        self.pool_maxsize = pool_maxsize
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def get_session(self, url: str) -> requests.Session:
+        """
+        Returns the session for the domain of the given URL, creating it on first use.
+
+        Args:
+            url (str): The requested URL.
+
+        Returns:
+            requests.Session: The session with a bounded connection pool.
+        """
+        domain = urlparse(url).netloc
+        with self._lock:
+            session = self._sessions.get(domain)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize, pool_block=True)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[domain] = session
+            return session
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """
+        Sends a GET request, retrying on connection errors, 429 and 5xx responses.
+
+        Args:
+            url (str): The URL to send the request to.
+            **kwargs: Additional arguments passed to requests.Session.get.
+
+        Returns:
+            requests.Response: The last received response.
+
+        Raises:
+            requests.RequestException: If no response was received after all retries.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        session = self.get_session(url)
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = session.get(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = get_backoff_delay(attempt)
+                print(f"Request to {url} failed ({e}), retrying in {delay:.1f}s")
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                    return response
+                retry_after = get_retry_after(response.headers)
+                delay = min(retry_after, BACKOFF_MAX) if retry_after is not None else get_backoff_delay(attempt)
+                print(f"Received {response.status_code} from {url}, retrying in {delay:.1f}s")
+                response.close()
+
+            time.sleep(delay)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """
+        Sends a POST request with the client timeouts, without retries as the request may not be idempotent.
+
+        Args:
+            url (str): The URL to send the request to.
+            **kwargs: Additional arguments passed to requests.Session.post.
+
+        Returns:
+            requests.Response: The received response.
+
+        Raises:
+            requests.RequestException: If no response was received.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        return self.get_session(url).post(url, **kwargs)
+
+    def close(self) -> None:
+        """Closes all sessions and their connections."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+_http_client: Optional[HttpClient] = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """
+    Returns the HttpClient shared by the whole process.
+
+    Returns:
+        HttpClient: The shared HTTP client.
+    """
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = HttpClient()
+        return _http_client
@@ -0,0 +1,56 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class LRUCache:
+    """
+    Thread-safe dictionary keeping at most `maxsize` least recently used entries.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        """
+        Initializes an empty LRUCache.
+
+        Args:
+            maxsize (int): The maximum number of entries.
+        """
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Returns the value of a key, marking it as recently used.
+
+        Args:
+            key (Hashable): The key.
+            default (Any, optional): The value returned if the key is missing.
+
+        Returns:
+            Any: The cached value or the default.
+        """
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Stores a value, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key (Hashable): The key.
+            value (Any): The value.
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all entries."""
+        with self._lock:
+            self._data.clear()
@@ -0,0 +1,294 @@
+import hashlib
+import mmap
+import os
+import sqlite3
+import threading
+from typing import Iterable, Optional, Iterator
+
+SEEN_URLS_DB = "seen_urls.db"
+SEEN_URLS_BLOOM = "seen_urls.bloom"
+URLS_TO_SKIP_FILE = "urls_to_skip.txt"
+
+# Bloom filter sizing, 10 bits per URL with 7 hashes gives about 1% false positives
+BLOOM_BITS_PER_URL = 10
+BLOOM_HASHES = 7
+BLOOM_MIN_BITS = 2 ** 20
+# The bloom file starts with the number of URLs it was built for
+BLOOM_HEADER_SIZE = 8
+
+
+def hash_url(url: str) -> int:
+    """
+    Hashes a URL into the 64-bit key stored in the database.
+
+    Args:
+        url (str): The URL to hash.
+
+    Returns:
+        int: A signed 64-bit hash, fitting an SQLite INTEGER.
+    """
+    digest = hashlib.blake2b(url.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+class BloomFilter:
+    """
+    Bloom filter kept in a memory-mapped file, answering most "not seen" lookups without touching the database.
+    """
+
+    def __init__(self, path: str, size_bits: int) -> None:
+        """
+        Opens the bloom filter file, creating an empty filter if it does not exist.
+
+        Args:
+            path (str): The path of the bloom filter file.
+            size_bits (int): The number of bits of a newly created filter.
+        """
+        self.path = path
+        if not os.path.exists(path):
+            with open(path, "wb") as file:
+                file.truncate(BLOOM_HEADER_SIZE + size_bits // 8)
+
+        self._file = open(path, "r+b")
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        self.size_bits = (len(self._mmap) - BLOOM_HEADER_SIZE) * 8
+
+    @property
+    def count(self) -> int:
+        """The number of URLs the filter was built for."""
+        return int.from_bytes(self._mmap[:BLOOM_HEADER_SIZE], "big")
+
+    @count.setter
+    def count(self, value: int) -> None:
+        self._mmap[:BLOOM_HEADER_SIZE] = value.to_bytes(BLOOM_HEADER_SIZE, "big")
+
+    @property
+    def capacity(self) -> int:
+        """The number of URLs the filter holds with the expected false positive rate."""
+        return self.size_bits // BLOOM_BITS_PER_URL
+
+    def _positions(self, key: int) -> Iterator[int]:
+        # Double hashing, both halves of the 64-bit key give all positions
+        key &= 0xFFFFFFFFFFFFFFFF
+        first, second = key & 0xFFFFFFFF, (key >> 32) | 1
+        for i in range(BLOOM_HASHES):
+            yield (first + i * second) % self.size_bits
+
+    def add(self, key: int) -> None:
+        """
+        Adds a hashed URL to the filter.
+
+        Args:
+            key (int): The hash returned by hash_url.
+        """
+        for position in self._positions(key):
+            index = BLOOM_HEADER_SIZE + position // 8
+            self._mmap[index] |= 1 << (position % 8)
+
+    def __contains__(self, key: int) -> bool:
+        for position in self._positions(key):
+            if not self._mmap[BLOOM_HEADER_SIZE + position // 8] & (1 << (position % 8)):
+                return False
+        return True
+
+    def flush(self) -> None:
+        """Writes changed pages of the filter to disk."""
+        self._mmap.flush()
+
+    def close(self) -> None:
+        """Closes the memory map and the file."""
+        self._mmap.close()
+        self._file.close()
+
+
+class SeenUrlStore:
+    """
+    Persistent set of offer URLs which were already scraped.
+
+    URLs are kept as 64-bit hashes in an SQLite table, so membership is a primary key
+    lookup, with a memory-mapped bloom filter in front for fast negatives. Nothing is
+    read until the first lookup. URLs added to urls_to_skip.txt by hand are imported
+    incrementally, only the lines appended since the previous run are read. Once
+    closed, the store is not reopened: lookups return False and adding raises.
+    """
+
+    def __init__(
+            self,
+            db_path: str = SEEN_URLS_DB,
+            bloom_path: str = SEEN_URLS_BLOOM,
+            urls_to_skip_path: str = URLS_TO_SKIP_FILE,
+    ) -> None:
+        """
+        Initializes the SeenUrlStore, the files are opened lazily.
+
+        Args:
+            db_path (str): The path of the SQLite database.
+            bloom_path (str): The path of the bloom filter file.
+            urls_to_skip_path (str): The path of the manually maintained urls_to_skip.txt file.
+        """
+        self.db_path = db_path
+        self.bloom_path = bloom_path
+        self.urls_to_skip_path = urls_to_skip_path
+        self._connection: Optional[sqlite3.Connection] = None
+        self._bloom: Optional[BloomFilter] = None
+        self._closed = False
+        self._lock = threading.RLock()
+
+    def _open(self) -> None:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("SeenUrlStore is closed")
+            if self._connection is not None:
+                return
+
+            self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._connection.executescript("""
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                CREATE TABLE IF NOT EXISTS seen_urls (hash INTEGER PRIMARY KEY);
+                CREATE TABLE IF NOT EXISTS seen_urls_meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+            """)
+
+            self._bloom = BloomFilter(self.bloom_path, self._bloom_size(self._get_meta("count")))
+            if self._bloom.count != self._get_meta("count"):
+                # The bloom file is missing or out of date, e.g. after a crash
+                self._rebuild_bloom()
+
+            self._import_urls_to_skip()
+
+    def _get_meta(self, key: str) -> int:
+        row = self._connection.execute("SELECT value FROM seen_urls_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else 0
+
+    def _set_meta(self, key: str, value: int) -> None:
+        self._connection.execute(
+            "INSERT INTO seen_urls_meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    @staticmethod
+    def _bloom_size(count: int) -> int:
+        size_bits = BLOOM_MIN_BITS
+        while size_bits < count * BLOOM_BITS_PER_URL * 2:
+            size_bits *= 2
+        return size_bits
+
+    def _rebuild_bloom(self) -> None:
+        count = self._get_meta("count")
+        if self._bloom is not None:
+            self._bloom.close()
+        if os.path.exists(self.bloom_path):
+            os.remove(self.bloom_path)
+
+        self._bloom = BloomFilter(self.bloom_path, self._bloom_size(count))
+        for (key,) in self._connection.execute("SELECT hash FROM seen_urls"):
+            self._bloom.add(key)
+        self._bloom.count = count
+        self._bloom.flush()
+
+    def _import_urls_to_skip(self) -> None:
+        if not os.path.exists(self.urls_to_skip_path):
+            return
+
+        offset = self._get_meta("urls_to_skip_offset")
+        if os.path.getsize(self.urls_to_skip_path) < offset:
+            # The file was replaced, import it again from the start
+            offset = 0
+
+        with open(self.urls_to_skip_path, "rb") as file:
+            file.seek(offset)
+            urls = (line.decode("utf-8").strip() for line in file)
+            self.add_many(url for url in urls if url)
+            offset = file.tell()
+
+        with self._connection:
+            self._set_meta("urls_to_skip_offset", offset)
+
+    def __contains__(self, url: str) -> bool:
+        """
+        Checks if the URL was already seen.
+
+        Args:
+            url (str): The offer URL.
+
+        Returns:
+            bool: True if the URL was seen, False otherwise, also once the store is closed.
+        """
+        key = hash_url(url)
+        with self._lock:
+            # Scraper threads may still look up URLs while the run closes the store
+            if self._closed:
+                return False
+            self._open()
+            if key not in self._bloom:
+                return False
+
+            return self._connection.execute("SELECT 1 FROM seen_urls WHERE hash = ?", (key,)).fetchone() is not None
+
+    def add_many(self, urls: Iterable[str]) -> int:
+        """
+        Adds URLs in a single transaction.
+
+        Bloom filter bits are set before the transaction commits, so a crash can only
+        cause false positives, which are then resolved by the database.
+
+        Args:
+            urls (Iterable[str]): The offer URLs to add.
+
+        Returns:
+            int: The number of URLs which were not seen before.
+
+        Raises:
+            RuntimeError: If the store is closed.
+        """
+        keys = [hash_url(url) for url in urls]
+        with self._lock:
+            self._open()
+            if not keys:
+                return 0
+
+            for key in keys:
+                self._bloom.add(key)
+            self._bloom.flush()
+
+            with self._connection:
+                before = self._connection.total_changes
+                self._connection.executemany(
+                    "INSERT OR IGNORE INTO seen_urls (hash) VALUES (?)", ((key,) for key in keys)
+                )
+                added = self._connection.total_changes - before
+                count = self._get_meta("count") + added
+                self._set_meta("count", count)
+
+            self._bloom.count = count
+            return added
+
+    def compact(self) -> None:
+        """
+        Rebuilds the bloom filter at a size matching the number of URLs and vacuums the database.
+        """
+        with self._lock:
+            self._open()
+            self._compact()
+
+    def _compact(self) -> None:
+        self._rebuild_bloom()
+        self._connection.execute("VACUUM")
+
+    def close(self) -> None:
+        """
+        Closes the store, compacting it first if the bloom filter outgrew its capacity.
+        """
+        with self._lock:
+            self._closed = True
+            if self._connection is None:
+                return
+
+            if self._bloom.count > self._bloom.capacity:
+                self._compact()
+
+            self._bloom.close()
+            self._connection.close()
+            self._bloom = None
+            self._connection = None
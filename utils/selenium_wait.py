@@ -0,0 +1,199 @@
+from collections import deque
+from typing import Optional
+
+# Milliseconds without DOM mutations after which the page is considered settled
+DOM_SETTLE_MS = 250
+# Milliseconds without pending fetch/XHR requests after which the network is considered idle
+NETWORK_IDLE_MS = 250
+
+# Defines page functions for the scripts of Selenium strategies:
+# - waitForDomSettle(timeout, settle) resolves with the milliseconds until the last DOM
+#   mutation once no mutation happened for `settle` ms, or with null if nothing changed
+#   within `timeout` ms
+# - trackRequests() starts counting pending fetch and XMLHttpRequest calls
+# - waitForNetworkIdle(timeout, idle) resolves with true once no request was pending for
+#   `idle` ms, or with false after `timeout` ms
+# - waitForElement(selector, timeout, settle) resolves with the first element matching
+#   the selector, or with null once the DOM settled without it or after `timeout` ms
+WAIT_FUNCTIONS_JS = """
+function waitForDomSettle(timeout, settle) {
+    return new Promise(resolve => {
+        const start = performance.now();
+        let changedAfter = null;
+        let settleTimer = null;
+        const observer = new MutationObserver(() => {
+            changedAfter = performance.now() - start;
+            clearTimeout(settleTimer);
+            settleTimer = setTimeout(finish, settle);
+        });
+        const timeoutTimer = setTimeout(finish, timeout);
+        function finish() {
+            observer.disconnect();
+            clearTimeout(timeoutTimer);
+            clearTimeout(settleTimer);
+            resolve(changedAfter);
+        }
+        observer.observe(document.body, {childList: true, subtree: true});
+    });
+}
+
+function trackRequests() {
+    if (window.jobScraperRequests !== undefined) {
+        return;
+    }
+    window.jobScraperRequests = 0;
+    const originalFetch = window.fetch;
+    window.fetch = function () {
+        window.jobScraperRequests++;
+        return originalFetch.apply(this, arguments).finally(() => window.jobScraperRequests--);
+    };
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        window.jobScraperRequests++;
+        this.addEventListener("loadend", () => window.jobScraperRequests--, {once: true});
+        return originalSend.apply(this, arguments);
+    };
+}
+
+function waitForNetworkIdle(timeout, idle) {
+    return new Promise(resolve => {
+        const start = performance.now();
+        let idleSince = null;
+        const timer = setInterval(() => {
+            const now = performance.now();
+            if (window.jobScraperRequests > 0) {
+                idleSince = null;
+            } else if (idleSince === null) {
+                idleSince = now;
+            }
+            if (idleSince !== null && now - idleSince >= idle) {
+                clearInterval(timer);
+                resolve(true);
+            } else if (now - start >= timeout) {
+                clearInterval(timer);
+                resolve(false);
+            }
+        }, 50);
+    });
+}
+
+function waitForElement(selector, timeout, settle) {
+    return new Promise(resolve => {
+        let settleTimer = null;
+        const observer = new MutationObserver(() => {
+            if (!check()) {
+                clearTimeout(settleTimer);
+                settleTimer = setTimeout(() => finish(null), settle);
+            }
+        });
+        const timeoutTimer = setTimeout(() => finish(null), timeout);
+        function check() {
+            const element = document.querySelector(selector);
+            if (element) {
+                finish(element);
+            }
+            return element;
+        }
+        function finish(element) {
+            observer.disconnect();
+            clearTimeout(timeoutTimer);
+            clearTimeout(settleTimer);
+            resolve(element);
+        }
+        if (!check()) {
+            observer.observe(document.body, {childList: true, subtree: true, attributes: true});
+            // A page which is already loaded and does not change will not get the element
+            if (document.readyState === "complete") {
+                settleTimer = setTimeout(() => finish(null), settle);
+            }
+        }
+    });
+}
+"""
+
+CLICK_IF_PRESENT_SCRIPT = WAIT_FUNCTIONS_JS + """
+const done = arguments[arguments.length - 1];
+waitForElement(arguments[0], arguments[1], arguments[2]).then(element => {
+    if (element) {
+        element.click();
+    }
+    done(element !== null);
+});
+"""
+
+
+class AdaptiveTimeout:
+    """
+    Timeout of a repeated wait, derived from how long the recent waits of the same kind took.
+
+    The timeout is `factor` times the slowest of the last `window` observed durations,
+    kept between `minimum` and `maximum`, so a fast site is not waited on for as long
+    as a slow one.
+    """
+
+    def __init__(
+            self,
+            initial: float,
+            minimum: float,
+            maximum: float,
+            factor: float = 3.0,
+            window: int = 5,
+    ) -> None:
+        """
+        Initializes the AdaptiveTimeout.
+
+        Args:
+            initial (float): The timeout used before any duration is observed.
+            minimum (float): The lower limit of the timeout.
+            maximum (float): The upper limit of the timeout.
+            factor (float): The multiplier of the slowest observed duration.
+            window (int): The number of recent durations taken into account.
+        """
+        self.initial = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.factor = factor
+        self._durations: deque = deque(maxlen=window)
+
+    @property
+    def value(self) -> float:
+        """
+        Returns the current timeout.
+
+        Returns:
+            float: The timeout, in the unit of the observed durations.
+        """
+        if not self._durations:
+            return self.initial
+        return min(max(self.factor * max(self._durations), self.minimum), self.maximum)
+
+    def observe(self, duration: Optional[float]) -> None:
+        """
+        Records how long a successful wait took, waits which timed out are not recorded.
+
+        Args:
+            duration (float, optional): The duration of the wait, None if it timed out.
+        """
+        if duration is not None:
+            self._durations.append(duration)
+
+
+def click_if_present(driver, selector: str, timeout: float = 3000, settle: float = DOM_SETTLE_MS) -> bool:
+    """
+    Clicks an element as soon as it appears, without waiting for the full timeout once
+    the page is loaded and its DOM stopped changing without the element.
+
+    Args:
+        driver: Selenium WebDriver instance.
+        selector (str): The CSS selector of the element.
+        timeout (float): The maximum time to wait in milliseconds.
+        settle (float): Milliseconds without DOM changes after which the element is considered absent.
+
+    Returns:
+        bool: True if the element was found and clicked, False otherwise.
+    """
+    try:
+        return driver.execute_async_script(CLICK_IF_PRESENT_SCRIPT, selector, timeout, settle)
+    except Exception as e:
+        print(f"Failed to click {selector}: {e}")
+        return False
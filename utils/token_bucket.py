@@ -0,0 +1,47 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    The bucket holds up to `capacity` tokens and refills at `rate` tokens per second,
+    so bursts up to the capacity go through immediately and longer runs are limited
+    to the refill rate.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """
+        Initializes a full TokenBucket.
+
+        Args:
+            rate (float): The number of tokens added per second.
+            capacity (float): The maximum number of tokens.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def acquire(self, tokens: float = 1) -> None:
+        """
+        Takes tokens from the bucket, sleeping until enough tokens are available.
+
+        Args:
+            tokens (float): The number of tokens to take.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            # A negative balance is the time this caller has to wait for
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0
+
+        if delay:
+            time.sleep(delay)